@@ -0,0 +1,57 @@
+"""Time decoding datatable pages with each JSON decoder ApiConfig.json_decoder accepts.
+
+Pages are built from the datatable factories of the test suite, with their columns and
+as many generated rows as asked, and encoded once. `requests` is the previous path,
+which decodes the bytes to text before the standard library parses it. Decoders that
+are not installed are skipped. No requests are made.
+
+    python benchmarks/json_decoders.py [--rows 1000 10000] [--repeat 5]
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from nasdaqdatalink.utils.json_decoder import JsonDecoder  # NOQA
+from test.factories.datatable_data import DatatableDataFactory  # NOQA
+from test.factories.datatable_meta import DatatableMetaFactory  # NOQA
+
+
+def page(rows):
+    data = [['2015-07-%02d' % (row % 28 + 1), 'TICKER%d' % (row % 500), row * 1.0625]
+            for row in range(rows)]
+    return json.dumps({'datatable': DatatableDataFactory.build(data=data),
+                       'meta': DatatableMetaFactory.build()}).encode('utf-8')
+
+
+def decoders():
+    found = [('requests', lambda content: json.loads(content.decode('utf-8')))]
+    for name in JsonDecoder.DECODERS:
+        if JsonDecoder._module(name) is not None:
+            found.append((name, JsonDecoder.decoder(name)))
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print('%8s %10s %10s %12s %8s' % ('rows', 'decoder', 'MB', 'time (ms)', 'speedup'))
+    for rows in args.rows:
+        content = page(rows)
+        baseline = None
+        for name, decoder in decoders():
+            seconds = min(timeit.repeat(lambda: decoder(content),
+                                        number=1, repeat=args.repeat))
+            baseline = baseline or seconds
+            print('%8d %10s %10.2f %12.2f %7.1fx' % (rows, name, len(content) / 1e6,
+                                                     seconds * 1000, baseline / seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""Time joining many datasets the way nasdaqdatalink.get([...]) does.
+
+Compares the single concat used by MergedDataset.merge_data against the previous
+approach of one outer pd.merge per dataset, on the same per dataset DataFrames.
+No requests are made, the dataset data is generated locally.
+
+    python benchmarks/merge_datasets.py [--rows 2500] [--codes 10 100 1000]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from nasdaqdatalink.model.data import Data  # NOQA
+from nasdaqdatalink.model.data_list import DataList  # NOQA
+from nasdaqdatalink.model.merged_dataset import MergedDataset  # NOQA
+
+
+def data_frames(codes, rows):
+    dates = pd.bdate_range('2000-01-03', periods=rows).strftime('%Y-%m-%d').tolist()
+    frames = []
+    for index in range(codes):
+        # shift each dataset so the date ranges only partly overlap
+        values = [[date, float(row), float(row + index)]
+                  for row, date in enumerate(dates[index % 50:])]
+        data_frame = DataList(Data, values,
+                              {'column_names': ['Date', 'Open', 'Close']}).to_pandas()
+        code = 'BENCH/CODE%d' % index
+        data_frame.rename(columns=lambda x: code + ' - ' + x, inplace=True)
+        frames.append(data_frame)
+    return frames
+
+
+def pairwise_merge(frames):
+    merged_data_frame = pd.DataFrame()
+    for data_frame in frames:
+        merged_data_frame = pd.merge(merged_data_frame, data_frame,
+                                     right_index=True, left_index=True, how='outer')
+    return merged_data_frame
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=2500)
+    parser.add_argument('--codes', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print('%6s %14s %14s' % ('codes', 'pairwise (s)', 'single (s)'))
+    for codes in args.codes:
+        frames = data_frames(codes, args.rows)
+
+        pairwise = min(timeit.repeat(lambda: pairwise_merge(frames),
+                                     number=1, repeat=args.repeat))
+        single = min(timeit.repeat(lambda: MergedDataset._join_data_frames(frames),
+                                   number=1, repeat=args.repeat))
+        print('%6d %14.3f %14.3f' % (codes, pairwise, single))
+
+
+if __name__ == '__main__':
+    main()
@@ -11,10 +11,11 @@ from .model.point_in_time import PointInTime
 from .model.data import Data
 from .model.merged_dataset import MergedDataset
 from .get import get
-from .bulkdownload import bulkdownload
-from .export_table import export_table
-from .get_table import get_table
-from .get_point_in_time import get_point_in_time
+from .bulkdownload import bulkdownload, load_bulkdownload, remove_bulkdownload
+from .export_table import export_table, export_table_async
+from .get_table import get_table, iter_table
+from .mirror import mirror_table, sync_table, remove_mirror
+from .get_point_in_time import get_point_in_time, iter_point_in_time
 
 
 read_key()
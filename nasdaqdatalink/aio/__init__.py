@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+
+from .connection import AsyncConnection, close
+from .get import get
+from .get_table import get_table, iter_table
+from .get_point_in_time import get_point_in_time, iter_point_in_time
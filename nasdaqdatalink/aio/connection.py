@@ -0,0 +1,142 @@
+import asyncio
+import weakref
+
+import pandas
+
+from nasdaqdatalink.api_config import ApiConfig
+from nasdaqdatalink.connection import Connection
+from nasdaqdatalink.errors.data_link_error import DataLinkError
+from nasdaqdatalink.message import Message
+from nasdaqdatalink.utils.json_decoder import JsonDecoder
+from nasdaqdatalink.utils.rate_limiter import RateLimiter
+from nasdaqdatalink.utils.response_cache import ResponseCache
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+class AsyncConnection:
+    # aiohttp sessions can only be used on the event loop they were created on
+    _sessions = weakref.WeakKeyDictionary()
+
+    @classmethod
+    async def request(cls, http_verb, url, **options):
+        # shares the response cache of the synchronous client, whose entries are files
+        # read and written off the event loop
+        loop = asyncio.get_event_loop()
+        cache = await loop.run_in_executor(None, ResponseCache.from_config)
+        if cache is not None:
+            key = cache.key(http_verb, url, options)
+            response_data = await loop.run_in_executor(None, cache.get, key, url)
+            if response_data is not None:
+                return response_data
+
+        abs_url, request_options = Connection.build_request(url, **options)
+        response_data = await cls.execute_request(http_verb, abs_url, **request_options)
+        if cache is not None:
+            await loop.run_in_executor(None, cache.set, key, url, response_data)
+        return response_data
+
+    @classmethod
+    async def execute_request(cls, http_verb, url, **options):
+        session = cls.get_session()
+
+        if 'params' in options:
+            options['params'] = cls._query_params(options['params'])
+        if not ApiConfig.verify_ssl:
+            options['ssl'] = False
+
+        # shares the rate limit of the synchronous client, which waits out 429 responses;
+        # its state may sit behind a file lock, so it is updated off the event loop
+        limiter = RateLimiter.from_config()
+        loop = asyncio.get_event_loop()
+        attempt = 0
+        while True:
+            if limiter is not None:
+                await asyncio.sleep(await loop.run_in_executor(None, limiter.reserve))
+            headers = {}
+            status = None
+            try:
+                async with session.request(http_verb.upper(), url, **options) as response:
+                    status = response.status
+                    headers = response.headers
+                    body = await response.read()
+            except aiohttp.ClientError:
+                if not cls._can_retry(attempt):
+                    raise
+            else:
+                if limiter is not None:
+                    await loop.run_in_executor(None, limiter.update, status, headers)
+                if 200 <= status < 300:
+                    return cls.parse(status, body)
+                if status not in ApiConfig.retry_status_codes or not cls._can_retry(attempt):
+                    http_body = body.decode('utf-8', 'replace')
+                    Connection.raise_api_error(
+                        cls.parse(status, body), status, http_body, headers)
+
+            attempt += 1
+            if limiter is None or status != 429:
+                await asyncio.sleep(cls._backoff(attempt, headers))
+
+    @classmethod
+    def get_session(cls):
+        if aiohttp is None:
+            raise ImportError(Message.ERROR_AIOHTTP_NOT_INSTALLED)
+
+        loop = asyncio.get_event_loop()
+        session = cls._sessions.get(loop)
+        if session is None or session.closed:
+            # the connector both pools keep-alive connections and bounds
+            # how many requests are in flight at once
+            connector = aiohttp.TCPConnector(limit=ApiConfig.pool_maxsize)
+            session = aiohttp.ClientSession(connector=connector, trust_env=True)
+            cls._sessions[loop] = session
+        return session
+
+    @classmethod
+    async def close(cls):
+        session = cls._sessions.pop(asyncio.get_event_loop(), None)
+        if session is not None:
+            await session.close()
+
+    @classmethod
+    def parse(cls, status, body):
+        try:
+            return JsonDecoder.decode(body)
+        except ValueError:
+            raise DataLinkError(http_status=status, http_body=body.decode('utf-8', 'replace'))
+
+    @classmethod
+    def _can_retry(cls, attempt):
+        return ApiConfig.use_retries and attempt < ApiConfig.number_of_retries
+
+    @classmethod
+    def _backoff(cls, attempt, headers):
+        # same schedule urllib3 uses for the synchronous client, including
+        # respecting any Retry-After the server sent back
+        retry_after = headers.get('Retry-After')
+        if retry_after is not None and retry_after.isdigit():
+            return int(retry_after)
+        if attempt <= 1:
+            return 0
+        backoff = ApiConfig.retry_backoff_factor * (2 ** (attempt - 1))
+        return min(ApiConfig.max_wait_between_retries, backoff)
+
+    @classmethod
+    def _query_params(cls, params):
+        # aiohttp only accepts scalar string values, expand lists the way requests does
+        query = []
+        for key, value in params.items():
+            if not isinstance(value, (list, tuple, pandas.Series)):
+                value = [value]
+            for item in value:
+                if item is not None:
+                    query.append((key, str(item)))
+        return query
+
+
+async def close():
+    """Close the HTTP session used by the current event loop."""
+    await AsyncConnection.close()
@@ -0,0 +1,109 @@
+import asyncio
+
+from six import string_types
+
+from nasdaqdatalink.api_config import ApiConfig
+from nasdaqdatalink.errors.data_link_error import (
+    InvalidRequestError, NotFoundError, ColumnNotFound)
+from nasdaqdatalink.get import (
+    _convert_params_to_v3, _parse_dataset_code, _build_merged_dataset_args)
+from nasdaqdatalink.message import Message
+from nasdaqdatalink.model.data import Data
+from nasdaqdatalink.model.dataset import Dataset
+from nasdaqdatalink.model.merged_dataset import MergedDataset
+from nasdaqdatalink.utils.api_key_util import ApiKeyUtil
+from nasdaqdatalink.utils.incremental_store import IncrementalStore
+from .connection import AsyncConnection
+
+
+async def get(dataset, **kwargs):
+    """Asynchronous version of :func:`nasdaqdatalink.get`, it takes the same arguments.
+    When a list of dataset codes is given up to `max_workers` datasets are fetched
+    concurrently, by default `ApiConfig.max_workers`.
+    """
+
+    _convert_params_to_v3(kwargs)
+
+    data_format = kwargs.pop('returns', 'pandas')
+    max_workers = kwargs.pop('max_workers', None) or ApiConfig.max_workers
+    incremental = kwargs.pop('incremental', False)
+    snapshot = kwargs.pop('snapshot', True)
+
+    ApiKeyUtil.init_api_key_from_args(kwargs)
+
+    if isinstance(dataset, string_types):
+        dataset_args = _parse_dataset_code(dataset)
+        if dataset_args['column_index'] is not None:
+            kwargs.update({'column_index': dataset_args['column_index']})
+        data = await _dataset_data(Dataset(dataset_args['code']),
+                                   params=kwargs, handle_column_not_found=True,
+                                   incremental=incremental, snapshot=snapshot)
+    elif isinstance(dataset, list):
+        merged_dataset = MergedDataset(_build_merged_dataset_args(dataset))
+        options = {'params': kwargs,
+                   'handle_not_found_error': True,
+                   'handle_column_not_found': True,
+                   'incremental': incremental,
+                   'snapshot': snapshot}
+        workers = asyncio.Semaphore(max_workers)
+
+        async def dataset_data(dataset_object):
+            async with workers:
+                return await _dataset_data(
+                    dataset_object,
+                    **merged_dataset.dataset_data_options(dataset_object, **options))
+        dataset_data_list = await asyncio.gather(
+            *[dataset_data(dataset_object)
+              for dataset_object in merged_dataset.__dataset_objects__()])
+        data = merged_dataset.merge_data(dataset_data_list, **options)
+    else:
+        raise InvalidRequestError(Message.ERROR_DATASET_FORMAT)
+
+    return data.to_format(data_format)
+
+
+async def _dataset_data(dataset, **options):
+    # mirrors Dataset.data
+    handle_not_found_error = options.pop('handle_not_found_error', False)
+    handle_column_not_found = options.pop('handle_column_not_found', False)
+    incremental = options.pop('incremental', False)
+    snapshot = options.pop('snapshot', True)
+    data_options = dataset.data_options(**options)
+    try:
+        # the store is queried off the event loop; column names missing from it would
+        # need a blocking metadata request, the API is requested instead
+        response_data = (await asyncio.get_event_loop().run_in_executor(
+            None, dataset.snapshot_response_data, data_options, False) if snapshot else None)
+        if response_data is not None:
+            return Data.all_from_response(response_data)
+        if incremental:
+            return await _incremental_data(data_options)
+        return Data.all_from_response(await _all_response_data(data_options))
+    except NotFoundError:
+        if handle_not_found_error:
+            return Dataset.empty_data()
+        raise
+    except ColumnNotFound:
+        if handle_column_not_found:
+            return Dataset.empty_data()
+        raise
+
+
+async def _incremental_data(options):
+    # mirrors Dataset._incremental_data, the stored history is read, merged and
+    # rewritten off the event loop
+    loop = asyncio.get_event_loop()
+    store = IncrementalStore.from_config()
+    plan, request_options = await loop.run_in_executor(None, store.prepare, options)
+    response_data = await loop.run_in_executor(
+        None, store.splice, plan, await _all_response_data(request_options))
+    if response_data is None:
+        plan, request_options = await loop.run_in_executor(None, store.prepare, options, True)
+        response_data = await loop.run_in_executor(
+            None, store.splice, plan, await _all_response_data(request_options))
+    return Data.all_from_response(response_data)
+
+
+async def _all_response_data(options):
+    http_verb, path, request_options = Data.all_request(**options)
+    return await AsyncConnection.request(http_verb, path, **request_options)
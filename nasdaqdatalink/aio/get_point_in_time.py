@@ -0,0 +1,38 @@
+from nasdaqdatalink.api_config import ApiConfig
+from nasdaqdatalink.get_point_in_time import build_point_in_time
+from nasdaqdatalink.model.data_mixin import DataMixin
+from .get_table import _iter_pages
+
+
+async def get_point_in_time(datatable_code, **options):
+    """Asynchronous version of :func:`nasdaqdatalink.get_point_in_time`,
+    it takes the same arguments.
+    """
+    point_in_time = build_point_in_time(datatable_code, options)
+    paginate = options.pop('paginate', None)
+    prefetch = int(options.pop('prefetch', 0))
+    pandas_options = DataMixin.pop_pandas_options(options)
+    data_format = options.pop('returns', 'pandas')
+
+    data = None
+    async for next_data in _iter_pages(point_in_time, options, paginate=paginate,
+                                       page_limit=ApiConfig.page_limit, prefetch=prefetch):
+        if data is None:
+            data = next_data
+        else:
+            data.extend(next_data)
+    return data.to_format(data_format, **pandas_options)
+
+
+async def iter_point_in_time(datatable_code, **options):
+    """Asynchronously yield one DataFrame per page of point in time data,
+    following every cursor.
+    """
+    point_in_time = build_point_in_time(datatable_code, options)
+    paginate = options.pop('paginate', True)
+    prefetch = int(options.pop('prefetch', 0))
+    pandas_options = DataMixin.pop_pandas_options(options)
+    data_format = options.pop('returns', 'pandas')
+    async for data in _iter_pages(point_in_time, options, paginate=paginate,
+                                  prefetch=prefetch):
+        yield data.to_format(data_format, **pandas_options)
@@ -0,0 +1,111 @@
+import asyncio
+import copy
+
+from nasdaqdatalink.api_config import ApiConfig
+from nasdaqdatalink.model.data import Data
+from nasdaqdatalink.model.data_mixin import DataMixin
+from nasdaqdatalink.model.datatable import Datatable
+from nasdaqdatalink.utils.pagination_util import Paginator
+from nasdaqdatalink.utils.table_mirror import TableMirror
+from .connection import AsyncConnection
+
+
+async def get_table(datatable_code, **options):
+    """Asynchronous version of :func:`nasdaqdatalink.get_table`, it takes the same arguments."""
+    paginate = options.pop('paginate', None)
+    prefetch = int(options.pop('prefetch', 0))
+    pandas_options = DataMixin.pop_pandas_options(options)
+    data_format = options.pop('returns', 'pandas')
+
+    # mirrors get_table, the mirror is read off the event loop
+    if options.pop('mirror', True) and paginate:
+        mirrored = await asyncio.get_event_loop().run_in_executor(
+            None, TableMirror.answer, datatable_code, options, data_format, pandas_options)
+        if mirrored is not None:
+            return mirrored
+
+    data = None
+    async for next_data in _iter_pages(Datatable(datatable_code), options, paginate=paginate,
+                                       page_limit=ApiConfig.page_limit, prefetch=prefetch):
+        if data is None:
+            data = next_data
+        else:
+            data.extend(next_data)
+    return data.to_format(data_format, **pandas_options)
+
+
+async def iter_table(datatable_code, **options):
+    """Asynchronously yield one DataFrame per page of a datatable, following every cursor."""
+    paginate = options.pop('paginate', True)
+    prefetch = int(options.pop('prefetch', 0))
+    pandas_options = DataMixin.pop_pandas_options(options)
+    data_format = options.pop('returns', 'pandas')
+    async for data in _iter_pages(Datatable(datatable_code), options, paginate=paginate,
+                                  prefetch=prefetch):
+        yield data.to_format(data_format, **pandas_options)
+
+
+async def _iter_pages(model, options, paginate=True, page_limit=None, prefetch=0):
+    # mirrors Paginator.__iter__, which decides when to stop following cursors
+    paginator = Paginator(model, options, paginate=paginate, page_limit=page_limit,
+                          prefetch=prefetch)
+    if paginator.prefetch > 0:
+        responses = _prefetched_responses(paginator)
+    else:
+        responses = _responses(paginator)
+
+    page_count = 0
+    try:
+        async for response_data in responses:
+            data = Data.page_from_response(response_data)
+            yield data
+
+            if not paginator.follow(page_count, data.meta['next_cursor_id']):
+                break
+
+            page_count = page_count + 1
+    finally:
+        await responses.aclose()
+
+
+async def _responses(paginator):
+    page_count = 0
+    while True:
+        next_options = copy.deepcopy(paginator.options)
+        request_type, path, request_options = Data.page_request(paginator.model,
+                                                                params=next_options)
+        response_data = await AsyncConnection.request(request_type, path, **request_options)
+        next_cursor_id = response_data['meta']['next_cursor_id']
+
+        yield response_data
+
+        if paginator.next_step(page_count, next_cursor_id) != paginator.NEXT_PAGE:
+            break
+
+        page_count = page_count + 1
+        paginator.options['qopts.cursor_id'] = next_cursor_id
+
+
+async def _prefetched_responses(paginator):
+    # the next pages are requested by a task while the caller handles the current one
+    pages = asyncio.Queue(maxsize=paginator.prefetch)
+
+    async def produce():
+        try:
+            async for response_data in _responses(paginator):
+                await pages.put((response_data, None))
+            await pages.put((Paginator._DONE, None))
+        except Exception as e:
+            await pages.put((None, e))
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            response_data, error = await pages.get()
+            if error is not None:
+                raise error
+            if response_data is Paginator._DONE:
+                break
+            yield response_data
+    finally:
+        producer.cancel()
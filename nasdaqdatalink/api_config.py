@@ -18,6 +18,78 @@ class ApiConfig:
     retry_status_codes = [429] + list(range(500, 512))
     verify_ssl = True
 
+    # client side limit of the requests made with each API key, shared by every thread:
+    # rate_limit requests per second in bursts of up to rate_limit_burst (by default
+    # rate_limit), and rate_limit_per_day requests per UTC day; None disables either
+    rate_limit = None
+    rate_limit_burst = None
+    rate_limit_per_day = None
+    # file through which the processes of a host share the rate limit and daily quota
+    # of a key; None keeps them in this process
+    rate_limit_file = None
+
+    # decoder of response bodies: auto (orjson or simdjson when installed, else the
+    # standard library), orjson, simdjson, json, or a function taking the body bytes
+    json_decoder = 'auto'
+
+    # sizing of the pooled HTTP session shared by every Connection request
+    pool_connections = 10
+    pool_maxsize = 10
+
+    # number of datasets requested at once by get() with a list of codes
+    max_workers = 1
+
+    # opt-in cache of decoded responses on disk, shared between processes
+    use_cache = False
+    cache_dir = os.path.join('~', '.nasdaq', 'cache')
+    cache_max_size = 1024 * 1024 * 1024  # bytes
+    cache_ttl = 60 * 60  # seconds, None never expires
+    # TTLs by endpoint, keyed on a regular expression searched in the request path;
+    # the first one that matches is used, otherwise cache_ttl
+    cache_endpoint_ttls = {'/metadata$': 24 * 60 * 60, '^databases': 24 * 60 * 60}
+
+    # opt-in sharing of one response between identical requests made by several
+    # threads at once
+    coalesce_requests = False
+
+    # process wide cache of dataset, database and datatable metadata
+    use_metadata_cache = False
+    metadata_cache_ttl = 60 * 60  # seconds, None never expires
+
+    # rows of the datasets fetched with get(..., incremental=True)
+    incremental_dir = os.path.join('~', '.nasdaq', 'incremental')
+    # days before the last stored date that are requested again, to pick up revisions
+    incremental_overlap_days = 7
+
+    # bulk downloads of at least download_segment_min_size bytes are requested in
+    # download_segments byte ranges at once when the server accepts ranges
+    download_segments = 4
+    download_segment_min_size = 32 * 1024 * 1024  # bytes
+    download_chunk_size = 1024 * 1024  # bytes
+    # downloads are verified against Content-MD5 or x-goog-hash when sent; set this to
+    # also treat an ETag of 32 hex digits as the MD5 of the content, which only holds
+    # for servers known to do so
+    download_verify_etag = False
+
+    # datatable exports are polled after export_poll_interval seconds, then at intervals
+    # growing by export_poll_backoff up to export_poll_max_interval, unless the server
+    # sends a Retry-After
+    export_poll_interval = 1  # seconds
+    export_poll_backoff = 2
+    export_poll_max_interval = 30  # seconds
+    # exports polled and downloaded at once by export_table_async
+    export_max_workers = 4
+
+    # bulk downloads loaded with nasdaqdatalink.load_bulkdownload; get() reads a store
+    # loaded within bulk_max_age instead of requesting the API
+    bulk_dir = os.path.join('~', '.nasdaq', 'bulk')
+    bulk_max_age = 24 * 60 * 60  # seconds
+
+    # datatables mirrored to Parquet with nasdaqdatalink.mirror_table; get_table reads
+    # a mirror synced within mirror_max_age instead of requesting the API
+    mirror_dir = os.path.join('~', '.nasdaq', 'mirror')
+    mirror_max_age = 24 * 60 * 60  # seconds
+
 
 def create_file(config_filename):
     # Create the file as well as the parent dir if needed.
@@ -1,5 +1,6 @@
 from nasdaqdatalink.errors.data_link_error import InvalidRequestError
 from .utils.api_key_util import ApiKeyUtil
+from .utils.bulk_store import BulkStore
 from .model.database import Database
 from .message import Message
 
@@ -12,6 +13,8 @@ def bulkdownload(database, **kwargs):
     :param str api_key: Most databases require api_key for bulk download
     :param str download_type: 'partial' or 'complete'. \
     See: https://docs.data.nasdaq.com/docs
+    :param bool load: Load the downloaded file with `load_bulkdownload` so `get` \
+    reads the database locally. Default: `False`
     """
 
     # discourage users from using authtoken
@@ -21,4 +24,28 @@ def bulkdownload(database, **kwargs):
     ApiKeyUtil.init_api_key_from_args(kwargs)
 
     filename = kwargs.pop('filename', '.')
-    return Database(database).bulk_download_to_file(filename, params=kwargs)
+    load = kwargs.pop('load', False)
+    file_path = Database(database).bulk_download_to_file(filename, params=kwargs)
+    if load:
+        load_bulkdownload(database, file_path,
+                          download_type=kwargs.get('download_type', 'complete'))
+    return file_path
+
+
+def load_bulkdownload(database, file_path, download_type='complete', column_names=None):
+    """Loads a bulk download zip into a local store that `get` reads the database from.
+    :param str database: The database code of the download
+    :param str file_path: The downloaded zip file
+    :param str download_type: 'complete' replaces every row loaded before, \
+    'partial' adds and updates the rows it contains
+    :param list column_names: Column names shared by every dataset of the database. \
+    If not specified, the names of a dataset are requested the first time it is read
+    """
+    return BulkStore.load(database, file_path, download_type=download_type,
+                          column_names=column_names)
+
+
+def remove_bulkdownload(database):
+    store = BulkStore.open(database)
+    if store is not None:
+        store.remove()
@@ -1,4 +1,6 @@
+import os
 import re
+import threading
 
 import requests
 import urllib
@@ -9,6 +11,10 @@ from requests.adapters import HTTPAdapter
 from .util import Util
 from .version import VERSION
 from .api_config import ApiConfig
+from .utils.json_decoder import JsonDecoder
+from .utils.rate_limiter import RateLimiter
+from .utils.request_coalescer import RequestCoalescer
+from .utils.response_cache import ResponseCache
 from nasdaqdatalink.errors.data_link_error import (
     DataLinkError, LimitExceededError, InternalServerError,
     AuthenticationError, ForbiddenError, InvalidRequestError,
@@ -16,8 +22,53 @@ from nasdaqdatalink.errors.data_link_error import (
 
 
 class Connection:
+    # one session (and so one pool of keep-alive connections) is shared by the
+    # whole process, see get_session
+    _session = None
+    _session_key = None
+    _session_lock = threading.Lock()
+
     @classmethod
     def request(cls, http_verb, url, **options):
+        abs_url, options = cls.build_request(url, **options)
+        return cls.execute_request(http_verb, abs_url, **options)
+
+    @classmethod
+    def request_json(cls, http_verb, url, **options):
+        # identical requests made at the same time by several threads share one
+        # response when ApiConfig.coalesce_requests is set
+        if not ApiConfig.coalesce_requests:
+            return cls._request_json(http_verb, url, **options)
+        key = RequestCoalescer.key(http_verb, url, options)
+        return RequestCoalescer.call(key, lambda: cls._request_json(http_verb, url, **options))
+
+    @classmethod
+    def _request_json(cls, http_verb, url, **options):
+        # decoded body of a successful request, served from the response cache
+        # when ApiConfig.use_cache is set, and revalidated once it has expired
+        cache = ResponseCache.from_config()
+        if cache is None:
+            return cls.request(http_verb, url, **options).json()
+
+        key = cache.key(http_verb, url, options)
+        response_data, expired_entry = cache.lookup(key, url)
+        if response_data is not None:
+            return response_data
+
+        if expired_entry is not None:
+            # the body of a 304 is empty, the stored one is used without decoding any
+            options['headers'] = Util.merge_to_dicts(cache.conditional_headers(expired_entry),
+                                                     options.get('headers') or {})
+        response = cls.request(http_verb, url, **options)
+        if response.status_code == 304 and expired_entry is not None:
+            return cache.revalidated(key, url, expired_entry)
+
+        response_data = response.json()
+        cache.set(key, url, response_data, response.headers)
+        return response_data
+
+    @classmethod
+    def build_request(cls, url, **options):
         if 'headers' in options:
             headers = options['headers']
         else:
@@ -37,30 +88,106 @@ class Connection:
 
         abs_url = '%s/%s' % (ApiConfig.api_base, url)
 
-        return cls.execute_request(http_verb, abs_url, **options)
+        return abs_url, options
 
     @classmethod
     def execute_request(cls, http_verb, url, **options):
         session = cls.get_session()
+        # with a rate limit, 429 responses are retried here once the limiter has
+        # paused the requests of every thread, rather than by urllib3
+        limiter = RateLimiter.from_config()
+        attempt = 0
 
-        try:
-            response = session.request(method=http_verb,
-                                       url=url,
-                                       verify=ApiConfig.verify_ssl,
-                                       **options)
-            if response.status_code < 200 or response.status_code >= 300:
-                cls.handle_api_error(response)
-            else:
-                return response
-        except requests.exceptions.RequestException as e:
-            if e.response:
-                cls.handle_api_error(e.response)
-            raise e
+        while True:
+            if limiter is not None:
+                limiter.acquire()
+            try:
+                response = JsonDecoder.bind(session.request(method=http_verb,
+                                                            url=url,
+                                                            verify=ApiConfig.verify_ssl,
+                                                            **options))
+                if limiter is not None:
+                    limiter.update(response.status_code, response.headers)
+                    if response.status_code == 429 and cls._can_retry(attempt):
+                        # a streamed body would otherwise hold its pooled connection
+                        response.close()
+                        attempt += 1
+                        continue
+                if response.status_code == 304 and cls._is_conditional(options):
+                    return response
+                if response.status_code < 200 or response.status_code >= 300:
+                    cls.handle_api_error(response)
+                else:
+                    return response
+            except requests.exceptions.RequestException as e:
+                if e.response:
+                    cls.handle_api_error(e.response)
+                raise e
+
+    @classmethod
+    def rate_limit_remaining(cls):
+        """Return the requests the rate limit of the configured API key allows now and
+        today, None when no rate limit is set.
+        """
+        limiter = RateLimiter.from_config()
+        return None if limiter is None else limiter.remaining()
+
+    @classmethod
+    def _is_conditional(cls, options):
+        headers = options.get('headers') or {}
+        return any(name.lower() in ('if-none-match', 'if-modified-since') for name in headers)
+
+    @classmethod
+    def _can_retry(cls, attempt):
+        return ApiConfig.use_retries and attempt < ApiConfig.number_of_retries
 
     @classmethod
     def get_session(cls):
+        session_key = cls._session_settings()
+        with cls._session_lock:
+            # rebuild when the settings the session was built from have changed,
+            # or when we are in a forked child that must not share its parent's sockets
+            if cls._session is None or cls._session_key != session_key:
+                cls._session = cls._build_session()
+                cls._session_key = session_key
+            return cls._session
+
+    @classmethod
+    def reset_session(cls):
+        with cls._session_lock:
+            if cls._session is not None:
+                cls._session.close()
+            cls._session = None
+            cls._session_key = None
+
+    @classmethod
+    def _reset_session_after_fork(cls):
+        # the lock may have been held by another thread at fork time
+        cls._session_lock = threading.Lock()
+        cls._session = None
+        cls._session_key = None
+
+    @classmethod
+    def _session_settings(cls):
+        proxies = urllib.request.getproxies() or {}
+        return (os.getpid(),
+                ApiConfig.api_protocol,
+                ApiConfig.use_retries,
+                ApiConfig.number_of_retries,
+                ApiConfig.retry_backoff_factor,
+                ApiConfig.max_wait_between_retries,
+                tuple(cls._retry_status_codes()),
+                ApiConfig.verify_ssl,
+                ApiConfig.pool_connections,
+                ApiConfig.pool_maxsize,
+                tuple(sorted(proxies.items())))
+
+    @classmethod
+    def _build_session(cls):
         session = requests.Session()
-        adapter = HTTPAdapter(max_retries=cls.get_retries())
+        adapter = HTTPAdapter(pool_connections=ApiConfig.pool_connections,
+                              pool_maxsize=ApiConfig.pool_maxsize,
+                              max_retries=cls.get_retries())
         session.mount(ApiConfig.api_protocol, adapter)
 
         proxies = urllib.request.getproxies()
@@ -78,12 +205,18 @@ class Connection:
         retries = Retry(total=ApiConfig.number_of_retries,
                         connect=ApiConfig.number_of_retries,
                         read=ApiConfig.number_of_retries,
-                        status_forcelist=ApiConfig.retry_status_codes,
+                        status_forcelist=cls._retry_status_codes(),
                         backoff_factor=ApiConfig.retry_backoff_factor,
                         raise_on_status=False)
 
         return retries
 
+    @classmethod
+    def _retry_status_codes(cls):
+        if ApiConfig.rate_limit is None and ApiConfig.rate_limit_per_day is None:
+            return ApiConfig.retry_status_codes
+        return [code for code in ApiConfig.retry_status_codes if code != 429]
+
     @classmethod
     def parse(cls, response):
         try:
@@ -94,11 +227,14 @@ class Connection:
     @classmethod
     def handle_api_error(cls, resp):
         error_body = cls.parse(resp)
+        cls.raise_api_error(error_body, resp.status_code, resp.text, resp.headers)
 
+    @classmethod
+    def raise_api_error(cls, error_body, http_status, http_body, http_headers):
         # if our app does not form a proper data_link_error response
         # throw generic error
         if 'quandl_error' not in error_body:
-            raise DataLinkError(http_status=resp.status_code, http_body=resp.text)
+            raise DataLinkError(http_status=http_status, http_body=http_body)
 
         code = error_body['quandl_error']['code']
         message = error_body['quandl_error']['message']
@@ -117,4 +253,8 @@ class Connection:
         }
         klass = d_klass.get(code_letter, DataLinkError)
 
-        raise klass(message, resp.status_code, resp.text, resp.headers, code)
+        raise klass(message, http_status, http_body, http_headers, code)
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=Connection._reset_session_after_fork)
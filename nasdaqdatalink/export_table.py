@@ -4,19 +4,48 @@ from .model.datatable import Datatable
 from .message import Message
 
 
-def export_table(datatable_code, **kwargs):
+def export_table(datatable_code, into=None, **kwargs):
     """Downloads an entire table as a zip file.
     :param str datatable_code: The datatable code to download, such as MER/F1
     :param str filename: The filename for the download. \
     If not specified, will download to the current working directory
+    :param str into: Read the export while it downloads instead of saving the zip: \
+    `pandas` or `arrow` return the table, `parquet:<path>` writes it to a Parquet file. \
+    Cannot be combined with filename
     :param str api_key: Most databases require api_key for bulk download
     """
 
+    _validate_export_args(into, kwargs)
+
+    if into is not None:
+        return Datatable(datatable_code).read_export(into, **kwargs)
+
+    filename = kwargs.pop('filename', '.')
+    return Datatable(datatable_code).download_file(filename, **kwargs)
+
+
+def export_table_async(datatable_code, into=None, **kwargs):
+    """Starts the export of an entire table and returns a `concurrent.futures.Future` \
+    of the downloaded file path, or of the table read `into` a format. Exports of many \
+    tables are polled together, see export_table for the parameters.
+    """
+
+    _validate_export_args(into, kwargs)
+
+    if into is not None:
+        return Datatable(datatable_code).read_export_async(into, **kwargs)
+
+    filename = kwargs.pop('filename', '.')
+    return Datatable(datatable_code).download_file_async(filename, **kwargs)
+
+
+def _validate_export_args(into, kwargs):
     # discourage users from using authtoken
     if 'authtoken' in kwargs:
         raise InvalidRequestError(Message.ERROR_AUTHTOKEN_NOT_SUPPORTED)
 
-    ApiKeyUtil.init_api_key_from_args(kwargs)
+    # filename would otherwise be sent to the API as a filter
+    if into is not None and 'filename' in kwargs:
+        raise InvalidRequestError(Message.ERROR_EXPORT_FILENAME_WITH_INTO)
 
-    filename = kwargs.pop('filename', '.')
-    return Datatable(datatable_code).download_file(filename, **kwargs)
+    ApiKeyUtil.init_api_key_from_args(kwargs)
@@ -22,9 +22,16 @@ def get(dataset, **kwargs):
     :param str transform: options are diff, rdiff, cumul, and normalize
     :param int rows: Number of rows which will be returned
     :param str order: options are asc, desc. Default: `asc`
+    :param bool incremental: Keep the rows locally and only request the rows newer
+        than the ones kept by the previous call. Default: `False`
+    :param bool snapshot: Read the rows of a bulk download loaded with
+        `load_bulkdownload` instead of requesting them. Default: `True`
+    :param int max_workers: Number of datasets to request at once when a list of
+        codes is given. Default: `ApiConfig.max_workers`
     :param str returns: specify what format you wish your dataset returned as,
-        either `numpy` for a numpy ndarray or `pandas`. Default: `pandas`
-    :returns: :class:`pandas.DataFrame` or :class:`numpy.ndarray`
+        either `numpy` for a numpy ndarray, `arrow` for a pyarrow Table or `pandas`.
+        Default: `pandas`
+    :returns: :class:`pandas.DataFrame`, :class:`numpy.ndarray` or :class:`pyarrow.Table`
     Note that Pandas expects timeseries data to be sorted ascending for most
     timeseries functionality to work.
     Any other `kwargs` passed to `get` are sent as field/value params to Nasdaq Data Link
@@ -34,6 +41,14 @@ def get(dataset, **kwargs):
     _convert_params_to_v3(kwargs)
 
     data_format = kwargs.pop('returns', 'pandas')
+    dataset_options = {}
+    if 'incremental' in kwargs:
+        dataset_options['incremental'] = kwargs.pop('incremental')
+    if 'snapshot' in kwargs:
+        dataset_options['snapshot'] = kwargs.pop('snapshot')
+    merged_options = dict(dataset_options)
+    if 'max_workers' in kwargs:
+        merged_options['max_workers'] = kwargs.pop('max_workers')
 
     ApiKeyUtil.init_api_key_from_args(kwargs)
 
@@ -45,7 +60,8 @@ def get(dataset, **kwargs):
         dataset_args = _parse_dataset_code(dataset)
         if dataset_args['column_index'] is not None:
             kwargs.update({'column_index': dataset_args['column_index']})
-        data = Dataset(dataset_args['code']).data(params=kwargs, handle_column_not_found=True)
+        data = Dataset(dataset_args['code']).data(params=kwargs, handle_column_not_found=True,
+                                                  **dataset_options)
     # Array
     elif isinstance(dataset, list):
         args = _build_merged_dataset_args(dataset)
@@ -53,14 +69,13 @@ def get(dataset, **kwargs):
         # for a non-existent dataset instead of raising an error
         data = MergedDataset(args).data(params=kwargs,
                                         handle_not_found_error=True,
-                                        handle_column_not_found=True)
+                                        handle_column_not_found=True,
+                                        **merged_options)
     # If wrong format
     else:
         raise InvalidRequestError(Message.ERROR_DATASET_FORMAT)
 
-    if data_format == 'numpy':
-        return data.to_numpy()
-    return data.to_pandas()
+    return data.to_format(data_format)
 
 
 def _parse_dataset_code(dataset):
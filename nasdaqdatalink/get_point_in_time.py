@@ -1,55 +1,58 @@
+from nasdaqdatalink.model.data_mixin import DataMixin
 from nasdaqdatalink.model.point_in_time import PointInTime
-from nasdaqdatalink.errors.data_link_error import LimitExceededError
 from .api_config import ApiConfig
-from .message import Message
+from .utils.pagination_util import Paginator
 from nasdaqdatalink.errors.data_link_error import InvalidRequestError
-import warnings
-import copy
 
 
 def get_point_in_time(datatable_code, **options):
-    validate_pit_options(options)
-    pit_options = {}
-
-    # Remove the PIT params/keys from the options to not send it as a query params
-    for k in ['interval', 'date', 'start_date', 'end_date']:
-        if k in options.keys():
-            pit_options[k] = options.pop(k)
+    point_in_time = build_point_in_time(datatable_code, options)
 
     if 'paginate' in options.keys():
         paginate = options.pop('paginate')
     else:
         paginate = None
 
-    data = None
-    page_count = 0
-    while True:
-        next_options = copy.deepcopy(options)
-        next_data = PointInTime(datatable_code, pit=pit_options).data(params=next_options)
+    prefetch = int(options.pop('prefetch', 0))
+    pandas_options = DataMixin.pop_pandas_options(options)
+    data_format = options.pop('returns', 'pandas')
 
+    data = None
+    for next_data in Paginator(point_in_time, options, paginate=paginate,
+                               page_limit=ApiConfig.page_limit, prefetch=prefetch):
         if data is None:
             data = next_data
         else:
             data.extend(next_data)
+    return data.to_format(data_format, **pandas_options)
 
-        if page_count >= ApiConfig.page_limit:
-            raise LimitExceededError(
-                Message.WARN_DATA_LIMIT_EXCEEDED % (datatable_code,
-                                                    ApiConfig.api_key
-                                                    )
-            )
 
-        next_cursor_id = next_data.meta['next_cursor_id']
+def iter_point_in_time(datatable_code, **options):
+    """Yield point in time data one page at a time, following every cursor.
+    Takes the same options as `get_point_in_time`; only the current page is held
+    in memory, so `ApiConfig.page_limit` does not apply.
+    :returns: generator of :class:`pandas.DataFrame` (or the `returns` format), one per page
+    """
+    point_in_time = build_point_in_time(datatable_code, options)
+    paginate = options.pop('paginate', True)
+    prefetch = int(options.pop('prefetch', 0))
+    pandas_options = DataMixin.pop_pandas_options(options)
+    data_format = options.pop('returns', 'pandas')
 
-        if next_cursor_id is None:
-            break
-        elif paginate is not True and next_cursor_id is not None:
-            warnings.warn(Message.WARN_PAGE_LIMIT_EXCEEDED, UserWarning)
-            break
+    return Paginator(point_in_time, options, paginate=paginate,
+                     prefetch=prefetch).pages(data_format, **pandas_options)
+
+
+def build_point_in_time(datatable_code, options):
+    validate_pit_options(options)
+    pit_options = {}
+
+    # Remove the PIT params/keys from the options to not send it as a query params
+    for k in ['interval', 'date', 'start_date', 'end_date']:
+        if k in options.keys():
+            pit_options[k] = options.pop(k)
 
-        page_count = page_count + 1
-        options['qopts.cursor_id'] = next_cursor_id
-    return data.to_pandas()
+    return PointInTime(datatable_code, pit=pit_options)
 
 
 def validate_pit_options(options):
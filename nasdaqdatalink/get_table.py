@@ -1,9 +1,8 @@
+from nasdaqdatalink.model.data_mixin import DataMixin
 from nasdaqdatalink.model.datatable import Datatable
-from nasdaqdatalink.errors.data_link_error import LimitExceededError
 from .api_config import ApiConfig
-from .message import Message
-import warnings
-import copy
+from .utils.pagination_util import Paginator
+from .utils.table_mirror import TableMirror
 
 
 def get_table(datatable_code, **options):
@@ -12,32 +11,43 @@ def get_table(datatable_code, **options):
     else:
         paginate = None
 
-    data = None
-    page_count = 0
-    while True:
-        next_options = copy.deepcopy(options)
-        next_data = Datatable(datatable_code).data(params=next_options)
+    # number of pages to request ahead on a background thread while the
+    # current one is being converted, 0 fetches pages strictly one after another
+    prefetch = int(options.pop('prefetch', 0))
+    pandas_options = DataMixin.pop_pandas_options(options)
+    data_format = options.pop('returns', 'pandas')
+    # mirror=False always requests the API, even when the table has a fresh mirror.
+    # A mirror answers with every matching row, so only paginated calls are sent to it
+    if options.pop('mirror', True) and paginate:
+        mirrored = TableMirror.answer(datatable_code, options, data_format, pandas_options)
+        if mirrored is not None:
+            return mirrored
 
+    data = None
+    for next_data in Paginator(Datatable(datatable_code), options, paginate=paginate,
+                               page_limit=ApiConfig.page_limit, prefetch=prefetch):
         if data is None:
             data = next_data
         else:
             data.extend(next_data)
-
-        if page_count >= ApiConfig.page_limit:
-            raise LimitExceededError(
-                Message.WARN_DATA_LIMIT_EXCEEDED % (datatable_code,
-                                                    ApiConfig.api_key
-                                                    )
-            )
-
-        next_cursor_id = next_data.meta['next_cursor_id']
-
-        if next_cursor_id is None:
-            break
-        elif paginate is not True and next_cursor_id is not None:
-            warnings.warn(Message.WARN_PAGE_LIMIT_EXCEEDED, UserWarning)
-            break
-
-        page_count = page_count + 1
-        options['qopts.cursor_id'] = next_cursor_id
-    return data.to_pandas()
+    return data.to_format(data_format, **pandas_options)
+
+
+def iter_table(datatable_code, **options):
+    """Yield a datatable one page at a time, following every cursor.
+    Only the current page is held in memory, so unlike `get_table` the
+    `ApiConfig.page_limit` does not apply.
+    :param str datatable_code: The datatable code to iterate, such as MER/F1
+    :param int prefetch: Number of pages to request ahead of the page being processed
+    :param bool downcast: Store Integer and float columns as 32 bit types
+    :param categorical: True, or a list of column names, to store String columns as categories
+    :param str returns: `pandas`, `numpy` or `arrow` for a pyarrow Table. Default: `pandas`
+    :returns: generator of :class:`pandas.DataFrame`, one per page
+    """
+    paginate = options.pop('paginate', True)
+    prefetch = int(options.pop('prefetch', 0))
+    pandas_options = DataMixin.pop_pandas_options(options)
+    data_format = options.pop('returns', 'pandas')
+
+    return Paginator(Datatable(datatable_code), options, paginate=paginate,
+                     prefetch=prefetch).pages(data_format, **pandas_options)
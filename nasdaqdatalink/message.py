@@ -1,23 +1,45 @@
 class Message:
+    ERROR_AIOHTTP_NOT_INSTALLED = 'nasdaqdatalink.aio requires the aiohttp package. \
+        Install it with: pip install nasdaq-data-link[async]'
     ERROR_ARGUMENTS_LIST_FORMAT = 'Your data set must be specified as a string that contains\
         a Nasdaq Data Link code or as a tuple'
     ERROR_AUTHTOKEN_NOT_SUPPORTED = 'The parameter authtoken is no longer supported. \
         For more information please see \
         https://github.com/Nasdaq/data-link-python/blob/main/README.md'
+    ERROR_CATEGORICAL_WITH_NUMPY = 'categorical cannot be used with returns=\'numpy\', \
+        whose record arrays have no categorical type.'
     ERROR_COLUMNS_DATA_NOT_MATCHED = 'The number of columns requested does not match \
         the data returned.'
     ERROR_COLUMN_INDEX_TYPE = 'The column index must be expressed as an integer for %s.'
     ERROR_COLUMN_INDEX_LIST = '%s : column_index must be expressed as a list of \
         integer indexes.'
+    ERROR_DAILY_RATE_LIMIT = 'The %s requests per day allowed by ApiConfig.rate_limit_per_day \
+        have been made. Please try again tomorrow.'
     ERROR_DATASET_FORMAT = 'Your dataset must either be specified as a string that contains a \
         single Nasdaq Data Link code or an array of Nasdaq Data Link codes'
     ERROR_DATASETS_CODE_MUST_IN_LIST = 'dataset codes must be specified in a list'
+    ERROR_DOWNLOAD_CHECKSUM = 'The checksum of the download of %s does not match the one \
+        sent by the server. The bytes received are kept in %s. Please try again.'
+    ERROR_DOWNLOAD_INCOMPLETE = 'The download ended after %s of %s bytes. Please try again.'
+    ERROR_EXPORT_CHECKSUM = 'The checksum of the exported file does not match the one \
+        recorded in its zip. Please try again.'
+    ERROR_EXPORT_FILENAME_WITH_INTO = 'filename cannot be used with into, which reads the \
+        export instead of saving the zip. Use parquet:<path> to write it to a file.'
+    ERROR_EXPORT_FORMAT = 'Unsupported export format %s. Use pandas, arrow or \
+        parquet:<path>.'
+    ERROR_EXPORT_NOT_A_ZIP = 'The export could not be read as a zip file. Use \
+        export_table without into to download it.'
     ERROR_FOLDER_ISSUE = 'The folder path specified is incorrect or you do not have \
         permission to access to the folder. Check your settings and try again.'
     ERROR_INVALID_DATABASE_CODE_FORMAT = 'Invalid format used for Nasdaq Data Link database code. \
         The correct format is: `DATABASE_CODE/DATASET_CODE`'
     ERROR_INVALID_DATASET = 'Invalid dataset. Your data set must be specified as a string that \
         contains a Nasdaq Data Link code or as a tuple with multiple Nasdaq Data Link codes'
+    ERROR_JSON_DECODER_NOT_AVAILABLE = 'The JSON decoder %s is not installed. Set \
+        ApiConfig.json_decoder to auto, orjson, simdjson, json or a function.'
+    ERROR_PYARROW_NOT_INSTALLED = 'returns=\'arrow\' requires the pyarrow package. \
+        Install it with: pip install nasdaq-data-link[arrow]'
+    ERROR_RANGE_NOT_SATISFIED = 'The server did not return bytes %s to %s of the download.'
     ERROR_REQUESTED_INDEX_OUT_OF_RANGE = '%s : The requested index %s is out of range. The \
         minimum index is 1 and the maximum index is %s'
     ERROR_REQUESTED_COLUMN_NOT_EXIST = 'Requested column index %s does not exist'
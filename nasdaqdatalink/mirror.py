@@ -0,0 +1,41 @@
+from .utils.api_key_util import ApiKeyUtil
+from .utils.table_mirror import TableMirror
+
+
+def mirror_table(datatable_code, update_column=None, key_columns=None, partition_by=None,
+                 **kwargs):
+    """Downloads every page of a table into a Parquet dataset under `ApiConfig.mirror_dir`.
+    While the mirror is fresh, `get_table` answers its filters from the mirror.
+    :param str datatable_code: The datatable code to mirror, such as ZACKS/FC
+    :param str update_column: Column holding the time each row was last updated, such as
+        lastupdated. `sync_table` only requests the rows updated since the last sync
+    :param list key_columns: Columns identifying a row. Default: the table's primary key
+    :param str partition_by: Column to partition the Parquet files on, such as ticker
+    :param int prefetch: Number of pages to request ahead of the page being written
+    :returns: :class:`TableMirror`
+    """
+    ApiKeyUtil.init_api_key_from_args(kwargs)
+    return TableMirror.create(datatable_code, update_column=update_column,
+                              key_columns=key_columns, partition_by=partition_by,
+                              prefetch=int(kwargs.pop('prefetch', 0)))
+
+
+def sync_table(datatable_code, **kwargs):
+    """Brings the mirror of a table up to date, creating it if needed.
+    :param str datatable_code: The mirrored datatable code, such as ZACKS/FC
+    :param int prefetch: Number of pages to request ahead of the page being written
+    :returns: :class:`TableMirror`
+    """
+    ApiKeyUtil.init_api_key_from_args(kwargs)
+    prefetch = int(kwargs.pop('prefetch', 0))
+    mirror = TableMirror.open(datatable_code)
+    if mirror is None:
+        return TableMirror.create(datatable_code, prefetch=prefetch)
+    mirror.sync(prefetch=prefetch)
+    return mirror
+
+
+def remove_mirror(datatable_code):
+    mirror = TableMirror.open(datatable_code)
+    if mirror is not None:
+        mirror.remove()
@@ -1,6 +1,98 @@
+from six.moves import zip_longest
+
+import pandas as pd
+
+from nasdaqdatalink.util import Util
 from .model_list import ModelList
 from .data_mixin import DataMixin
 
 
 class DataList(DataMixin, ModelList):
-    pass
+    # Rows are kept column by column, which is what pandas needs, rather than
+    # as one Data object per row. Data objects are only built for the rows that
+    # are indexed or iterated; once `values` is read the full list of Data
+    # objects is built and becomes the storage since callers may modify it.
+
+    def __init__(self, klass, values, meta):
+        self.klass = klass
+        self.meta = self.convert_meta(meta)
+        self._converted_column_names = Util.convert_column_names(meta)
+        self._columns = self._to_columns(values)
+        self._values = None
+
+    @property
+    def values(self):
+        if self._values is None:
+            self._values = [self._row_object(row) for row in self._rows()]
+            self._columns = None
+        return self._values
+
+    def to_list(self):
+        if self._columns is None:
+            return super(DataList, self).to_list()
+        return [Util.convert_to_dates(row) for row in self._rows()]
+
+    def extend(self, other):
+        if self._columns is None or getattr(other, '_columns', None) is None:
+            self.values.extend(other)
+            return
+
+        # pages may have returned ragged rows, keep every column the same length
+        width = max(len(self._columns), len(other._columns))
+        self._pad_columns(self._columns, width, len(self))
+        other_columns = other._columns + [[None] * len(other)] * (width - len(other._columns))
+        for column, other_column in zip(self._columns, other_columns):
+            column.extend(other_column)
+
+    def __getitem__(self, k):
+        if self._columns is None:
+            return self.values[k]
+        if isinstance(k, slice):
+            return [self[index] for index in range(*k.indices(len(self)))]
+        if k >= len(self) or k < -len(self):
+            raise IndexError('list index out of range')
+        return self._row_object([column[k] for column in self._columns])
+
+    def __iter__(self):
+        if self._columns is None:
+            return iter(self.values)
+        return (self._row_object(row) for row in self._rows())
+
+    def __len__(self):
+        if self._columns is None:
+            return len(self.values)
+        if not self._columns:
+            return 0
+        return len(self._columns[0])
+
+    def _build_data_frame(self, column_names):
+        if self._columns is None:
+            return super(DataList, self)._build_data_frame(column_names)
+        if not self._columns:
+            return pd.DataFrame(data=[], columns=column_names)
+        df = pd.DataFrame(dict(enumerate(self._columns)))
+        df.columns = column_names
+        return df
+
+    def _data_columns(self, width):
+        if self._columns is None:
+            return super(DataList, self)._data_columns(width)
+        columns = list(self._columns)
+        self._pad_columns(columns, width, len(self))
+        return columns
+
+    def _row_object(self, row):
+        return self.klass(row, meta=self.meta,
+                          converted_column_names=self._converted_column_names)
+
+    def _rows(self):
+        return (list(row) for row in zip(*self._columns))
+
+    @staticmethod
+    def _to_columns(values):
+        return [list(column) for column in zip_longest(*values)]
+
+    @staticmethod
+    def _pad_columns(columns, width, length):
+        while len(columns) < width:
+            columns.append([None] * length)
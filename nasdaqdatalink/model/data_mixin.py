@@ -1,24 +1,43 @@
+import numpy as np
 import pandas as pd
-from nasdaqdatalink.errors.data_link_error import ColumnNotFound
+from six.moves import zip_longest
+from nasdaqdatalink.errors.data_link_error import ColumnNotFound, InvalidRequestError
+from nasdaqdatalink.message import Message
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
 
 
 class DataMixin(object):
-    # DataFrame will respect order of input list of list
-    def to_pandas(self, keep_column_indexes=[]):
-        data = self.to_list()
+    # formats the API sends for each date column type, matched case insensitively
+    DATE_COLUMN_FORMATS = {'date': '%Y-%m-%d', 'datetime': 'ISO8601'}
+    # datatable column types (without precision, lower case) that hold floats
+    FLOAT_COLUMN_TYPES = ['bigdecimal', 'double', 'float', 'decimal']
+    # options accepted by the get_table family and passed on to to_pandas
+    PANDAS_OPTIONS = ['downcast', 'categorical']
 
-        # ensure pandas gets a list of lists
-        if data and isinstance(data, list) and not isinstance(data[0], list):
-            data = [data]
+    # DataFrame will respect order of input list of list
+    def to_pandas(self, keep_column_indexes=[], downcast=False, categorical=False):
+        """
+        :param bool downcast: Store datatable Integer columns as int32 when every value fits
+            and float columns as float32
+        :param categorical: True to store every datatable String column as a pandas
+            Categorical, or a list of the column names to convert
+        """
         if 'columns' in self.meta.keys():
-            df = pd.DataFrame(data=data, columns=self.columns)
+            df = self._build_data_frame(self.columns)
             for index, column_type in enumerate(self.column_types):
-                if column_type == 'Date':
-                    df[self.columns[index]] = df[self.columns[index]].apply(pd.to_datetime)
+                name = self.columns[index]
+                df[name] = self._convert_column(df[name], column_type, downcast,
+                                                categorical is True or
+                                                name in (categorical or []))
         else:
-            df = pd.DataFrame(data=data, columns=self.column_names)
+            df = self._build_data_frame(self.column_names)
             # ensure our first column of time series data is of pd.datetime
-            df[self.column_names[0]] = df[self.column_names[0]].apply(pd.to_datetime)
+            df[self.column_names[0]] = self._convert_dates(
+                df[self.column_names[0]], self.DATE_COLUMN_FORMATS['date'])
             df.set_index(self.column_names[0], inplace=True)
 
         # unfortunately to_records() cannot handle unicode in 2.7
@@ -34,8 +53,170 @@ class DataMixin(object):
             df = df.iloc[:, keep_column_indexes]
         return df
 
-    def to_numpy(self):
-        return self.to_pandas().to_records()
+    def _build_data_frame(self, column_names):
+        data = self.to_list()
+
+        # ensure pandas gets a list of lists
+        if data and isinstance(data, list) and not isinstance(data[0], list):
+            data = [data]
+        return pd.DataFrame(data=data, columns=column_names)
+
+    @classmethod
+    def pop_pandas_options(cls, options):
+        return dict((k, options.pop(k)) for k in cls.PANDAS_OPTIONS if k in options)
+
+    @classmethod
+    def _convert_column(cls, series, column_type, downcast, categorical):
+        column_type = str(column_type).lower()
+        base_type = column_type.split('(')[0]
+        try:
+            if column_type in cls.DATE_COLUMN_FORMATS:
+                return cls._convert_dates(series, cls.DATE_COLUMN_FORMATS[column_type])
+            elif base_type == 'integer':
+                return cls._convert_integers(series, downcast)
+            elif base_type in cls.FLOAT_COLUMN_TYPES:
+                return series.astype(np.float32 if downcast else np.float64)
+            elif base_type == 'string' and categorical:
+                return series.astype('category')
+        except (ValueError, TypeError, OverflowError):
+            # values that do not match the declared type are kept as they came
+            pass
+        return series
+
+    @staticmethod
+    def _convert_integers(series, downcast):
+        values = series.dropna()
+        if values.dtype.kind == 'f' and not (values == values.round()).all():
+            raise ValueError('column has fractional values')
+        int32 = np.iinfo(np.int32)
+        if downcast and (series.empty or (series.min() >= int32.min and
+                                          series.max() <= int32.max)):
+            dtypes = (np.int32, 'Int32')
+        else:
+            dtypes = (np.int64, 'Int64')
+        # the nullable type is only needed when a value is missing
+        return series.astype(dtypes[1] if series.isnull().any() else dtypes[0])
+
+    @staticmethod
+    def _convert_dates(series, date_format):
+        # one vectorized parse per column; values that do not match the expected
+        # format (or pandas without ISO8601 support) fall back to inference
+        try:
+            return pd.to_datetime(series, format=date_format)
+        except (ValueError, TypeError):
+            return pd.to_datetime(series)
+
+    @classmethod
+    def arrow_to_pandas(cls, table, column_types, downcast=False, categorical=False):
+        """Convert a :class:`pyarrow.Table` of datatable rows read from disk or an export into
+        the DataFrame `to_pandas` builds, `column_types` maps column names to their declared type.
+        """
+        df = table.to_pandas()
+        for name in table.column_names:
+            df[name] = cls._convert_column(df[name], column_types.get(name), downcast,
+                                           categorical is True or name in (categorical or []))
+        df.index.name = str(df.index.name)
+        return df
+
+    @classmethod
+    def convert_arrow_table(cls, table, downcast=False, categorical=False):
+        """Apply the `to_pandas` options to a :class:`pyarrow.Table`: with downcast, int64
+        columns whose values fit become int32 and float64 columns float32, categorical
+        dictionary encodes every string column, or the ones listed.
+        """
+        for index, name in enumerate(table.column_names):
+            column = table.column(index)
+            if downcast and pa.types.is_int64(column.type):
+                try:
+                    # a safe cast, columns with values past 32 bits raise
+                    converted = column.cast(pa.int32())
+                except pa.ArrowInvalid:
+                    continue
+            elif downcast and pa.types.is_float64(column.type):
+                converted = column.cast(pa.float32(), safe=False)
+            elif (pa.types.is_string(column.type) and
+                    (categorical is True or name in (categorical or []))):
+                converted = column.dictionary_encode()
+            else:
+                continue
+            table = table.set_column(index, name, converted)
+        return table
+
+    def to_numpy(self, **pandas_options):
+        return self.to_pandas(**pandas_options).to_records()
+
+    def to_arrow(self, downcast=False, categorical=False):
+        """Return the data as a :class:`pyarrow.Table`, built from the response columns
+        with the declared column types rather than through pandas. `Table.to_pandas()`
+        or `polars.from_arrow()` convert it further without copying numeric columns.
+        """
+        if pa is None:
+            raise ImportError(Message.ERROR_PYARROW_NOT_INSTALLED)
+        return self.convert_arrow_table(self._build_arrow_table(), downcast, categorical)
+
+    def to_format(self, data_format, **pandas_options):
+        # `returns` option shared by get, get_table and get_point_in_time
+        if data_format == 'numpy':
+            self.validate_numpy_options(pandas_options)
+            return self.to_numpy(**pandas_options)
+        elif data_format == 'arrow':
+            return self.to_arrow(**pandas_options)
+        return self.to_pandas(**pandas_options)
+
+    @staticmethod
+    def validate_numpy_options(pandas_options):
+        # record arrays have no categorical type
+        if pandas_options.get('categorical'):
+            raise InvalidRequestError(Message.ERROR_CATEGORICAL_WITH_NUMPY)
+
+    def _build_arrow_table(self):
+        if 'columns' in self.meta.keys():
+            names = self.columns
+            column_types = self.column_types
+        else:
+            # only the first column of a dataset is typed, as the date
+            names = self.column_names
+            column_types = ['Date'] + [None] * (len(names) - 1)
+
+        arrays = [self._arrow_array(column, column_type) for column, column_type
+                  in zip(self._data_columns(len(names)), column_types)]
+        return pa.Table.from_arrays(arrays, names=[str(name) for name in names])
+
+    def _data_columns(self, width):
+        data = self.to_list()
+        if data and not isinstance(data[0], list):
+            data = [data]
+        columns = [list(column) for column in zip_longest(*data)]
+        return columns + [[None] * len(data)] * (width - len(columns))
+
+    @classmethod
+    def _arrow_array(cls, column, column_type):
+        arrow_type = cls._arrow_type(column_type)
+        try:
+            array = pa.array(column)
+            # a safe cast, values that would be truncated raise instead
+            return array if arrow_type is None else array.cast(arrow_type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # values that do not fit the declared type are kept as text
+            return pa.array([None if value is None else str(value) for value in column],
+                            type=pa.string())
+
+    @classmethod
+    def _arrow_type(cls, column_type):
+        if column_type is None:
+            return None
+        base_type = str(column_type).lower().split('(')[0]
+        if base_type == 'date':
+            return pa.date32()
+        elif base_type == 'datetime':
+            return pa.timestamp('us', tz='UTC')
+        elif base_type == 'integer':
+            return pa.int64()
+        elif base_type in cls.FLOAT_COLUMN_TYPES:
+            return pa.float64()
+        elif base_type == 'string':
+            return pa.string()
+        return None
 
     def to_csv(self):
         return self.to_pandas().to_csv()
@@ -10,11 +10,11 @@ from nasdaqdatalink.message import Message
 from nasdaqdatalink.operations.get import GetOperation
 from nasdaqdatalink.operations.list import ListOperation
 from nasdaqdatalink.util import Util
+from nasdaqdatalink.utils.file_downloader import FileDownloader
 from .model_base import ModelBase
 
 
 class Database(GetOperation, ListOperation, ModelBase):
-    BULK_CHUNK_SIZE = 512
 
     @classmethod
     def get_code_from_meta(cls, metadata):
@@ -47,9 +47,7 @@ class Database(GetOperation, ListOperation, ModelBase):
         file_path = file_or_folder_path
         if os.path.isdir(file_or_folder_path):
             file_path = file_or_folder_path + '/' + os.path.basename(urlparse(r.url).path)
-        with open(file_path, 'wb') as fd:
-            for chunk in r.iter_content(self.BULK_CHUNK_SIZE):
-                fd.write(chunk)
+        FileDownloader.from_config().download(r, file_path)
 
         return file_path
 
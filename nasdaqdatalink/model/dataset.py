@@ -1,6 +1,8 @@
 from nasdaqdatalink.operations.get import GetOperation
 from nasdaqdatalink.operations.list import ListOperation
 from nasdaqdatalink.util import Util
+from nasdaqdatalink.utils.bulk_store import BulkStore
+from nasdaqdatalink.utils.incremental_store import IncrementalStore
 from .model_base import ModelBase
 from .data import Data
 from .data_list import DataList
@@ -36,23 +38,64 @@ class Dataset(GetOperation, ListOperation, ModelBase):
         # for a non-existent dataset instead of raising an error
         handle_not_found_error = options.pop('handle_not_found_error', False)
         handle_column_not_found = options.pop('handle_column_not_found', False)
-        # default order to ascending, and respect whatever user passes in
-        params = {
-            'database_code': self.database_code,
-            'dataset_code': self.dataset_code,
-            'order': 'asc'
-        }
-        updated_options = Util.merge_options('params', params, **options)
+        # incremental only requests the rows newer than the ones stored by a previous call
+        incremental = options.pop('incremental', False)
+        # snapshot=False requests the API even when a bulk download of the database is loaded
+        snapshot = options.pop('snapshot', True)
+        updated_options = self.data_options(**options)
         try:
+            response_data = self.snapshot_response_data(updated_options) if snapshot else None
+            if response_data is not None:
+                return Data.all_from_response(response_data)
+            if incremental:
+                return self._incremental_data(updated_options)
             return Data.all(**updated_options)
         except NotFoundError:
             if handle_not_found_error:
-                return DataList(Data, [], {'column_names': [six.u('None'), six.u('Not Found')]})
+                return self.empty_data()
             raise
         except ColumnNotFound:
             if handle_column_not_found:
-                return DataList(Data, [], {'column_names': [six.u('None'), six.u('Not Found')]})
+                return self.empty_data()
             raise
 
+    def data_options(self, **options):
+        # default order to ascending, and respect whatever user passes in
+        params = {
+            'database_code': self.database_code,
+            'dataset_code': self.dataset_code,
+            'order': 'asc'
+        }
+        return Util.merge_options('params', params, **options)
+
+    def snapshot_response_data(self, options, lookup_column_names=True):
+        # the rows of a recently loaded bulk download, None when they cannot answer
+        # the request
+        store = BulkStore.open(self.database_code)
+        if (store is None or not store.is_fresh() or
+                not store.has_dataset(self.dataset_code)):
+            return None
+        column_names = store.column_names(self.dataset_code)
+        if column_names is None:
+            if not lookup_column_names:
+                return None
+            column_names = self.column_names
+            store.set_column_names(self.dataset_code, column_names)
+        return store.response_data(options['params'], column_names)
+
+    def _incremental_data(self, options):
+        store = IncrementalStore.from_config()
+        plan, request_options = store.prepare(options)
+        response_data = store.splice(plan, Data.all_response_data(**request_options))
+        if response_data is None:
+            # the dataset columns changed since its rows were stored
+            plan, request_options = store.prepare(options, refresh=True)
+            response_data = store.splice(plan, Data.all_response_data(**request_options))
+        return Data.all_from_response(response_data)
+
+    @classmethod
+    def empty_data(cls):
+        return DataList(Data, [], {'column_names': [six.u('None'), six.u('Not Found')]})
+
     def database(self):
         return nasdaqdatalink.model.database.Database(self.database_code)
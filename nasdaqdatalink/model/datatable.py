@@ -1,16 +1,19 @@
 import os
 from time import sleep
 
-from six.moves.urllib.request import urlopen
-
+from nasdaqdatalink.api_config import ApiConfig
 from nasdaqdatalink.connection import Connection
 from nasdaqdatalink.errors.data_link_error import DataLinkError
 from nasdaqdatalink.message import Message
 from nasdaqdatalink.operations.get import GetOperation
 from nasdaqdatalink.operations.list import ListOperation
 from nasdaqdatalink.util import Util
+from nasdaqdatalink.utils.export_poller import ExportPoller
+from nasdaqdatalink.utils.export_reader import ExportReader
+from nasdaqdatalink.utils.file_downloader import FileDownloader
 from nasdaqdatalink.utils.request_type_util import RequestType
 from .data import Data
+from .data_mixin import DataMixin
 from .model_base import ModelBase
 
 import logging
@@ -18,8 +21,6 @@ log = logging.getLogger(__name__)
 
 
 class Datatable(GetOperation, ListOperation, ModelBase):
-    BULK_CHUNK_SIZE = 16 * 1024
-    WAIT_GENERATION_INTERVAL = 30
 
     @classmethod
     def get_path(cls):
@@ -34,17 +35,49 @@ class Datatable(GetOperation, ListOperation, ModelBase):
         if not isinstance(file_or_folder_path, str):
             raise DataLinkError(Message.ERROR_FOLDER_ISSUE)
 
-        file_is_ready = False
+        file_link = self.export_link(**options)
+        return self._download_file_with_link(file_or_folder_path, file_link, self.code)
 
-        while not file_is_ready:
-            file_is_ready = self._request_file_info(file_or_folder_path, params=options)
-            if not file_is_ready:
-                log.debug(Message.LONG_GENERATION_TIME)
-                sleep(self.WAIT_GENERATION_INTERVAL)
+    def download_file_async(self, file_or_folder_path, **options):
+        """Return a future of the path of the downloaded export, see download_file."""
+        if not isinstance(file_or_folder_path, str):
+            raise DataLinkError(Message.ERROR_FOLDER_ISSUE)
 
-    def _request_file_info(self, file_or_folder_path, **options):
+        return ExportPoller.shared().submit(
+            self, options, lambda file_link: self._download_file_with_link(
+                file_or_folder_path, file_link, self.code))
+
+    def read_export(self, into, **options):
+        """Return the whole table read from its export while it is downloaded, as
+        `pandas`, `arrow` or `parquet:<path>`, without writing the zip or the CSV.
+        """
+        pandas_options = DataMixin.pop_pandas_options(options)
+        ExportReader.validate(into)
+        return self._read_export_link(self.export_link(**options), into, pandas_options)
+
+    def read_export_async(self, into, **options):
+        """Return a future of the table read from its export, see read_export."""
+        pandas_options = DataMixin.pop_pandas_options(options)
+        ExportReader.validate(into)
+        return ExportPoller.shared().submit(
+            self, options, lambda file_link: self._read_export_link(file_link, into,
+                                                                    pandas_options))
+
+    def export_link(self, **options):
+        """Return the link of the table export, once it has been generated."""
+        interval = ApiConfig.export_poll_interval
+        file_link, retry_after = self._request_file_link(params=options)
+        while file_link is None:
+            log.debug(Message.LONG_GENERATION_TIME)
+            wait, interval = ExportPoller.next_wait(interval, retry_after)
+            sleep(wait)
+            file_link, retry_after = self._request_file_link(params=options)
+        return file_link
+
+    def _request_file_link(self, **options):
+        # the link once the export is fresh, otherwise None, and the seconds the
+        # server asks to wait before the next request
         url = self._download_request_path()
-        code_name = self.code
         options['params']['qopts.export'] = 'true'
 
         request_type = RequestType.get_request_type(url, **options)
@@ -57,14 +90,23 @@ class Datatable(GetOperation, ListOperation, ModelBase):
 
         file_info = response_data['datatable_bulk_download']['file']
 
-        status = file_info['status']
-
-        if status == 'fresh':
-            file_link = file_info['link']
-            self._download_file_with_link(file_or_folder_path, file_link, code_name)
-            return True
-        else:
-            return False
+        if file_info['status'] == 'fresh':
+            return file_info['link'], None
+        return None, Util.retry_after(r.headers)
+
+    def _read_export_link(self, file_link, into, pandas_options):
+        reader = ExportReader(self.__get_raw_data__().get('columns') or [],
+                              chunk_size=ApiConfig.download_chunk_size)
+        response = Connection.get_session().get(file_link, stream=True,
+                                                verify=ApiConfig.verify_ssl)
+        try:
+            if response.status_code < 200 or response.status_code >= 300:
+                raise DataLinkError(http_status=response.status_code,
+                                    http_body=response.text)
+            return reader.read(response.iter_content(reader.chunk_size), into,
+                               **pandas_options)
+        finally:
+            response.close()
 
     def _download_file_with_link(self, file_or_folder_path, file_link, code_name):
         file_path = file_or_folder_path
@@ -72,19 +114,13 @@ class Datatable(GetOperation, ListOperation, ModelBase):
             file_path = os.path.join(file_or_folder_path,
                                      '{}.{}'.format(code_name.replace('/', '_'), 'zip'))
 
-        res = urlopen(file_link)
-
-        with open(file_path, 'wb') as fd:
-            while True:
-                chunk = res.read(self.BULK_CHUNK_SIZE)
-                if not chunk:
-                    break
-                fd.write(chunk)
+        FileDownloader.from_config().download_link(file_link, file_path)
 
         log.debug(
             "File path: %s",
             file_path
         )
+        return file_path
 
     def _download_request_path(self):
         url = self.default_path()
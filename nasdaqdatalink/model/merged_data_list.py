@@ -1,15 +1,25 @@
 from .data_list import DataList
+from .data_mixin import pa
 import numpy as np
 
 
 class MergedDataList(DataList):
+    # The merged DataFrame is the storage. The list of rows, and the Data objects
+    # built from them, are only created the first time the data is listed,
+    # indexed or iterated.
 
     def __init__(self, klass, values, meta, ascending=True):
         # values is a merged DataFrame
         self.__data_frame = values
         self.__ascending = ascending
-        raw_data = self._initialize_raw_data()
-        super(MergedDataList, self).__init__(klass, raw_data, meta)
+        super(MergedDataList, self).__init__(klass, [], meta)
+        self._columns = None
+
+    @property
+    def values(self):
+        if self._values is None:
+            self._values = [self._row_object(row) for row in self._rows()]
+        return self._values
 
     def to_pandas(self):
         # require ascending flag because merge will sort data into ascending
@@ -17,6 +27,24 @@ class MergedDataList(DataList):
             return self.__data_frame.sort_index(ascending=False)
         return self.__data_frame
 
+    def to_list(self):
+        if self._values is None:
+            return list(self._rows())
+        return super(MergedDataList, self).to_list()
+
+    def __len__(self):
+        if self._values is None:
+            return len(self.__data_frame.index)
+        return len(self._values)
+
+    def _build_arrow_table(self):
+        # the datasets are already merged into one DataFrame, keep the date
+        # as the first column like a single dataset
+        return pa.Table.from_pandas(self.to_pandas().reset_index(), preserve_index=False)
+
+    def _rows(self):
+        return (list(row) for row in self._initialize_raw_data())
+
     def _initialize_raw_data(self):
         numpy_results = self.to_numpy()
         numpy_dtype_names = numpy_results.dtype.names
@@ -1,7 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
 from more_itertools import unique_everseen
 import pandas as pd
 from six import string_types
 from .model_base import ModelBase
+from nasdaqdatalink.api_config import ApiConfig
 from nasdaqdatalink.util import Util
 from .merged_data_list import MergedDataList
 from .data import Data
@@ -30,25 +32,33 @@ class MergedDataset(ModelBase):
         return max(self._get_dataset_attribute('newest_available_date'))
 
     def data(self, **options):
+        max_workers = options.pop('max_workers', None) or ApiConfig.max_workers
+        datasets = self.__dataset_objects__()
+
         # if there is only one column_index, use the api to fetch
         # else fetch all the data and filter column indexes requested locally
-        dataset_data_list = [self._get_dataset_data(dataset, **options)
-                             for dataset in self.__dataset_objects__()]
-
-        # build data frames and filter locally when necessary
-        data_frames = [dataset_data.to_pandas(
-            keep_column_indexes=self._keep_column_indexes(index))
-            for index, dataset_data in enumerate(dataset_data_list)]
-
-        merged_data_frame = pd.DataFrame()
-
-        for index, data_frame in enumerate(data_frames):
-            metadata = self.__dataset_objects__()[index]
-            # use code to prevent metadata api call
-            data_frame.rename(
-                columns=lambda x: self._rename_columns(metadata.code, x), inplace=True)
-            merged_data_frame = pd.merge(
-                merged_data_frame, data_frame, right_index=True, left_index=True, how='outer')
+        if max_workers > 1 and len(datasets) > 1:
+            # map returns the results in the order of the datasets
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(datasets))) as executor:
+                dataset_data_list = list(executor.map(
+                    lambda dataset: self._get_dataset_data(dataset, **options), datasets))
+        else:
+            dataset_data_list = [self._get_dataset_data(dataset, **options)
+                                 for dataset in datasets]
+        return self.merge_data(dataset_data_list, **options)
+
+    def merge_data(self, dataset_data_list, **options):
+        # build data frames, filter locally when necessary and
+        # use code to prevent metadata api call when renaming columns
+        data_frames = []
+        for index, dataset_data in enumerate(dataset_data_list):
+            code = self.__dataset_objects__()[index].code
+            data_frame = dataset_data.to_pandas(
+                keep_column_indexes=self._keep_column_indexes(index))
+            data_frame.rename(columns=lambda x: self._rename_columns(code, x), inplace=True)
+            data_frames.append(data_frame)
+
+        merged_data_frame = self._join_data_frames(data_frames)
 
         merged_data_metadata = self._build_data_meta(dataset_data_list, merged_data_frame)
 
@@ -60,8 +70,32 @@ class MergedDataset(ModelBase):
             Data, merged_data_frame, merged_data_metadata,
             ascending=self._order_is_ascending(**options))
 
-    # for MergeDataset data calls
-    def _get_dataset_data(self, dataset, **options):
+    @staticmethod
+    def _join_data_frames(data_frames):
+        columns = [column for data_frame in data_frames for column in data_frame.columns]
+        if (len(columns) != len(set(columns)) or
+                not all(data_frame.index.is_unique for data_frame in data_frames)):
+            # concat cannot align repeated dates and would not suffix repeated
+            # column names, so fall back to joining one dataset at a time
+            merged_data_frame = pd.DataFrame()
+            for data_frame in data_frames:
+                merged_data_frame = pd.merge(merged_data_frame, data_frame,
+                                             right_index=True, left_index=True, how='outer')
+            return merged_data_frame
+
+        if not data_frames:
+            return pd.DataFrame()
+        # align every dataset on the date in a single pass
+        merged_data_frame = pd.concat(data_frames, axis=1, join='outer', sort=True)
+        if not merged_data_frame.index.is_monotonic_increasing:
+            merged_data_frame.sort_index(inplace=True)
+        # datasets that were not found have an empty index without a name
+        index_names = [data_frame.index.name for data_frame in data_frames
+                       if len(data_frame.index) > 0]
+        merged_data_frame.index.name = index_names[0] if index_names else None
+        return merged_data_frame
+
+    def dataset_data_options(self, dataset, **options):
         updated_options = options
         # if we have only one column index, let the api
         # handle the column filtering since the api supports this
@@ -70,7 +104,11 @@ class MergedDataset(ModelBase):
             # only change the options per request
             updated_options = options.copy()
             updated_options = Util.merge_options('params', params, **updated_options)
-        return dataset.data(**updated_options)
+        return updated_options
+
+    # for MergeDataset data calls
+    def _get_dataset_data(self, dataset, **options):
+        return dataset.data(**self.dataset_data_options(dataset, **options))
 
     def _build_data_meta(self, dataset_data_list, df):
         merged_data_metadata = {}
@@ -108,6 +146,8 @@ class MergedDataset(ModelBase):
         return code + ' - ' + original_column_name
 
     def _get_dataset_attribute(self, k):
+        # one metadata request per dataset, made at once when max_workers allows
+        Dataset.load_raw_data(self.__dataset_objects__())
         elements = []
         for dataset in self.__dataset_objects__():
             elements.append(dataset.__get_raw_data__()[k])
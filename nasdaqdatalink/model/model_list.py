@@ -5,9 +5,7 @@ class ModelList(object):
 
     def __init__(self, klass, values, meta):
         self.klass = klass
-        if 'columns' in meta.keys():
-            meta['column_types'] = Util.convert_to_columns_list(meta['columns'], 'type')
-            meta['columns'] = Util.convert_to_columns_list(meta['columns'], 'name')
+        self.convert_meta(meta)
 
         # Since we are iterating over a list of data be sure to only compute the
         # methodized column names once and pass that down to the objects that are being created.
@@ -28,6 +26,13 @@ class ModelList(object):
             ) for x in values])
         self.meta = meta
 
+    @staticmethod
+    def convert_meta(meta):
+        if 'columns' in meta.keys():
+            meta['column_types'] = Util.convert_to_columns_list(meta['columns'], 'type')
+            meta['columns'] = Util.convert_to_columns_list(meta['columns'], 'name')
+        return meta
+
     def to_list(self):
         return list([x.to_list() for x in self.values])
 
@@ -37,7 +42,7 @@ class ModelList(object):
         elif k == 'column_names':
             # keep datatable compatible with dataset
             return self.meta['columns']
-        elif hasattr(self.values, k):
+        elif hasattr(list, k):
             return getattr(self.values, k)
         raise AttributeError(k)
 
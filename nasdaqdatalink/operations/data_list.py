@@ -2,14 +2,25 @@ from nasdaqdatalink.model.data_list import DataList
 from .list import ListOperation
 from nasdaqdatalink.errors.data_link_error import (InvalidDataError, ColumnNotFound)
 from nasdaqdatalink.message import Message
+from nasdaqdatalink.util import Util
 
 
 class DataListOperation(ListOperation):
+    # dates in the data rows are parsed per column by to_pandas, or per row when
+    # a Data object is built, so only the metadata is walked for dates here
+    @classmethod
+    def all_from_response(cls, response_data):
+        return cls.create_list_from_response(response_data)
+
+    @classmethod
+    def page_from_response(cls, response_data):
+        return cls.create_datatable_list_from_response(response_data)
+
     @classmethod
     def create_list_from_response(cls, data):
         cls.validate_dataset_data_response(data['dataset_data'])
         values = data['dataset_data'].pop('data')
-        metadata = data['dataset_data']
+        metadata = Util.convert_to_dates(data['dataset_data'])
         return DataList(cls, values, metadata)
 
     @classmethod
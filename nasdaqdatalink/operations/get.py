@@ -1,8 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from inflection import singularize
 
 from .operation import Operation
+from nasdaqdatalink.api_config import ApiConfig
 from nasdaqdatalink.connection import Connection
 from nasdaqdatalink.util import Util
+from nasdaqdatalink.utils.metadata_cache import MetadataCache
 
 
 class GetOperation(Operation):
@@ -11,18 +15,44 @@ class GetOperation(Operation):
     def get_path(cls):
         return cls.default_path()
 
+    @classmethod
+    def prefetch(cls, codes, max_workers=None):
+        """Request the metadata of several codes at once.
+        :param list codes: Codes to build objects for, such as WIKI/AAPL
+        :param int max_workers: Number of requests made at once. Default: `ApiConfig.max_workers`
+        :returns: list of objects, in the order of `codes`, with their metadata loaded
+        """
+        objects = [cls(code) for code in codes]
+        cls.load_raw_data(objects, max_workers=max_workers)
+        return objects
+
+    @staticmethod
+    def load_raw_data(objects, max_workers=None):
+        max_workers = max_workers or ApiConfig.max_workers
+        if max_workers > 1 and len(objects) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(objects))) as executor:
+                list(executor.map(lambda model: model.__get_raw_data__(), objects))
+        else:
+            for model in objects:
+                model.__get_raw_data__()
+
     def __get_raw_data__(self):
         if self._raw_data:
             return self._raw_data
 
         cls = self.__class__
+        raw_data = MetadataCache.get(cls.lookup_key(), self.code)
+        if raw_data is not None:
+            self._raw_data = raw_data
+            return self._raw_data
+
         params = {'id': str(self.code)}
         options = Util.merge_options('params', params, **self.options)
 
         path = Util.constructed_path(cls.get_path(), options['params'])
 
-        r = Connection.request('get', path, **options)
-        response_data = r.json()
+        response_data = Connection.request_json('get', path, **options)
         Util.convert_to_dates(response_data)
         self._raw_data = response_data[singularize(cls.lookup_key())]
+        MetadataCache.set(cls.lookup_key(), self.code, self._raw_data)
         return self._raw_data
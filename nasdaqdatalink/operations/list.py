@@ -9,30 +9,50 @@ class ListOperation(Operation):
 
     @classmethod
     def all(cls, **options):
+        return cls.all_from_response(cls.all_response_data(**options))
+
+    @classmethod
+    def all_response_data(cls, **options):
+        http_verb, path, updated_options = cls.all_request(**options)
+        return Connection.request_json(http_verb, path, **updated_options)
+
+    @classmethod
+    def page(cls, datatable, **options):
+        return cls.page_from_response(cls.page_response_data(datatable, **options))
+
+    @classmethod
+    def page_response_data(cls, datatable, **options):
+        request_type, path, updated_options = cls.page_request(datatable, **options)
+        return Connection.request_json(request_type, path, **updated_options)
+
+    # the *_request and *_from_response halves are shared with the asyncio client,
+    # which performs the request in between with its own transport
+    @classmethod
+    def all_request(cls, **options):
         if 'params' not in options:
             options['params'] = {}
         path = Util.constructed_path(cls.list_path(), options['params'])
-        r = Connection.request('get', path, **options)
-        response_data = r.json()
+        return 'get', path, options
+
+    @classmethod
+    def all_from_response(cls, response_data):
         Util.convert_to_dates(response_data)
-        resource = cls.create_list_from_response(response_data)
-        return resource
+        return cls.create_list_from_response(response_data)
 
     @classmethod
-    def page(cls, datatable, **options):
+    def page_request(cls, datatable, **options):
         params = {'id': str(datatable.code)}
         path = Util.constructed_path(datatable.default_path(), params)
 
         request_type = RequestType.get_request_type(path, **options)
 
         updated_options = Util.convert_options(request_type=request_type, **options)
+        return request_type, path, updated_options
 
-        r = Connection.request(request_type, path, **updated_options)
-
-        response_data = r.json()
+    @classmethod
+    def page_from_response(cls, response_data):
         Util.convert_to_dates(response_data)
-        resource = cls.create_datatable_list_from_response(response_data)
-        return resource
+        return cls.create_datatable_list_from_response(response_data)
 
     @classmethod
     def create_list_from_response(cls, data):
@@ -1,6 +1,11 @@
 from inflection import parameterize
 import dateutil.parser
+import email.utils
+import json
+import os
 import re
+import tempfile
+import time
 import pandas
 from six import string_types
 
@@ -138,3 +143,38 @@ class Util(object):
             return list([Util.methodize(x) for x in meta['columns']])
         else:
             return []
+
+    @staticmethod
+    def write_json_atomically(path, data):
+        # readers, in this or any other process, see either the previous
+        # file or the complete new one
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+    @staticmethod
+    def retry_after(headers):
+        # seconds to wait given by a Retry-After header, as a number or an HTTP date
+        value = (headers or {}).get('Retry-After')
+        if value is None:
+            return None
+        try:
+            return max(float(value), 0)
+        except ValueError:
+            pass
+        try:
+            return max(email.utils.parsedate_to_datetime(value).timestamp() - time.time(), 0)
+        except (TypeError, ValueError):
+            return None
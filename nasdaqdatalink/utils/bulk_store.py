@@ -0,0 +1,224 @@
+import csv
+import io
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import time
+import zipfile
+from contextlib import closing
+
+import pandas as pd
+
+from nasdaqdatalink.api_config import ApiConfig
+
+
+class BulkStore(object):
+    """ The rows of a database bulk download kept in SQLite, indexed on the dataset code
+    and date, so `get` can read a dataset without requesting the API while the store was
+    loaded within `ApiConfig.bulk_max_age`. A complete download
+    replaces every stored row; partial downloads, which hold the rows added or changed
+    since the previous day, are applied on top of it.
+    Bulk download files have no header, the column names of each dataset are kept once
+    they have been looked up.
+    """
+    FILE_SUFFIX = '.sqlite'
+    # a JSON number, with its fraction and exponent
+    NUMBER = re.compile(r'-?(?:0|[1-9][0-9]*)(\.[0-9]+)?([eE][+-]?[0-9]+)?$')
+    LOAD_BATCH_SIZE = 10000
+    # dataset parameters answered from the stored rows
+    SUPPORTED_PARAMS = ['database_code', 'dataset_code', 'order', 'start_date', 'end_date',
+                        'rows', 'limit', 'column_index', 'transform', 'collapse']
+    SCHEMA = ['CREATE TABLE IF NOT EXISTS datasets '
+              '(dataset_code TEXT PRIMARY KEY, column_names TEXT)',
+              'CREATE TABLE IF NOT EXISTS rows (dataset_code TEXT, date TEXT, data TEXT, '
+              'PRIMARY KEY (dataset_code, date)) WITHOUT ROWID',
+              'CREATE TABLE IF NOT EXISTS loads (file TEXT, download_type TEXT, loaded_at REAL)',
+              'CREATE TABLE IF NOT EXISTS info (name TEXT PRIMARY KEY, value TEXT)']
+
+    def __init__(self, path):
+        self.path = path
+
+    @classmethod
+    def store_path(cls, database_code):
+        return os.path.join(os.path.expanduser(ApiConfig.bulk_dir),
+                            database_code + cls.FILE_SUFFIX)
+
+    @classmethod
+    def open(cls, database_code):
+        """Return the store of a database, None if no bulk download has been loaded."""
+        path = cls.store_path(database_code)
+        if not os.path.isfile(path):
+            return None
+        return cls(path)
+
+    @classmethod
+    def load(cls, database_code, file_path, download_type='complete', column_names=None):
+        """Load a bulk download zip of the database.
+        :param str download_type: `complete` replaces the stored rows, `partial` updates them
+        :param list column_names: Column names shared by every dataset of the database
+        """
+        path = cls.store_path(database_code)
+        if download_type == 'partial':
+            store = cls(path)
+            store._load(file_path, download_type, column_names, replace=False)
+            return store
+
+        # built aside and renamed over the previous store, which stays readable meanwhile
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        os.close(fd)
+        try:
+            cls(temp_path)._load(file_path, download_type, column_names, replace=True)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        return cls(path)
+
+    def remove(self):
+        os.remove(self.path)
+
+    def is_fresh(self, max_age=None):
+        """Return whether a download was loaded within `max_age` seconds, by default
+        `ApiConfig.bulk_max_age`.
+        """
+        max_age = ApiConfig.bulk_max_age if max_age is None else max_age
+        with closing(self._connect()) as connection:
+            loaded_at = connection.execute('SELECT MAX(loaded_at) FROM loads').fetchone()[0]
+        return loaded_at is not None and time.time() - loaded_at <= max_age
+
+    def has_dataset(self, dataset_code):
+        with closing(self._connect()) as connection:
+            return connection.execute('SELECT 1 FROM datasets WHERE dataset_code = ?',
+                                      (dataset_code,)).fetchone() is not None
+
+    def column_names(self, dataset_code):
+        # the names of the dataset, otherwise the ones given for the whole database
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                'SELECT COALESCE(column_names, '
+                "(SELECT value FROM info WHERE name = 'column_names')) "
+                'FROM datasets WHERE dataset_code = ?', (dataset_code,)).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return json.loads(row[0])
+
+    def set_column_names(self, dataset_code, column_names):
+        with closing(self._connect()) as connection, connection:
+            connection.execute('UPDATE datasets SET column_names = ? WHERE dataset_code = ?',
+                               (json.dumps(list(column_names)), dataset_code))
+
+    def response_data(self, params, column_names):
+        """Return the stored rows as a dataset data response, None when a parameter can
+        only be answered by the API.
+        """
+        if any(name not in self.SUPPORTED_PARAMS for name in params):
+            return None
+        if any(params.get(name) not in (None, 'none') for name in ['transform', 'collapse']):
+            return None
+        column_index = params.get('column_index')
+        if column_index is not None and not 0 < int(column_index) < len(column_names):
+            return None
+
+        query = 'SELECT date, data FROM rows WHERE dataset_code = ?'
+        arguments = [params['dataset_code']]
+        if params.get('start_date') is not None:
+            query += ' AND date >= ?'
+            arguments.append(self._date(params['start_date']))
+        if params.get('end_date') is not None:
+            query += ' AND date <= ?'
+            arguments.append(self._date(params['end_date']))
+        order = 'desc' if params.get('order') == 'desc' else 'asc'
+        query += ' ORDER BY date ' + order
+        limit = params.get('rows', params.get('limit'))
+        if limit is not None:
+            query += ' LIMIT ?'
+            arguments.append(int(limit))
+
+        with closing(self._connect()) as connection:
+            stored_rows = connection.execute(query, arguments).fetchall()
+
+        if column_index is None:
+            data = [[date] + json.loads(values) for date, values in stored_rows]
+        else:
+            column_index = int(column_index)
+            column_names = [column_names[0], column_names[column_index]]
+            data = [[date, self._value_at(json.loads(values), column_index - 1)]
+                    for date, values in stored_rows]
+
+        dates = sorted(row[0] for row in data)
+        return {'dataset_data': {'column_names': list(column_names),
+                                 'data': data,
+                                 'start_date': dates[0] if dates else None,
+                                 'end_date': dates[-1] if dates else None,
+                                 'order': order,
+                                 'transform': None,
+                                 'collapse': None,
+                                 'column_index': column_index,
+                                 'limit': limit,
+                                 'frequency': None}}
+
+    def _load(self, file_path, download_type, column_names, replace):
+        with closing(self._connect()) as connection, connection:
+            for statement in self.SCHEMA:
+                connection.execute(statement)
+            if replace:
+                connection.execute('DELETE FROM rows')
+                connection.execute('DELETE FROM datasets')
+            for rows in self._row_batches(file_path):
+                connection.executemany('INSERT OR IGNORE INTO datasets (dataset_code) '
+                                       'VALUES (?)', set((row[0],) for row in rows))
+                connection.executemany('INSERT OR REPLACE INTO rows VALUES (?, ?, ?)', rows)
+            if column_names is not None:
+                connection.execute("INSERT OR REPLACE INTO info VALUES ('column_names', ?)",
+                                   (json.dumps(list(column_names)),))
+            connection.execute('INSERT INTO loads VALUES (?, ?, ?)',
+                               (os.path.basename(file_path), download_type, time.time()))
+
+    def _row_batches(self, file_path):
+        # rows are read one at a time from the zip, only one batch is held in memory
+        rows = []
+        with zipfile.ZipFile(file_path) as archive:
+            for name in archive.namelist():
+                if name.endswith('/'):
+                    continue
+                with archive.open(name) as f:
+                    for row in csv.reader(io.TextIOWrapper(f, encoding='utf-8')):
+                        if len(row) < 2:
+                            continue
+                        values = [self._parse(value) for value in row[2:]]
+                        rows.append((row[0], row[1], json.dumps(values)))
+                        if len(rows) >= self.LOAD_BATCH_SIZE:
+                            yield rows
+                            rows = []
+        if rows:
+            yield rows
+
+    def _connect(self):
+        # the schema is created by the first load, reads only open existing stores
+        return sqlite3.connect(self.path, timeout=30)
+
+    @classmethod
+    def _parse(cls, value):
+        # numbers are read the way the API encodes them in JSON, anything else, such as
+        # codes with leading zeros, stays a string
+        if value == '':
+            return None
+        match = cls.NUMBER.match(value)
+        if match is None:
+            return value
+        if match.group(1) is None and match.group(2) is None:
+            return int(value)
+        return float(value)
+
+    @staticmethod
+    def _value_at(values, index):
+        return values[index] if index < len(values) else None
+
+    @staticmethod
+    def _date(value):
+        return pd.Timestamp(value).strftime('%Y-%m-%d')
@@ -0,0 +1,94 @@
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from nasdaqdatalink.api_config import ApiConfig
+
+
+class ExportPoller(object):
+    """ Waits for many datatable exports at once. One thread keeps the time of the next
+    poll of every pending export; polls and downloads run on a pool of
+    `ApiConfig.export_max_workers` threads, so an export being generated holds no thread.
+    Each export is polled after `ApiConfig.export_poll_interval` seconds, then less and
+    less often up to `ApiConfig.export_poll_max_interval`, unless the server says when
+    to ask again.
+    """
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_workers=4):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._pending = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+
+    @classmethod
+    def shared(cls):
+        """Return the poller shared by the whole process."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(max_workers=ApiConfig.export_max_workers)
+            return cls._shared
+
+    @staticmethod
+    def next_wait(interval, retry_after=None):
+        """Return the seconds to wait before the next poll and the interval after it."""
+        next_interval = min(interval * ApiConfig.export_poll_backoff,
+                            ApiConfig.export_poll_max_interval)
+        return (interval if retry_after is None else retry_after), next_interval
+
+    def submit(self, datatable, options, fetch):
+        """Poll the export of `datatable` filtered by `options` and return a future of
+        `fetch(link)`, called once the export is fresh.
+        """
+        future = Future()
+        self._schedule(0, [datatable, options, fetch, future, ApiConfig.export_poll_interval])
+        return future
+
+    def _schedule(self, wait, job):
+        with self._condition:
+            heapq.heappush(self._pending, (time.time() + wait, next(self._sequence), job))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True,
+                                                name='nasdaqdatalink-export-poller')
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending or self._pending[0][0] > time.time():
+                    self._condition.wait(self._pending[0][0] - time.time()
+                                         if self._pending else None)
+                job = heapq.heappop(self._pending)[2]
+            self._executor.submit(self._poll, job)
+
+    def _poll(self, job):
+        datatable, options, fetch, future, interval = job
+        if future.cancelled():
+            return
+        try:
+            file_link, retry_after = datatable._request_file_link(params=options)
+        except Exception as e:
+            self._set_exception(future, e)
+            return
+
+        if file_link is None:
+            wait, job[4] = self.next_wait(interval, retry_after)
+            self._schedule(wait, job)
+            return
+
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fetch(file_link))
+        except Exception as e:
+            future.set_exception(e)
+
+    @staticmethod
+    def _set_exception(future, exception):
+        if future.set_running_or_notify_cancel():
+            future.set_exception(exception)
@@ -0,0 +1,177 @@
+import io
+import os
+import struct
+import zlib
+
+from nasdaqdatalink.errors.data_link_error import DataLinkError, InvalidRequestError
+from nasdaqdatalink.message import Message
+from nasdaqdatalink.model.data_mixin import DataMixin
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+
+class ZipStream(io.RawIOBase):
+    """ The content of the first file of a zip archive, decompressed while the archive is
+    read from `chunks`, an iterable of bytes such as a response body, without seeking
+    and without writing the archive anywhere.
+    """
+    LOCAL_HEADER = struct.Struct('<4sHHHHHIIIHH')
+    LOCAL_HEADER_SIGNATURE = b'PK\x03\x04'
+    DATA_DESCRIPTOR_SIGNATURE = b'PK\x07\x08'
+    # general purpose flag set when the CRC and sizes follow the data
+    DATA_DESCRIPTOR_FLAG = 0x08
+    STORED = 0
+    DEFLATED = 8
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._input = b''
+        self._output = b''
+        self._offset = 0
+        self._crc = 0
+        self._done = False
+        self._read_local_header()
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while self._offset >= len(self._output) and not self._done:
+            self._output = self._next_output()
+            self._offset = 0
+        size = min(len(buffer), len(self._output) - self._offset)
+        buffer[:size] = self._output[self._offset:self._offset + size]
+        self._offset += size
+        return size
+
+    def _read_local_header(self):
+        (signature, _, flags, method, _, _, crc, compressed_size, _, name_length,
+         extra_length) = self.LOCAL_HEADER.unpack(self._read_input(self.LOCAL_HEADER.size))
+        if signature != self.LOCAL_HEADER_SIGNATURE:
+            raise DataLinkError(Message.ERROR_EXPORT_NOT_A_ZIP)
+        self._read_input(name_length + extra_length)
+
+        has_data_descriptor = bool(flags & self.DATA_DESCRIPTOR_FLAG)
+        self._expected_crc = None if has_data_descriptor else crc
+        if method == self.DEFLATED:
+            self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        elif method == self.STORED and not has_data_descriptor:
+            self._decompressor = None
+            self._remaining = compressed_size
+        else:
+            # a stored file of unknown size cannot be told apart from what follows it
+            raise DataLinkError(Message.ERROR_EXPORT_NOT_A_ZIP)
+
+    def _read_input(self, size):
+        while len(self._input) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                raise DataLinkError(Message.ERROR_DOWNLOAD_INCOMPLETE % (len(self._input), size))
+            self._input += chunk
+        data, self._input = self._input[:size], self._input[size:]
+        return data
+
+    def _next_input(self):
+        if self._input:
+            data, self._input = self._input, b''
+            return data
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            raise DataLinkError(Message.ERROR_EXPORT_NOT_A_ZIP)
+        return chunk
+
+    def _next_output(self):
+        data = self._next_input()
+        if self._decompressor is None:
+            output, self._input = data[:self._remaining], data[self._remaining:]
+            self._remaining -= len(output)
+            finished = self._remaining == 0
+        else:
+            output = self._decompressor.decompress(data)
+            finished = self._decompressor.eof
+            if finished:
+                self._input = self._decompressor.unused_data
+        self._crc = zlib.crc32(output, self._crc)
+        if finished:
+            self._finish()
+        return output
+
+    def _finish(self):
+        self._done = True
+        if self._expected_crc is None:
+            descriptor = self._read_input(4)
+            if descriptor == self.DATA_DESCRIPTOR_SIGNATURE:
+                descriptor = self._read_input(4)
+            self._expected_crc = struct.unpack('<I', descriptor)[0]
+        if self._crc != self._expected_crc:
+            raise DataLinkError(Message.ERROR_EXPORT_CHECKSUM)
+
+
+class ExportReader(object):
+    """ Parses the CSV file of a datatable export while its zip is downloaded, typed from
+    the declared column types, into a DataFrame, an Arrow table or a Parquet file.
+    Blocks of the CSV are parsed on several threads; nothing but the result is written.
+    """
+    FORMATS = ['pandas', 'arrow']
+    PARQUET_PREFIX = 'parquet:'
+    # bytes of CSV parsed at once
+    BLOCK_SIZE = 16 * 1024 * 1024
+
+    def __init__(self, columns, chunk_size=1024 * 1024):
+        self.column_types = dict((column['name'], column['type']) for column in columns)
+        self.chunk_size = chunk_size
+
+    @classmethod
+    def validate(cls, into):
+        if pa is None:
+            raise ImportError(Message.ERROR_PYARROW_NOT_INSTALLED)
+        if into not in cls.FORMATS and not (into.startswith(cls.PARQUET_PREFIX) and
+                                            len(into) > len(cls.PARQUET_PREFIX)):
+            raise InvalidRequestError(Message.ERROR_EXPORT_FORMAT % into)
+
+    def read(self, chunks, into, **pandas_options):
+        """Return the export read from `chunks`, the bytes of its zip, in the `into`
+        format. Parquet files are written as `<path>.part` and renamed once complete.
+        """
+        self.validate(into)
+        reader = pa_csv.open_csv(
+            io.BufferedReader(ZipStream(chunks), self.chunk_size),
+            read_options=pa_csv.ReadOptions(use_threads=True, block_size=self.BLOCK_SIZE),
+            convert_options=pa_csv.ConvertOptions(column_types=self._arrow_types(),
+                                                  strings_can_be_null=True))
+
+        if into.startswith(self.PARQUET_PREFIX):
+            return self._write_parquet(reader, into[len(self.PARQUET_PREFIX):])
+
+        table = reader.read_all()
+        if into == 'arrow':
+            return DataMixin.convert_arrow_table(table, **pandas_options)
+        return DataMixin.arrow_to_pandas(table, self.column_types, **pandas_options)
+
+    def _arrow_types(self):
+        arrow_types = {}
+        for name, column_type in self.column_types.items():
+            arrow_type = DataMixin._arrow_type(column_type)
+            # datetimes are written with or without an offset, their type is inferred
+            if arrow_type is not None and not pa.types.is_timestamp(arrow_type):
+                arrow_types[name] = arrow_type
+        return arrow_types
+
+    @staticmethod
+    def _write_parquet(reader, path):
+        part_path = path + '.part'
+        try:
+            with pq.ParquetWriter(part_path, reader.schema) as writer:
+                for batch in reader:
+                    writer.write_batch(batch)
+            os.replace(part_path, path)
+        except BaseException:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+        return path
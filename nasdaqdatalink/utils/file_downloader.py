@@ -0,0 +1,237 @@
+import base64
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from nasdaqdatalink.api_config import ApiConfig
+from nasdaqdatalink.connection import Connection
+from nasdaqdatalink.errors.data_link_error import DataLinkError
+from nasdaqdatalink.message import Message
+from nasdaqdatalink.util import Util
+
+
+class FileDownloader(object):
+    """ Writes a file served by a download link. When the server accepts byte ranges and
+    the file is large enough, the file is preallocated and split into segments that are
+    requested at once, each written at its own offset. Otherwise the body is streamed
+    through one connection in large chunks.
+    The file is written to `<file>.part`, with the bytes written so far recorded next to
+    it, and only renamed to `<file>` once its size and checksum are verified. A download
+    interrupted, in this call or an earlier one, resumes from the recorded bytes with a
+    Range request when the server accepts ranges and the file has not changed.
+    """
+    PART_SUFFIX = '.part'
+    PROGRESS_SUFFIX = '.part.json'
+    # the ETag of a file uploaded in one piece is often, but not always, the MD5 digest
+    # of its content, it is only used as one when verify_etag is set
+    MD5_ETAG = re.compile(r'^"?([0-9a-fA-F]{32})"?$')
+    # digests listed in x-goog-hash, as in crc32c=<base64>,md5=<base64>
+    GOOG_HASH_MD5 = re.compile(r'(?:^|,)\s*md5=([A-Za-z0-9+/=]+)')
+    # seconds between writes of the progress while bytes are being written
+    PROGRESS_INTERVAL = 1
+    INTERRUPTIONS = (requests.exceptions.ConnectionError,
+                     requests.exceptions.ChunkedEncodingError,
+                     requests.exceptions.Timeout)
+
+    def __init__(self, segments=1, segment_min_size=None, chunk_size=1024 * 1024, retries=0,
+                 verify_etag=False):
+        self.segments = segments
+        self.segment_min_size = segment_min_size
+        self.chunk_size = chunk_size
+        self.retries = retries
+        self.verify_etag = verify_etag
+        self._progress_lock = threading.Lock()
+        self._progress_saved_at = 0
+
+    @classmethod
+    def from_config(cls):
+        return cls(segments=ApiConfig.download_segments,
+                   segment_min_size=ApiConfig.download_segment_min_size,
+                   chunk_size=ApiConfig.download_chunk_size,
+                   retries=ApiConfig.number_of_retries if ApiConfig.use_retries else 0,
+                   verify_etag=ApiConfig.download_verify_etag)
+
+    def download_link(self, url, file_path):
+        response = Connection.get_session().get(url, stream=True, verify=ApiConfig.verify_ssl)
+        if response.status_code < 200 or response.status_code >= 300:
+            response.close()
+            raise DataLinkError(http_status=response.status_code, http_body=response.text)
+        self.download(response, file_path)
+
+    def download(self, response, file_path):
+        """Write the file of a streamed `response` to `file_path`."""
+        size = self._content_length(response)
+        accepts_ranges = response.headers.get('Accept-Ranges', '').lower() == 'bytes'
+        validator = response.headers.get('ETag') or response.headers.get('Last-Modified')
+
+        progress = self._read_progress(file_path) if accepts_ranges else None
+        if (progress is None or progress['size'] != size or
+                progress['validator'] != validator or validator is None):
+            progress = {'size': size,
+                        'validator': validator,
+                        'segments': self._segments(size, accepts_ranges)}
+            with open(file_path + self.PART_SUFFIX, 'wb') as fd:
+                if len(progress['segments']) > 1:
+                    fd.truncate(size)
+            self._write_progress(file_path, progress)
+
+        segments = progress['segments']
+        if len(segments) == 1 and segments[0][2] == 0:
+            # nothing written yet, the body of the response is used as it is
+            self._write_segment(response.url, file_path, progress, segments[0], accepts_ranges,
+                                response=response)
+        else:
+            # the ranges are requested from the final location, after any redirect
+            response.close()
+            with ThreadPoolExecutor(max_workers=len(segments)) as executor:
+                list(executor.map(
+                    lambda segment: self._write_segment(response.url, file_path, progress,
+                                                        segment, accepts_ranges),
+                    segments))
+
+        self._verify(file_path, response, size)
+        os.replace(file_path + self.PART_SUFFIX, file_path)
+        self._remove(file_path + self.PROGRESS_SUFFIX)
+
+    def _segments(self, size, accepts_ranges):
+        # [first byte, last byte, bytes written] of each segment, the last byte of a
+        # single segment is None when the size is not known
+        if (not accepts_ranges or size is None or self.segments <= 1 or
+                size < max(self.segment_min_size or 0, self.segments)):
+            return [[0, None if size is None else size - 1, 0]]
+        segment_size = -(-size // self.segments)
+        return [[start, min(start + segment_size, size) - 1, 0]
+                for start in range(0, size, segment_size)]
+
+    def _write_segment(self, url, file_path, progress, segment, accepts_ranges, response=None):
+        first_byte, last_byte = segment[0], segment[1]
+        attempts = 0
+        while last_byte is None or segment[2] < last_byte - first_byte + 1:
+            written = segment[2]
+            try:
+                if response is None:
+                    response = self._request_range(url, segment)
+                    if response.status_code == 200 and first_byte == 0 and written > 0:
+                        # the whole file was sent back, it is written again from the start
+                        self._update_progress(file_path, progress, segment, 0, save=True)
+                self._write_body(response, file_path, progress, segment)
+                if last_byte is None:
+                    return
+            except self.INTERRUPTIONS:
+                if not accepts_ranges:
+                    raise
+            finally:
+                if response is not None:
+                    response.close()
+                response = None
+
+            # only attempts that did not write anything count towards the retries
+            attempts = attempts + 1 if segment[2] == written else 0
+            if attempts > self.retries:
+                raise DataLinkError(Message.ERROR_DOWNLOAD_INCOMPLETE %
+                                    (segment[2], last_byte - first_byte + 1))
+
+    def _request_range(self, url, segment):
+        first_byte = segment[0] + segment[2]
+        last_byte = segment[1]
+        byte_range = 'bytes=%s-%s' % (first_byte, '' if last_byte is None else last_byte)
+        response = Connection.get_session().get(url, headers={'Range': byte_range},
+                                                stream=True, verify=ApiConfig.verify_ssl)
+        # a server that ignores the range sends the whole file, which only the
+        # segment starting at the first byte can use
+        if response.status_code != 206 and not (response.status_code == 200 and
+                                                segment[0] == 0):
+            response.close()
+            raise DataLinkError(Message.ERROR_RANGE_NOT_SATISFIED % (first_byte, last_byte),
+                                http_status=response.status_code)
+        return response
+
+    def _write_body(self, response, file_path, progress, segment):
+        try:
+            with open(file_path + self.PART_SUFFIX, 'r+b') as fd:
+                fd.seek(segment[0] + segment[2])
+                for chunk in response.iter_content(self.chunk_size):
+                    if segment[1] is not None:
+                        # never past the segment, whatever the server sent
+                        chunk = chunk[:segment[1] - segment[0] + 1 - segment[2]]
+                    fd.write(chunk)
+                    # the bytes are in the file before they are recorded as written
+                    fd.flush()
+                    self._update_progress(file_path, progress, segment,
+                                          segment[2] + len(chunk))
+        finally:
+            self._update_progress(file_path, progress, segment, segment[2], save=True)
+
+    def _update_progress(self, file_path, progress, segment, written, save=False):
+        with self._progress_lock:
+            segment[2] = written
+            if save or time.time() - self._progress_saved_at >= self.PROGRESS_INTERVAL:
+                self._write_progress(file_path, progress)
+                self._progress_saved_at = time.time()
+
+    def _verify(self, file_path, response, size):
+        part_path = file_path + self.PART_SUFFIX
+        written = os.path.getsize(part_path)
+        if size is not None and written != size:
+            raise DataLinkError(Message.ERROR_DOWNLOAD_INCOMPLETE % (written, size))
+
+        expected_md5 = self._expected_md5(response)
+        if expected_md5 is None:
+            return
+        md5 = hashlib.md5()
+        with open(part_path, 'rb') as fd:
+            for chunk in iter(lambda: fd.read(self.chunk_size), b''):
+                md5.update(chunk)
+        if md5.hexdigest() != expected_md5:
+            # there is no way to tell which bytes are wrong, the next download starts
+            # again; the bytes received stay in the part file until then
+            self._remove(file_path + self.PROGRESS_SUFFIX)
+            raise DataLinkError(Message.ERROR_DOWNLOAD_CHECKSUM % (file_path, part_path))
+
+    def _expected_md5(self, response):
+        # only headers that are digests of the content by definition, unless verify_etag
+        content_md5 = response.headers.get('Content-MD5')
+        if content_md5:
+            return base64.b64decode(content_md5).hex()
+        match = self.GOOG_HASH_MD5.search(response.headers.get('x-goog-hash') or '')
+        if match:
+            return base64.b64decode(match.group(1)).hex()
+        if not self.verify_etag:
+            return None
+        match = self.MD5_ETAG.match(response.headers.get('ETag') or '')
+        return match.group(1).lower() if match else None
+
+    def _read_progress(self, file_path):
+        if not os.path.isfile(file_path + self.PART_SUFFIX):
+            return None
+        try:
+            with open(file_path + self.PROGRESS_SUFFIX, 'r') as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def _write_progress(self, file_path, progress):
+        Util.write_json_atomically(file_path + self.PROGRESS_SUFFIX, progress)
+
+    @staticmethod
+    def _content_length(response):
+        # the length of an encoded body is not the size of the file written
+        if response.headers.get('Content-Encoding', 'identity') != 'identity':
+            return None
+        try:
+            return int(response.headers['Content-Length'])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,114 @@
+import datetime
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+from nasdaqdatalink.api_config import ApiConfig
+from nasdaqdatalink.util import Util
+
+
+class IncrementalStore(object):
+    """ Remembers the rows of every dataset fetched with `incremental=True`, so the next
+    request only asks for rows from the last stored date, less an overlap window for
+    revisions, onwards. The rows returned replace the stored rows from their first date.
+    Stored series are keyed on the dataset code and the parameters that shape its rows.
+    """
+    # parameters that change which rows a dataset returns and so get their own store
+    KEY_PARAMS = ['database_code', 'dataset_code', 'transform', 'collapse',
+                  'column_index', 'start_date']
+    # a limited or truncated window of rows cannot be extended
+    UNSUPPORTED_PARAMS = ['rows', 'limit', 'end_date']
+    # every row of these transforms depends on the whole history
+    FULL_HISTORY_TRANSFORMS = ['cumul', 'normalize']
+
+    def __init__(self, store_dir, overlap_days=0):
+        self.store_dir = store_dir
+        self.overlap_days = overlap_days
+
+    @classmethod
+    def from_config(cls):
+        return cls(os.path.expanduser(ApiConfig.incremental_dir),
+                   overlap_days=ApiConfig.incremental_overlap_days)
+
+    def prepare(self, options, refresh=False):
+        """Return the plan used by `splice` and the options to request the missing rows with.
+        The plan is None when the request cannot be made incrementally.
+        """
+        params = options.get('params', {})
+        if (any(params.get(name) is not None for name in self.UNSUPPORTED_PARAMS) or
+                params.get('transform') in self.FULL_HISTORY_TRANSFORMS):
+            return None, options
+
+        key = self.key(params)
+        entry = None if refresh else self._read(key)
+        plan = {'key': key,
+                'entry': entry,
+                'descending': params.get('order') == 'desc'}
+
+        # rows are kept, and so requested, in ascending order
+        updated_params = dict(params, order='asc')
+        if entry is not None and entry['data']:
+            start_date = self._date(entry['data'][-1][0]) - datetime.timedelta(
+                days=self.overlap_days)
+            if params.get('start_date') is not None:
+                start_date = max(start_date, self._date(params['start_date']))
+            updated_params['start_date'] = start_date.strftime('%Y-%m-%d')
+
+        updated_options = dict(options, params=updated_params)
+        return plan, updated_options
+
+    def splice(self, plan, response_data):
+        """Merge the rows of `response_data` with the stored rows, store the result and
+        return it as a complete response. Returns None when the stored rows no longer
+        match the dataset columns, `prepare` should then be called again with refresh=True.
+        """
+        if plan is None:
+            return response_data
+
+        dataset_data = response_data['dataset_data']
+        rows = dataset_data['data']
+        entry = plan['entry']
+        if entry is not None:
+            if entry['column_names'] != dataset_data['column_names']:
+                return None
+            if rows:
+                rows = [row for row in entry['data'] if row[0] < rows[0][0]] + rows
+            else:
+                rows = entry['data']
+
+        Util.write_json_atomically(self._entry_path(plan['key']),
+                                   {'column_names': dataset_data['column_names'],
+                                    'data': rows})
+
+        if rows:
+            dataset_data['start_date'] = rows[0][0]
+            dataset_data['end_date'] = rows[-1][0]
+        if plan['descending']:
+            rows = rows[::-1]
+            dataset_data['order'] = 'desc'
+        dataset_data['data'] = rows
+        return response_data
+
+    def key(self, params):
+        values = dict((name, params.get(name)) for name in self.KEY_PARAMS)
+        values['base'] = ApiConfig.api_base
+        if values['start_date'] is not None:
+            values['start_date'] = self._date(values['start_date']).strftime('%Y-%m-%d')
+        normalized = json.dumps(values, sort_keys=True, default=str)
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+    def _read(self, key):
+        try:
+            with open(self._entry_path(key), 'r') as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def _entry_path(self, key):
+        return os.path.join(self.store_dir, key[:2], key + '.json')
+
+    @staticmethod
+    def _date(value):
+        return pd.Timestamp(value).date()
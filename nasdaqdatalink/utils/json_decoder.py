@@ -0,0 +1,67 @@
+import json
+
+from nasdaqdatalink.api_config import ApiConfig
+from nasdaqdatalink.message import Message
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+
+class JsonDecoder(object):
+    """ Decodes response bodies straight from their bytes with the decoder chosen by
+    `ApiConfig.json_decoder`: `auto` uses orjson or simdjson when one is installed and the
+    standard library otherwise, `orjson`, `simdjson` or `json` pick one, and a function
+    taking the bytes replaces them.
+    Bodies a faster decoder rejects are decoded again by the standard library, so what
+    is accepted and the errors raised stay the same.
+    """
+    # in order of preference for `auto`
+    DECODERS = ['orjson', 'simdjson', 'json']
+
+    @classmethod
+    def decoder(cls, name=None):
+        if name is None:
+            name = ApiConfig.json_decoder
+        if callable(name):
+            return name
+        if name == 'auto':
+            name = next(decoder for decoder in cls.DECODERS if cls._module(decoder) is not None)
+        module = cls._module(name) if name in cls.DECODERS else None
+        if module is None:
+            raise ImportError(Message.ERROR_JSON_DECODER_NOT_AVAILABLE % name)
+        if module is json:
+            return json.loads
+        return lambda content: cls._with_fallback(module.loads, content)
+
+    @classmethod
+    def decode(cls, content):
+        return cls.decoder()(content)
+
+    @classmethod
+    def bind(cls, response):
+        """Make `response.json()` decode the body with the configured decoder."""
+        decoder = cls.decoder()
+        # options of the requests decoder still go to it
+        json_with_options = response.json
+        response.json = lambda **kwargs: (json_with_options(**kwargs) if kwargs
+                                          else decoder(response.content))
+        return response
+
+    @staticmethod
+    def _with_fallback(loads, content):
+        try:
+            return loads(content)
+        except ValueError:
+            # NaN, integers past 64 bits or another encoding than UTF-8
+            return json.loads(content)
+
+    @staticmethod
+    def _module(name):
+        return {'orjson': orjson, 'simdjson': simdjson, 'json': json}[name]
@@ -0,0 +1,47 @@
+import copy
+import threading
+import time
+
+from nasdaqdatalink.api_config import ApiConfig
+
+
+class MetadataCache(object):
+    """ Process wide cache of the metadata of datasets, databases and datatables, so every
+    object built for the same code shares one metadata request while the entry is fresh.
+    Enabled with `ApiConfig.use_metadata_cache`; entries expire after
+    `ApiConfig.metadata_cache_ttl` seconds.
+    """
+    _entries = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, lookup_key, code):
+        if not ApiConfig.use_metadata_cache:
+            return None
+        with cls._lock:
+            entry = cls._entries.get(cls._key(lookup_key, code))
+        if entry is None:
+            return None
+        stored_at, raw_data = entry
+        ttl = ApiConfig.metadata_cache_ttl
+        if ttl is not None and time.time() - stored_at > ttl:
+            return None
+        # objects may change their own raw data, never the cached one
+        return copy.deepcopy(raw_data)
+
+    @classmethod
+    def set(cls, lookup_key, code, raw_data):
+        if not ApiConfig.use_metadata_cache:
+            return
+        entry = (time.time(), copy.deepcopy(raw_data))
+        with cls._lock:
+            cls._entries[cls._key(lookup_key, code)] = entry
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._entries.clear()
+
+    @classmethod
+    def _key(cls, lookup_key, code):
+        return (ApiConfig.api_base, lookup_key, str(code))
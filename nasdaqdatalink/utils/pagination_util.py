@@ -0,0 +1,127 @@
+import copy
+import threading
+import warnings
+
+from six.moves import queue
+
+from nasdaqdatalink.api_config import ApiConfig
+from nasdaqdatalink.errors.data_link_error import LimitExceededError
+from nasdaqdatalink.message import Message
+from nasdaqdatalink.model.data import Data
+
+
+class Paginator(object):
+    """ Follows the cursors of a datatable or point in time query, one page at a time.
+    With prefetch set, pages are requested and decoded on a background thread as soon
+    as the previous cursor is known, up to `prefetch` pages ahead of the caller.
+    """
+    NEXT_PAGE = 'next'
+    LAST_PAGE = 'last'
+    PAGE_LIMIT_EXCEEDED = 'limit'
+    PAGINATE_DISABLED = 'disabled'
+
+    _DONE = object()
+
+    def __init__(self, model, options, paginate=True, page_limit=None, prefetch=0):
+        self.model = model
+        self.options = options
+        self.paginate = paginate
+        self.page_limit = page_limit
+        self.prefetch = int(prefetch)
+
+    def __iter__(self):
+        if self.prefetch > 0:
+            responses = self._prefetched_responses()
+        else:
+            responses = self._responses()
+
+        page_count = 0
+        for response_data in responses:
+            data = Data.page_from_response(response_data)
+            yield data
+
+            if not self.follow(page_count, data.meta['next_cursor_id']):
+                break
+
+            page_count = page_count + 1
+
+    def pages(self, data_format='pandas', **pandas_options):
+        # each page is converted and released before the next one is parsed
+        for data in self:
+            yield data.to_format(data_format, **pandas_options)
+
+    def next_step(self, page_count, next_cursor_id):
+        if self.page_limit is not None and page_count >= self.page_limit:
+            return self.PAGE_LIMIT_EXCEEDED
+        elif next_cursor_id is None:
+            return self.LAST_PAGE
+        elif self.paginate is not True:
+            return self.PAGINATE_DISABLED
+        return self.NEXT_PAGE
+
+    def follow(self, page_count, next_cursor_id):
+        """Return whether the page after the one just read should be requested, raising
+        once the page limit is exceeded and warning when paginate is not set.
+        """
+        step = self.next_step(page_count, next_cursor_id)
+        if step == self.PAGE_LIMIT_EXCEEDED:
+            raise LimitExceededError(
+                Message.WARN_DATA_LIMIT_EXCEEDED % (self.model.code,
+                                                    ApiConfig.api_key
+                                                    )
+            )
+        elif step == self.PAGINATE_DISABLED:
+            warnings.warn(Message.WARN_PAGE_LIMIT_EXCEEDED, UserWarning)
+        return step == self.NEXT_PAGE
+
+    def _responses(self):
+        page_count = 0
+        while True:
+            next_options = copy.deepcopy(self.options)
+            response_data = Data.page_response_data(self.model, params=next_options)
+            next_cursor_id = response_data['meta']['next_cursor_id']
+
+            yield response_data
+
+            if self.next_step(page_count, next_cursor_id) != self.NEXT_PAGE:
+                break
+
+            page_count = page_count + 1
+            self.options['qopts.cursor_id'] = next_cursor_id
+
+    def _prefetched_responses(self):
+        # bounded so a slow consumer caps how many decoded pages are held in memory
+        pages = queue.Queue(maxsize=self.prefetch)
+        stopped = threading.Event()
+
+        def put(item):
+            while not stopped.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def produce():
+            try:
+                for response_data in self._responses():
+                    if not put((response_data, None)):
+                        return
+                put((self._DONE, None))
+            except Exception as e:
+                put((None, e))
+
+        producer = threading.Thread(target=produce, name='nasdaqdatalink-prefetch')
+        producer.daemon = True
+        producer.start()
+        try:
+            while True:
+                response_data, error = pages.get()
+                if error is not None:
+                    raise error
+                if response_data is self._DONE:
+                    break
+                yield response_data
+        finally:
+            stopped.set()
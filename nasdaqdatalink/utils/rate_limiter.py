@@ -0,0 +1,214 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from nasdaqdatalink.api_config import ApiConfig
+from nasdaqdatalink.errors.data_link_error import LimitExceededError
+from nasdaqdatalink.message import Message
+from nasdaqdatalink.util import Util
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+class MemoryBackend(object):
+    """ Rate limit state of each API key, shared by the threads of this process. """
+
+    def __init__(self):
+        self._states = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def transaction(self, key):
+        with self._lock:
+            yield self._states.setdefault(key, {})
+
+    def clear(self):
+        with self._lock:
+            self._states.clear()
+
+
+class FileBackend(object):
+    """ Rate limit state of each API key kept in a JSON file, locked while it is read and
+    updated, so every process on the host draws from the same token bucket and daily
+    quota.
+    """
+    _lock = threading.Lock()
+
+    def __init__(self, path):
+        self.path = os.path.expanduser(path)
+
+    @contextmanager
+    def transaction(self, key):
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                self._lock_file(fd)
+                states = self._read(fd)
+                yield states.setdefault(key, {})
+                data = json.dumps(states).encode('utf-8')
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.write(fd, data)
+                os.ftruncate(fd, len(data))
+            finally:
+                # closing the file releases its lock
+                os.close(fd)
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _lock_file(fd):
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+    @staticmethod
+    def _read(fd):
+        chunks = []
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        try:
+            return json.loads(b''.join(chunks).decode('utf-8'))
+        except ValueError:
+            # a new file, or one left half written, starts again
+            return {}
+
+
+class RateLimiter(object):
+    """ Client side rate limit of the requests made with an API key: a token bucket of
+    `burst` requests refilled at `rate` per second, and at most `per_day` requests per
+    UTC day. Requests wait for a token rather than be answered with a 429; once the
+    daily quota is used up they raise LimitExceededError without being sent.
+    A 429 response, or rate limit headers saying no request is left, pauses every
+    request of the key until the time the server gives, otherwise with the backoff of
+    the retries.
+    """
+    _memory_backend = MemoryBackend()
+
+    def __init__(self, key, rate=None, burst=None, per_day=None, backend=None,
+                 backoff_factor=0.5, max_backoff=8, clock=time.time):
+        # the key is only kept hashed, the state may be shared outside this process
+        self.key = hashlib.sha256((key or '').encode('utf-8')).hexdigest()
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, rate or 1)
+        self.per_day = per_day
+        self.backend = backend if backend is not None else self._memory_backend
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.clock = clock
+
+    @classmethod
+    def from_config(cls):
+        """Return the limiter of the configured API key, None when no limit is set."""
+        if ApiConfig.rate_limit is None and ApiConfig.rate_limit_per_day is None:
+            return None
+        backend = None
+        if ApiConfig.rate_limit_file is not None:
+            backend = FileBackend(ApiConfig.rate_limit_file)
+        return cls(ApiConfig.api_key,
+                   rate=ApiConfig.rate_limit,
+                   burst=ApiConfig.rate_limit_burst,
+                   per_day=ApiConfig.rate_limit_per_day,
+                   backend=backend,
+                   backoff_factor=ApiConfig.retry_backoff_factor,
+                   max_backoff=ApiConfig.max_wait_between_retries)
+
+    def acquire(self):
+        """Wait until a request can be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def reserve(self):
+        """Count a request and return the seconds to wait before sending it."""
+        with self.backend.transaction(self.key) as state:
+            now = self.clock()
+            self._start_day(state, now)
+            if self.per_day is not None and state['requests_today'] >= self.per_day:
+                raise LimitExceededError(Message.ERROR_DAILY_RATE_LIMIT % self.per_day)
+            state['requests_today'] += 1
+
+            # tokens are taken ahead of time by the requests already waiting
+            start = max(now, state.get('blocked_until', 0))
+            if self.rate is None:
+                return start - now
+            tokens, updated_at = self._tokens(state, start)
+            state['tokens'] = tokens - 1
+            state['updated_at'] = max(updated_at, start)
+            return start - now + max(0, 1 - tokens) / self.rate
+
+    def update(self, status_code, headers):
+        """Adapt to the rate limit the server answered with."""
+        headers = headers or {}
+        retry_after = Util.retry_after(headers)
+        with self.backend.transaction(self.key) as state:
+            now = self.clock()
+            blocked_until = None
+            if status_code == 429:
+                state['rejections'] = state.get('rejections', 0) + 1
+                if retry_after is None:
+                    retry_after = min(self.backoff_factor * 2 ** (state['rejections'] - 1),
+                                      self.max_backoff)
+                blocked_until = now + retry_after
+            else:
+                state['rejections'] = 0
+                if headers.get('X-RateLimit-Remaining') == '0':
+                    blocked_until = self._reset_time(headers.get('X-RateLimit-Reset'), now)
+            if blocked_until is not None and blocked_until > state.get('blocked_until', 0):
+                # requests resume at the rate, not all at once
+                state['blocked_until'] = blocked_until
+                state['tokens'] = 1
+                state['updated_at'] = blocked_until
+
+    def remaining(self):
+        """Return the requests that can be sent now and today, and the seconds every
+        request waits for the server.
+        """
+        with self.backend.transaction(self.key) as state:
+            now = self.clock()
+            self._start_day(state, now)
+            tokens = None
+            if self.rate is not None:
+                tokens = max(0, int(self._tokens(state, now)[0]))
+            return {'requests_now': tokens,
+                    'requests_today': (None if self.per_day is None else
+                                       max(0, self.per_day - state['requests_today'])),
+                    'blocked_for': max(0, state.get('blocked_until', 0) - now)}
+
+    def _tokens(self, state, at):
+        updated_at = state.get('updated_at', at)
+        tokens = state.get('tokens', self.burst)
+        return min(self.burst, tokens + max(0, at - updated_at) * self.rate), updated_at
+
+    @staticmethod
+    def _start_day(state, now):
+        day = time.strftime('%Y-%m-%d', time.gmtime(now))
+        if state.get('day') != day:
+            state['day'] = day
+            state['requests_today'] = 0
+
+    @staticmethod
+    def _reset_time(value, now):
+        # seconds from now, or a Unix time
+        try:
+            reset = float(value)
+        except (TypeError, ValueError):
+            return None
+        return reset if reset > 1e9 else now + reset
@@ -0,0 +1,62 @@
+import copy
+import threading
+
+from nasdaqdatalink.api_config import ApiConfig
+from nasdaqdatalink.utils.response_cache import ResponseCache
+
+
+class _Call(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.waiters = 0
+        self.result = None
+        self.error = None
+
+
+class RequestCoalescer(object):
+    """ Lets one request in flight answer every identical request made by other threads
+    until it completes, so a burst of the same call goes to the API once. Requests are
+    identical when their verb, path, parameters, headers and API key are. Callers that
+    share a result each receive their own copy of it.
+    """
+    _calls = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def key(cls, http_verb, url, options):
+        params = options.get('params') or {}
+        return (ResponseCache.key(http_verb, url, options),
+                params.get('api_key', ApiConfig.api_key),
+                tuple(sorted((str(name), str(value)) for name, value
+                             in (options.get('headers') or {}).items())))
+
+    @classmethod
+    def call(cls, key, fetch):
+        """Return `fetch()`, or the result of the identical call already in flight."""
+        with cls._lock:
+            call = cls._calls.get(key)
+            if call is None:
+                call = cls._calls[key] = _Call()
+                leader = True
+            else:
+                call.waiters += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = fetch()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with cls._lock:
+                del cls._calls[key]
+                waiters = call.waiters
+            call.done.set()
+        # the result stays untouched while the waiters copy it
+        return copy.deepcopy(call.result) if waiters else call.result
@@ -0,0 +1,223 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+from nasdaqdatalink.api_config import ApiConfig
+from nasdaqdatalink.util import Util
+
+
+class ResponseCache(object):
+    """ Keeps decoded API responses on disk so repeated requests do not go to the network.
+    Entries are keyed on the request path and parameters (never the api key), expire after
+    a TTL that depends on the endpoint and are evicted least recently used first once the
+    cache grows past `ApiConfig.cache_max_size`. Entries are written atomically, so several
+    processes can share one cache directory.
+    Expired entries that came with an ETag or Last-Modified are kept, so the request can be
+    made conditional and a 304 answered from the stored body.
+    """
+    FILE_SUFFIX = '.json'
+    STATS = ['hits', 'misses', 'expired', 'stores', 'evictions', 'revalidations']
+    # response headers stored with an entry, and the request headers that revalidate it
+    VALIDATORS = {'ETag': 'If-None-Match', 'Last-Modified': 'If-Modified-Since'}
+
+    # stores after which the cache directory is scanned again, to account for the
+    # entries written by other processes
+    RESCAN_INTERVAL = 1000
+
+    _stats = dict((name, 0) for name in STATS)
+    _stats_lock = threading.Lock()
+    # size of each cache directory, as last scanned plus the entries stored since, and
+    # the number of those stores
+    _sizes = {}
+    _sizes_lock = threading.Lock()
+
+    def __init__(self, cache_dir, max_size=None, ttl=None, endpoint_ttls=None):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.ttl = ttl
+        self.endpoint_ttls = endpoint_ttls or {}
+
+    @classmethod
+    def from_config(cls):
+        if not ApiConfig.use_cache:
+            return None
+        return cls(os.path.expanduser(ApiConfig.cache_dir),
+                   max_size=ApiConfig.cache_max_size,
+                   ttl=ApiConfig.cache_ttl,
+                   endpoint_ttls=ApiConfig.cache_endpoint_ttls)
+
+    @classmethod
+    def stats(cls):
+        with cls._stats_lock:
+            return dict(cls._stats)
+
+    @classmethod
+    def reset_stats(cls):
+        with cls._stats_lock:
+            for name in cls.STATS:
+                cls._stats[name] = 0
+
+    @classmethod
+    def key(cls, http_verb, url, options):
+        params = dict(options.get('params') or {})
+        params.pop('api_key', None)
+        request = {'base': ApiConfig.api_base,
+                   'verb': http_verb.lower(),
+                   'path': url,
+                   'params': params,
+                   'json': options.get('json')}
+        normalized = json.dumps(request, sort_keys=True, default=str)
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+    def get(self, key, url):
+        return self.lookup(key, url)[0]
+
+    def lookup(self, key, url):
+        """Return the body of the entry while it is fresh, otherwise None and the expired
+        entry when it can be revalidated.
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+        except (IOError, OSError):
+            self._count('misses')
+            return None, None
+        except ValueError:
+            # left behind by a process that died while writing outside of the rename
+            self._remove(path)
+            self._count('misses')
+            return None, None
+
+        ttl = self.ttl_for(url)
+        if ttl is not None and time.time() - entry['stored_at'] > ttl:
+            self._count('expired')
+            self._count('misses')
+            if not entry.get('validators'):
+                self._remove(path)
+                return None, None
+            return None, entry
+
+        # the modification time orders entries for eviction
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        self._count('hits')
+        return entry['body'], None
+
+    def set(self, key, url, body, headers=None):
+        validators = {}
+        for name in self.VALIDATORS:
+            value = (headers or {}).get(name)
+            if isinstance(value, str):
+                validators[name] = value
+        path = self._entry_path(key)
+        replaced_size = self._file_size(path)
+        Util.write_json_atomically(path, {'path': url, 'stored_at': time.time(), 'body': body,
+                                          'validators': validators})
+        self._count('stores')
+        self._track_size(self._file_size(path) - replaced_size)
+
+    def _track_size(self, added):
+        # the directory is only scanned once the running total goes over the cap, or
+        # every RESCAN_INTERVAL stores, rather than on every store
+        if self.max_size is None:
+            return
+        with self._sizes_lock:
+            size = self._sizes.get(self.cache_dir)
+            if size is not None:
+                size[0] += added
+                size[1] += 1
+            scan = size is None or size[0] > self.max_size or size[1] >= self.RESCAN_INTERVAL
+        if scan:
+            self.evict()
+
+    def conditional_headers(self, entry):
+        """Return the request headers that revalidate an expired entry."""
+        return dict((self.VALIDATORS[name], value)
+                    for name, value in entry['validators'].items())
+
+    def revalidated(self, key, url, entry):
+        """Return the body of an expired entry the server answered 304 for, stored
+        again for another TTL.
+        """
+        entry = dict(entry, stored_at=time.time())
+        Util.write_json_atomically(self._entry_path(key), entry)
+        self._count('revalidations')
+        return entry['body']
+
+    def ttl_for(self, url):
+        for pattern, ttl in self.endpoint_ttls.items():
+            if re.search(pattern, url):
+                return ttl
+        return self.ttl
+
+    def evict(self):
+        """Scan the cache directory and remove entries until it fits `max_size`."""
+        if self.max_size is None:
+            return
+        entries = self._entries()
+        size = sum(entry[2] for entry in entries)
+        # least recently used first
+        for path, _, entry_size in sorted(entries, key=lambda entry: entry[1]):
+            if size <= self.max_size:
+                break
+            if self._remove(path):
+                self._count('evictions')
+            size -= entry_size
+        with self._sizes_lock:
+            self._sizes[self.cache_dir] = [size, 0]
+
+    def clear(self):
+        for path, _, _ in self._entries():
+            self._remove(path)
+        with self._sizes_lock:
+            self._sizes[self.cache_dir] = [0, 0]
+
+    def size(self):
+        return sum(entry[2] for entry in self._entries())
+
+    def _entries(self):
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for directory in os.scandir(self.cache_dir):
+            if not directory.is_dir():
+                continue
+            for entry in os.scandir(directory.path):
+                if not entry.name.endswith(self.FILE_SUFFIX):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    # removed by another process in the meantime
+                    continue
+                entries.append((entry.path, stat.st_mtime, stat.st_size))
+        return entries
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key + self.FILE_SUFFIX)
+
+    @staticmethod
+    def _file_size(path):
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+
+    @classmethod
+    def _count(cls, name):
+        with cls._stats_lock:
+            cls._stats[name] += 1
@@ -0,0 +1,299 @@
+import json
+import operator
+import os
+import shutil
+import time
+import uuid
+
+import pandas as pd
+
+from nasdaqdatalink.api_config import ApiConfig
+from nasdaqdatalink.message import Message
+from nasdaqdatalink.model.data_mixin import DataMixin
+from nasdaqdatalink.model.datatable import Datatable
+from nasdaqdatalink.util import Util
+from nasdaqdatalink.utils.pagination_util import Paginator
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+except ImportError:
+    pa = None
+
+
+class TableMirror(object):
+    """ A datatable materialized as a Parquet dataset under `ApiConfig.mirror_dir`,
+    optionally partitioned on one column. It is built from every page of the table and
+    kept in sync by requesting only the rows whose update column is at or after the latest
+    value already mirrored; those rows replace the mirrored rows with the same key.
+    Rows deleted from the table are only dropped by a full `refresh`.
+    """
+    STATE_FILE = 'state.json'
+    DATA_DIR = 'data'
+    # get_table filter operators that can be answered from the mirror
+    OPERATORS = {'gt': operator.gt, 'gte': operator.ge, 'lt': operator.lt, 'lte': operator.le}
+
+    def __init__(self, datatable_code, mirror_dir, state=None):
+        self.datatable_code = datatable_code
+        self.path = os.path.join(mirror_dir, *datatable_code.split('/'))
+        self.state = state
+
+    @classmethod
+    def open(cls, datatable_code):
+        """Return the mirror of the datatable in `ApiConfig.mirror_dir`, None if it has
+        not been mirrored.
+        """
+        if pa is None:
+            return None
+        mirror = cls(datatable_code, os.path.expanduser(ApiConfig.mirror_dir))
+        # one stat instead of opening the state file for tables that were never mirrored
+        if not os.path.isdir(mirror.path):
+            return None
+        mirror.state = mirror._read_state()
+        if mirror.state is None:
+            return None
+        return mirror
+
+    @classmethod
+    def answer(cls, datatable_code, options, data_format, pandas_options):
+        """Return a get_table call answered from a fresh mirror of the datatable, None
+        if there is none or it cannot answer the call.
+        """
+        mirror = cls.open(datatable_code)
+        if mirror is None or not mirror.is_fresh():
+            return None
+        table = mirror.query(options)
+        if table is None:
+            return None
+        return mirror.to_format(table, data_format, **pandas_options)
+
+    @classmethod
+    def create(cls, datatable_code, update_column=None, key_columns=None,
+               partition_by=None, prefetch=0):
+        if pa is None:
+            raise ImportError(Message.ERROR_PYARROW_NOT_INSTALLED)
+        if key_columns is None:
+            key_columns = Datatable(datatable_code).__get_raw_data__().get('primary_key')
+        state = {'datatable_code': datatable_code,
+                 'update_column': update_column,
+                 'key_columns': list(key_columns or []),
+                 'partition_by': partition_by,
+                 'columns': None,
+                 'last_update': None,
+                 'synced_at': None}
+        mirror = cls(datatable_code, os.path.expanduser(ApiConfig.mirror_dir), state)
+        mirror.refresh(prefetch=prefetch)
+        return mirror
+
+    @property
+    def schema(self):
+        return pa.schema([(column['name'], DataMixin._arrow_type(column['type']) or pa.string())
+                          for column in self.state['columns']])
+
+    def is_fresh(self, max_age=None):
+        max_age = ApiConfig.mirror_max_age if max_age is None else max_age
+        return time.time() - self.state['synced_at'] <= max_age
+
+    def refresh(self, prefetch=0):
+        """Rebuild the mirror from every page of the datatable."""
+        # taken before the first request, rows updated while paging are requested again
+        synced_at = time.time()
+        staging_dir = os.path.join(self.path, '.staging-%s' % uuid.uuid4().hex)
+        os.makedirs(staging_dir)
+        try:
+            last_update = None
+            for page_number, data in enumerate(self._pages({}, prefetch)):
+                if page_number == 0:
+                    self.state['columns'] = [{'name': name, 'type': column_type}
+                                             for name, column_type
+                                             in zip(data.columns, data.column_types)]
+                table = data.to_arrow().cast(self.schema)
+                self._write(table, staging_dir, 'part-%06d-{i}.parquet' % page_number)
+                last_update = self._last_update(table, last_update)
+            self._replace_data(staging_dir)
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+        self.state['last_update'] = last_update
+        self.state['synced_at'] = synced_at
+        self._write_state()
+
+    def sync(self, prefetch=0):
+        """Merge the rows changed since the last sync into the mirror. Without an update
+        column or key columns to match rows on, the whole table is requested again.
+        """
+        update_column = self.state['update_column']
+        if (not update_column or not self.state['key_columns'] or
+                self.state['last_update'] is None):
+            return self.refresh(prefetch=prefetch)
+
+        synced_at = time.time()
+        options = {update_column: {'gte': self.state['last_update']}}
+        changes = pa.concat_tables([data.to_arrow().cast(self.schema)
+                                    for data in self._pages(options, prefetch)])
+        if changes.num_rows > 0:
+            self._upsert(changes)
+
+        self.state['last_update'] = self._last_update(changes, self.state['last_update'])
+        self.state['synced_at'] = synced_at
+        self._write_state()
+
+    def remove(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def query(self, options):
+        """Return the rows matching get_table filters and `qopts.columns` as a
+        :class:`pyarrow.Table`, None when the filters cannot be answered from the mirror.
+        """
+        columns = None
+        expression = None
+        for name, value in options.items():
+            if name == 'api_key':
+                continue
+            if name == 'qopts':
+                if set(value) - set(['columns']):
+                    return None
+                name, value = 'qopts.columns', value.get('columns')
+            if name == 'qopts.columns':
+                columns = [value] if isinstance(value, str) else list(value or []) or None
+                continue
+
+            column, _, operator_name = name.partition('.')
+            if isinstance(value, dict) and not operator_name:
+                conditions = value.items()
+            else:
+                conditions = [(operator_name, value)]
+            for operator_name, condition_value in conditions:
+                condition = self._condition(column, operator_name, condition_value)
+                if condition is None:
+                    return None
+                expression = condition if expression is None else expression & condition
+
+        if columns is not None and not set(columns) <= set(self.schema.names):
+            return None
+
+        table = self._dataset().to_table(columns=columns, filter=expression)
+        sort_keys = [key for key in self.state['key_columns'] if key in table.column_names]
+        if sort_keys:
+            table = table.sort_by([(key, 'ascending') for key in sort_keys])
+        return table
+
+    def to_format(self, table, data_format, **pandas_options):
+        # same output as get_table builds from the API pages
+        if data_format == 'arrow':
+            return DataMixin.convert_arrow_table(table, **pandas_options)
+        elif data_format == 'numpy':
+            DataMixin.validate_numpy_options(pandas_options)
+            return self.to_pandas(table, **pandas_options).to_records()
+        return self.to_pandas(table, **pandas_options)
+
+    def to_pandas(self, table, **pandas_options):
+        column_types = dict((column['name'], column['type'])
+                            for column in self.state['columns'])
+        return DataMixin.arrow_to_pandas(table, column_types, **pandas_options)
+
+    def _pages(self, options, prefetch):
+        return Paginator(Datatable(self.datatable_code), options, paginate=True,
+                         prefetch=prefetch)
+
+    def _condition(self, column, operator_name, value):
+        if column not in self.schema.names:
+            return None
+        arrow_type = self.schema.field(column).type
+        field = ds.field(column)
+        try:
+            if not operator_name:
+                if isinstance(value, (list, tuple, pd.Series)):
+                    values = [self._scalar(item, arrow_type) for item in value]
+                    return field.isin(pa.array(values, type=arrow_type))
+                return field == self._scalar(value, arrow_type)
+            elif operator_name in self.OPERATORS:
+                return self.OPERATORS[operator_name](field, self._scalar(value, arrow_type))
+        except (ValueError, TypeError, pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            # the API decides what values it accepts
+            return None
+        return None
+
+    @staticmethod
+    def _scalar(value, arrow_type):
+        if pa.types.is_timestamp(arrow_type):
+            timestamp = pd.Timestamp(value)
+            if timestamp.tzinfo is None:
+                timestamp = timestamp.tz_localize('UTC')
+            return pa.scalar(timestamp.to_pydatetime(), type=arrow_type)
+        return pa.scalar(value).cast(arrow_type)
+
+    def _last_update(self, table, last_update):
+        update_column = self.state['update_column']
+        if not update_column or table.num_rows == 0:
+            return last_update
+        value = pc.max(table[update_column]).as_py()
+        if value is None:
+            return last_update
+        if hasattr(value, 'strftime'):
+            value = value.strftime('%Y-%m-%dT%H:%M:%S' if hasattr(value, 'hour')
+                                   else '%Y-%m-%d')
+        if last_update is not None and str(last_update) > str(value):
+            return last_update
+        return value
+
+    def _upsert(self, changes):
+        dataset = self._dataset()
+        partition_by = self.state['partition_by']
+        expression = None
+        if partition_by:
+            # only the partitions with changed rows are read and written again
+            values = changes[partition_by].unique()
+            expression = ds.field(partition_by).isin(values.drop_null())
+            if values.null_count:
+                expression = expression | ds.field(partition_by).is_null()
+
+        old_files = [fragment.path for fragment in dataset.get_fragments(filter=expression)]
+        existing = dataset.to_table(filter=expression)
+        keys = self.state['key_columns']
+        kept = existing.join(changes.select(keys), keys=keys, join_type='left anti')
+        merged = pa.concat_tables([kept.select(self.schema.names).cast(self.schema), changes])
+
+        self._write(merged, self._data_dir(), 'part-%d-{i}.parquet' % time.time_ns())
+        for path in old_files:
+            os.remove(path)
+
+    def _write(self, table, directory, basename_template):
+        ds.write_dataset(table, directory, format='parquet',
+                         partitioning=self._partitioning(),
+                         basename_template=basename_template,
+                         existing_data_behavior='overwrite_or_ignore')
+
+    def _replace_data(self, staging_dir):
+        data_dir = self._data_dir()
+        old_dir = None
+        if os.path.isdir(data_dir):
+            old_dir = os.path.join(self.path, '.old-%s' % uuid.uuid4().hex)
+            os.rename(data_dir, old_dir)
+        os.rename(staging_dir, data_dir)
+        if old_dir is not None:
+            shutil.rmtree(old_dir, ignore_errors=True)
+
+    def _dataset(self):
+        return ds.dataset(self._data_dir(), schema=self.schema, format='parquet',
+                          partitioning=self._partitioning())
+
+    def _partitioning(self):
+        partition_by = self.state['partition_by']
+        if not partition_by:
+            return None
+        return ds.partitioning(pa.schema([self.schema.field(partition_by)]), flavor='hive')
+
+    def _data_dir(self):
+        return os.path.join(self.path, self.DATA_DIR)
+
+    def _read_state(self):
+        try:
+            with open(os.path.join(self.path, self.STATE_FILE), 'r') as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def _write_state(self):
+        Util.write_json_atomically(os.path.join(self.path, self.STATE_FILE), self.state)
@@ -38,6 +38,12 @@ INSTALL_REQUIRES = [
     'more-itertools'
 ]
 
+EXTRAS_REQUIRE = {
+    'async': ['aiohttp >= 3.7'],
+    'arrow': ['pyarrow >= 7.0'],
+    'json': ['orjson >= 3.0']
+}
+
 TEST_REQUIRES = [
         'flake8',
         'nose',
@@ -45,11 +51,14 @@ TEST_REQUIRES = [
         'mock',
         'factory_boy',
         'jsondate',
-        'parameterized'
+        'parameterized',
+        'aiohttp',
+        'pyarrow'
 ]
 
 PACKAGES = [
     'nasdaqdatalink',
+    'nasdaqdatalink.aio',
     'nasdaqdatalink.errors',
     'nasdaqdatalink.model',
     'nasdaqdatalink.operations',
@@ -78,6 +87,7 @@ setup(
         "Programming Language :: Python :: 3.10"
     ],
     install_requires=INSTALL_REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     tests_require=TEST_REQUIRES,
     python_requires='>= 3.7',
     test_suite="nose.collector",
@@ -0,0 +1,281 @@
+import asyncio
+import copy
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+
+import pandas
+import six
+from mock import patch, call, AsyncMock, Mock
+
+import nasdaqdatalink.aio
+from nasdaqdatalink.aio.connection import AsyncConnection
+from nasdaqdatalink.api_config import ApiConfig
+from nasdaqdatalink.errors.data_link_error import (
+    InternalServerError, NotFoundError, LimitExceededError)
+from nasdaqdatalink.utils.request_type_util import RequestType
+from nasdaqdatalink.utils.response_cache import ResponseCache
+from test.factories.dataset_data import DatasetDataFactory
+from test.factories.datatable_data import DatatableDataFactory
+from test.test_retries import ModifyRetrySettingsTestCase
+
+
+# factories share their list attributes between builds, copy them
+# since parsing a response converts dates in place
+def dataset_data():
+    return {'dataset_data': copy.deepcopy(DatasetDataFactory.build())}
+
+
+def datatable_page(next_cursor_id):
+    return {'datatable': copy.deepcopy(DatatableDataFactory.build()),
+            'meta': {'next_cursor_id': next_cursor_id}}
+
+
+class FakeResponse(object):
+
+    def __init__(self, status, body, headers=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def read(self):
+        return six.b(self.body)
+
+
+class FakeSession(object):
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def request(self, method, url, **options):
+        self.calls.append(call(method, url, **options))
+        return self.responses.pop(0)
+
+
+class AsyncConnectionTest(ModifyRetrySettingsTestCase):
+
+    def setUp(self):
+        super(AsyncConnectionTest, self).setUp()
+        ApiConfig.use_retries = True
+        ApiConfig.retry_backoff_factor = 0
+
+    def execute(self, session, *args, **options):
+        with patch.object(AsyncConnection, 'get_session', return_value=session):
+            return asyncio.run(AsyncConnection.execute_request(*args, **options))
+
+    def test_returns_decoded_body(self):
+        session = FakeSession([FakeResponse(200, json.dumps({'foo': 'bar'}))])
+        self.assertEqual(self.execute(session, 'get', 'https://data.nasdaq.com/api/v3/databases'),
+                         {'foo': 'bar'})
+
+    def test_the_rate_limiter_is_used_off_the_event_loop(self):
+        threads = []
+
+        def record(*args):
+            threads.append(threading.current_thread())
+            return 0
+        session = FakeSession([FakeResponse(429, '{}', {'Retry-After': '0'}),
+                               FakeResponse(200, '{}')])
+        with patch.object(ApiConfig, 'rate_limit', 10), \
+                patch('nasdaqdatalink.utils.rate_limiter.RateLimiter.reserve',
+                      side_effect=record), \
+                patch('nasdaqdatalink.utils.rate_limiter.RateLimiter.update',
+                      side_effect=record):
+            self.execute(session, 'get', 'https://data.nasdaq.com/api/v3/databases')
+        self.assertEqual(len(threads), 4)
+        self.assertNotIn(threading.main_thread(), threads)
+
+    def test_list_params_are_expanded(self):
+        session = FakeSession([FakeResponse(200, '{}')])
+        self.execute(session, 'get', 'https://data.nasdaq.com/api/v3/datatables/ZACKS/FC',
+                     params={'ticker[]': ['AAPL', 'MSFT'], 'per_page': 10})
+        self.assertEqual(session.calls[0][2]['params'],
+                         [('ticker[]', 'AAPL'), ('ticker[]', 'MSFT'), ('per_page', '10')])
+
+    def test_retries_on_retry_status_codes(self):
+        ApiConfig.retry_status_codes = [500]
+        error = json.dumps({'quandl_error': {'code': 'QEMx01', 'message': 'something'}})
+        session = FakeSession([FakeResponse(500, error), FakeResponse(200, '{}')])
+        self.assertEqual(self.execute(session, 'get', 'https://data.nasdaq.com/api/v3/databases'),
+                         {})
+        self.assertEqual(len(session.calls), 2)
+
+    def test_raises_data_link_errors(self):
+        ApiConfig.retry_status_codes = []
+        error = json.dumps({'quandl_error': {'code': 'QEMx01', 'message': 'something'}})
+        session = FakeSession([FakeResponse(500, error)])
+        self.assertRaises(InternalServerError, self.execute, session,
+                          'get', 'https://data.nasdaq.com/api/v3/databases')
+
+    @patch.object(AsyncConnection, 'execute_request', new_callable=AsyncMock)
+    def test_request_builds_url_and_headers(self, mock):
+        ApiConfig.api_key = 'api_token'
+        asyncio.run(AsyncConnection.request('get', 'databases', params={'page': 2}))
+        args, kwargs = mock.call_args
+        self.assertEqual(args, ('get', 'https://data.nasdaq.com/api/v3/databases'))
+        self.assertEqual(kwargs['params'], {'page': 2})
+        self.assertEqual(kwargs['headers']['x-api-token'], 'api_token')
+
+    @patch.object(AsyncConnection, 'execute_request', new_callable=AsyncMock)
+    def test_request_shares_the_response_cache(self, mock):
+        mock.return_value = {'databases': []}
+        cache_dir = tempfile.mkdtemp()
+        try:
+            with patch.multiple(ApiConfig, use_cache=True, cache_dir=cache_dir):
+                for _ in range(2):
+                    self.assertEqual(asyncio.run(AsyncConnection.request('get', 'databases')),
+                                     {'databases': []})
+        finally:
+            shutil.rmtree(cache_dir)
+        self.assertEqual(mock.call_count, 1)
+
+    @patch.object(AsyncConnection, 'execute_request', new_callable=AsyncMock)
+    def test_the_response_cache_is_used_off_the_event_loop(self, mock):
+        mock.return_value = {'databases': []}
+        threads = []
+        cache = Mock(**{'key.return_value': 'key', 'get.return_value': None})
+        for method in [cache.get, cache.set]:
+            method.side_effect = lambda *args: threads.append(threading.current_thread())
+
+        def from_config():
+            threads.append(threading.current_thread())
+            return cache
+        with patch.object(ResponseCache, 'from_config', side_effect=from_config):
+            asyncio.run(AsyncConnection.request('get', 'databases'))
+        cache.set.assert_called_once_with('key', 'databases', {'databases': []})
+        self.assertEqual(len(threads), 3)
+        self.assertNotIn(threading.main_thread(), threads)
+
+
+class AsyncGetTest(unittest.TestCase):
+
+    def setUp(self):
+        ApiConfig.api_key = None
+
+    @patch.object(AsyncConnection, 'request', new_callable=AsyncMock)
+    def test_get_returns_pandas(self, mock):
+        mock.return_value = dataset_data()
+        df = asyncio.run(nasdaqdatalink.aio.get('NSE/OIL', start_date='2015-01-01'))
+        self.assertIsInstance(df, pandas.core.frame.DataFrame)
+        self.assertEqual(mock.call_args,
+                         call('get', 'datasets/NSE/OIL/data',
+                              params={'start_date': '2015-01-01', 'order': 'asc'}))
+
+    @patch.object(AsyncConnection, 'request', new_callable=AsyncMock)
+    def test_get_merges_multiple_datasets(self, mock):
+        mock.side_effect = lambda *args, **kwargs: dataset_data()
+        df = asyncio.run(nasdaqdatalink.aio.get(['NSE/OIL', 'WIKI/AAPL.1']))
+        self.assertEqual(mock.call_count, 2)
+        self.assertEqual(df.columns.tolist(),
+                         ['NSE/OIL - column.1', 'NSE/OIL - column.2', 'NSE/OIL - column.3',
+                          'WIKI/AAPL - column.1', 'WIKI/AAPL - column.2',
+                          'WIKI/AAPL - column.3'])
+
+    def test_get_requests_up_to_max_workers_datasets_at_once(self):
+        in_flight = []
+        most_in_flight = []
+
+        async def request(*args, **kwargs):
+            in_flight.append(1)
+            most_in_flight.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.pop()
+            return dataset_data()
+        codes = ['NSE/OIL', 'WIKI/AAPL', 'WIKI/MSFT', 'WIKI/IBM']
+        with patch.object(AsyncConnection, 'request', side_effect=request):
+            asyncio.run(nasdaqdatalink.aio.get(codes, max_workers=2))
+            self.assertEqual(max(most_in_flight), 2)
+            del most_in_flight[:]
+            with patch.object(ApiConfig, 'max_workers', 3):
+                asyncio.run(nasdaqdatalink.aio.get(codes))
+            self.assertEqual(max(most_in_flight), 3)
+
+    @patch.object(AsyncConnection, 'request', new_callable=AsyncMock)
+    def test_get_handles_not_found_datasets_in_a_list(self, mock):
+        def respond(http_verb, path, **options):
+            if path == 'datasets/WIKI/NOPE/data':
+                raise NotFoundError('not found')
+            return dataset_data()
+        mock.side_effect = respond
+        df = asyncio.run(nasdaqdatalink.aio.get(['NSE/OIL', 'WIKI/NOPE']))
+        self.assertIn('WIKI/NOPE - Not Found', df.columns.tolist())
+
+
+class AsyncGetTableTest(unittest.TestCase):
+
+    def tearDown(self):
+        RequestType.USE_GET_REQUEST = True
+
+    @patch.object(AsyncConnection, 'request', new_callable=AsyncMock)
+    def test_get_table_follows_cursors_when_paginating(self, mock):
+        mock.side_effect = [datatable_page('abc'), datatable_page(None)]
+        df = asyncio.run(nasdaqdatalink.aio.get_table('ZACKS/FC', paginate=True))
+        self.assertEqual(len(df), 8)
+        self.assertEqual(mock.call_args,
+                         call('get', 'datatables/ZACKS/FC', params={'qopts.cursor_id': 'abc'}))
+
+    @patch.object(AsyncConnection, 'request', new_callable=AsyncMock)
+    def test_get_table_warns_without_paginate(self, mock):
+        mock.side_effect = [datatable_page('abc'), datatable_page(None)]
+        with self.assertWarns(UserWarning):
+            df = asyncio.run(nasdaqdatalink.aio.get_table('ZACKS/FC'))
+        self.assertEqual(len(df), 4)
+
+    @patch.object(AsyncConnection, 'request', new_callable=AsyncMock)
+    def test_get_table_respects_page_limit(self, mock):
+        mock.side_effect = lambda *args, **kwargs: datatable_page('abc')
+        with patch.object(ApiConfig, 'page_limit', 2):
+            self.assertRaises(LimitExceededError, asyncio.run,
+                              nasdaqdatalink.aio.get_table('ZACKS/FC', paginate=True))
+        self.assertEqual(mock.call_count, 3)
+
+    @patch.object(AsyncConnection, 'request', new_callable=AsyncMock)
+    def test_get_table_prefetches_pages_without_sending_prefetch(self, mock):
+        mock.side_effect = [datatable_page('abc'), datatable_page('def'), datatable_page(None)]
+        df = asyncio.run(nasdaqdatalink.aio.get_table('ZACKS/FC', paginate=True, prefetch=2))
+        self.assertEqual(len(df), 12)
+        self.assertEqual(mock.call_args_list,
+                         [call('get', 'datatables/ZACKS/FC', params={}),
+                          call('get', 'datatables/ZACKS/FC', params={'qopts.cursor_id': 'abc'}),
+                          call('get', 'datatables/ZACKS/FC', params={'qopts.cursor_id': 'def'})])
+
+    @patch.object(AsyncConnection, 'request', new_callable=AsyncMock)
+    def test_prefetched_pages_respect_page_limit(self, mock):
+        mock.side_effect = lambda *args, **kwargs: datatable_page('abc')
+        with patch.object(ApiConfig, 'page_limit', 2):
+            self.assertRaises(LimitExceededError, asyncio.run, nasdaqdatalink.aio.get_table(
+                'ZACKS/FC', paginate=True, prefetch=1))
+        self.assertEqual(mock.call_count, 3)
+
+    @patch.object(AsyncConnection, 'request', new_callable=AsyncMock)
+    def test_iter_table_yields_one_data_frame_per_page(self, mock):
+        mock.side_effect = [datatable_page('abc'), datatable_page('def'), datatable_page(None)]
+
+        async def collect():
+            return [page async for page in nasdaqdatalink.aio.iter_table('ZACKS/FC')]
+
+        pages = asyncio.run(collect())
+        self.assertEqual(len(pages), 3)
+        self.assertEqual(mock.call_args, call('get', 'datatables/ZACKS/FC',
+                                              params={'qopts.cursor_id': 'def'}))
+        for page in pages:
+            self.assertIsInstance(page, pandas.core.frame.DataFrame)
+            self.assertEqual(len(page), 4)
+
+    @patch.object(AsyncConnection, 'request', new_callable=AsyncMock)
+    def test_get_point_in_time_calls_pit_path(self, mock):
+        mock.return_value = datatable_page(None)
+        df = asyncio.run(nasdaqdatalink.aio.get_point_in_time(
+            'ZACKS/FC', interval='asofdate', date='2020-01-01'))
+        self.assertIsInstance(df, pandas.core.frame.DataFrame)
+        self.assertEqual(mock.call_args,
+                         call('get', 'pit/ZACKS/FC/asofdate/2020-01-01', params={}))
@@ -0,0 +1,144 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+import zipfile
+
+from mock import patch, AsyncMock
+
+import nasdaqdatalink
+import nasdaqdatalink.aio
+from nasdaqdatalink.aio.connection import AsyncConnection
+from nasdaqdatalink.api_config import ApiConfig
+from nasdaqdatalink.model.dataset import Dataset
+from nasdaqdatalink.utils.bulk_store import BulkStore
+
+COLUMN_NAMES = ['Date', 'Open', 'Close']
+
+
+def metadata(http_verb, path, **options):
+    return {'dataset': {'column_names': list(COLUMN_NAMES)}}
+
+
+class BulkStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.bulk_dir = tempfile.mkdtemp()
+        patcher = patch.object(ApiConfig, 'bulk_dir', self.bulk_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.bulk_dir, ignore_errors=True)
+
+    def write_zip(self, name, lines):
+        path = os.path.join(self.bulk_dir, name)
+        with zipfile.ZipFile(path, 'w') as archive:
+            archive.writestr('EOD.csv', '\n'.join(lines) + '\n')
+        return path
+
+    def load_complete(self, **options):
+        return nasdaqdatalink.load_bulkdownload('EOD', self.write_zip('complete.zip', [
+            'AAPL,2015-07-09,1.0,2.0',
+            'AAPL,2015-07-10,3.0,4.0',
+            'AAPL,2015-07-13,5.0,',
+            'MSFT,2015-07-09,7.0,8.0']), **options)
+
+    @patch('nasdaqdatalink.connection.Connection.request_json', side_effect=metadata)
+    def test_get_reads_a_loaded_database(self, mock):
+        self.load_complete()
+        df = nasdaqdatalink.get('EOD/AAPL')
+        nasdaqdatalink.get('EOD/AAPL', start_date='2015-07-10')
+        # only the column names are requested, once
+        self.assertEqual(mock.call_count, 1)
+        self.assertEqual(mock.call_args[0][1], 'datasets/EOD/AAPL/metadata')
+        self.assertEqual(list(df.columns), ['Open', 'Close'])
+        self.assertEqual(df['Open'].tolist(), [1.0, 3.0, 5.0])
+        self.assertEqual(df.index.name, 'Date')
+
+    @patch('nasdaqdatalink.connection.Connection.request_json')
+    def test_get_answers_dataset_parameters_from_the_store(self, mock):
+        self.load_complete(column_names=COLUMN_NAMES)
+        df = nasdaqdatalink.get('EOD/AAPL', start_date='2015-07-10', end_date='2015-07-13',
+                                order='desc', rows=1)
+        self.assertEqual(df['Open'].tolist(), [5.0])
+        df = nasdaqdatalink.get('EOD/AAPL.2')
+        self.assertEqual(list(df.columns), ['Close'])
+        self.assertEqual(df['Close'].tolist()[:2], [2.0, 4.0])
+        df = nasdaqdatalink.get(['EOD/AAPL.1', 'EOD/MSFT.1'])
+        self.assertEqual(list(df.columns), ['EOD/AAPL - Open', 'EOD/MSFT - Open'])
+        self.assertFalse(mock.called)
+
+    @patch('nasdaqdatalink.connection.Connection.request_json')
+    def test_partial_downloads_update_the_stored_rows(self, mock):
+        self.load_complete(column_names=COLUMN_NAMES)
+        nasdaqdatalink.load_bulkdownload('EOD', self.write_zip('partial.zip', [
+            'AAPL,2015-07-13,5.5,6.0',
+            'AAPL,2015-07-14,9.0,10.0',
+            'IBM,2015-07-14,11.0,12.0']), download_type='partial')
+        self.assertEqual(nasdaqdatalink.get('EOD/AAPL')['Open'].tolist(),
+                         [1.0, 3.0, 5.5, 9.0])
+        self.assertEqual(nasdaqdatalink.get('EOD/IBM')['Close'].tolist(), [12.0])
+        self.assertFalse(mock.called)
+
+    def test_complete_downloads_replace_the_stored_rows(self):
+        self.load_complete(column_names=COLUMN_NAMES)
+        store = nasdaqdatalink.load_bulkdownload('EOD', self.write_zip('next.zip', [
+            'AAPL,2015-07-14,9.0,10.0']), column_names=COLUMN_NAMES)
+        self.assertFalse(store.has_dataset('MSFT'))
+        self.assertEqual(store.response_data({'dataset_code': 'AAPL'},
+                                             COLUMN_NAMES)['dataset_data']['data'],
+                         [['2015-07-14', 9.0, 10.0]])
+
+    @patch.object(AsyncConnection, 'request', new_callable=AsyncMock)
+    def test_aio_get_reads_the_store_off_the_event_loop(self, mock):
+        self.load_complete(column_names=COLUMN_NAMES)
+        threads = []
+        snapshot_response_data = Dataset.snapshot_response_data
+
+        def record(*args):
+            threads.append(threading.current_thread())
+            return snapshot_response_data(*args)
+        with patch.object(Dataset, 'snapshot_response_data', record):
+            df = asyncio.run(nasdaqdatalink.aio.get('EOD/AAPL'))
+        self.assertEqual(df['Open'].tolist(), [1.0, 3.0, 5.0])
+        self.assertEqual(len(threads), 1)
+        self.assertNotIn(threading.main_thread(), threads)
+        self.assertFalse(mock.called)
+
+    @patch('nasdaqdatalink.model.data.Data.all')
+    def test_get_requests_what_the_store_cannot_answer(self, mock):
+        self.load_complete(column_names=COLUMN_NAMES)
+        nasdaqdatalink.get('EOD/AAPL', transform='rdiff')
+        nasdaqdatalink.get('EOD/IBM')
+        nasdaqdatalink.get('EOD/AAPL', snapshot=False)
+        nasdaqdatalink.remove_bulkdownload('EOD')
+        nasdaqdatalink.get('EOD/AAPL')
+        self.assertEqual(mock.call_count, 4)
+
+    @patch('nasdaqdatalink.model.data.Data.all')
+    def test_get_requests_the_api_once_the_store_is_stale(self, mock):
+        self.load_complete(column_names=COLUMN_NAMES)
+        with patch('nasdaqdatalink.utils.bulk_store.time.time',
+                   return_value=time.time() + ApiConfig.bulk_max_age + 1):
+            nasdaqdatalink.get('EOD/AAPL')
+        self.assertEqual(mock.call_count, 1)
+
+    def test_values_keep_the_types_the_api_returns(self):
+        store = nasdaqdatalink.load_bulkdownload('EOD', self.write_zip('complete.zip', [
+            'AAPL,2015-07-09,1.5,100,-2e3,00123,NaN,Q2']),
+            column_names=['Date', 'A', 'B', 'C', 'D', 'E', 'F'])
+        row = store.response_data({'dataset_code': 'AAPL'},
+                                  COLUMN_NAMES)['dataset_data']['data'][0]
+        self.assertEqual(row, ['2015-07-09', 1.5, 100, -2000.0, '00123', 'NaN', 'Q2'])
+        self.assertIsInstance(row[2], int)
+
+    @patch('nasdaqdatalink.model.database.Database.bulk_download_to_file')
+    def test_bulkdownload_can_load_the_downloaded_file(self, mock):
+        mock.return_value = self.write_zip('partial.zip', ['AAPL,2015-07-14,9.0,10.0'])
+        nasdaqdatalink.bulkdownload('EOD', download_type='partial', load=True)
+        self.assertEqual(mock.call_args[1]['params'], {'download_type': 'partial'})
+        self.assertTrue(BulkStore.open('EOD').has_dataset('AAPL'))
@@ -8,6 +8,7 @@ from test.test_retries import ModifyRetrySettingsTestCase
 from test.helpers.httpretty_extension import httpretty
 import json
 from mock import patch, call
+import os
 from nasdaqdatalink.version import VERSION
 from parameterized import parameterized
 
@@ -81,3 +82,38 @@ class ConnectionTest(ModifyRetrySettingsTestCase):
                                  'request-source-version': VERSION},
                         params={'per_page': 10, 'page': 2})
         self.assertEqual(mock.call_args, expected)
+
+
+class ConnectionSessionTest(ModifyRetrySettingsTestCase):
+
+    def setUp(self):
+        super(ConnectionSessionTest, self).setUp()
+        self.default_pool_maxsize = ApiConfig.pool_maxsize
+        Connection.reset_session()
+
+    def tearDown(self):
+        super(ConnectionSessionTest, self).tearDown()
+        ApiConfig.pool_maxsize = self.default_pool_maxsize
+        Connection.reset_session()
+
+    def test_session_is_reused_between_calls(self):
+        self.assertIs(Connection.get_session(), Connection.get_session())
+
+    def test_session_is_rebuilt_when_retry_settings_change(self):
+        ApiConfig.use_retries = True
+        session = Connection.get_session()
+        ApiConfig.number_of_retries = 42
+        new_session = Connection.get_session()
+        self.assertIsNot(session, new_session)
+        retries = new_session.get_adapter(ApiConfig.api_protocol).max_retries
+        self.assertEqual(retries.total, 42)
+
+    def test_session_uses_configured_pool_size(self):
+        ApiConfig.pool_maxsize = 32
+        adapter = Connection.get_session().get_adapter(ApiConfig.api_protocol)
+        self.assertEqual(adapter._pool_maxsize, 32)
+
+    def test_session_is_rebuilt_in_forked_process(self):
+        session = Connection.get_session()
+        with patch('nasdaqdatalink.connection.os.getpid', return_value=os.getpid() + 1):
+            self.assertIsNot(session, Connection.get_session())
@@ -5,11 +5,13 @@ import json
 import datetime
 import pandas
 import numpy
+import pyarrow
 import six
 from nasdaqdatalink.model.data import Data
+from nasdaqdatalink.model.data_list import DataList
 from mock import patch, call
 from test.factories.dataset_data import DatasetDataFactory
-from nasdaqdatalink.errors.data_link_error import InvalidDataError
+from nasdaqdatalink.errors.data_link_error import InvalidDataError, InvalidRequestError
 
 
 class DataTest(unittest.TestCase):
@@ -153,3 +155,207 @@ class ListDataTest(unittest.TestCase):
                                    'https://data.nasdaq.com/api/v3/datasets*'),
                                body=json.dumps(dataset_data))
         self.assertRaises(InvalidDataError, lambda: Data.all())
+
+
+class ColumnarDataListTest(unittest.TestCase):
+
+    def setUp(self):
+        self.data_list = DataList(Data, [['2015-07-11', 'AAPL', 456.9],
+                                         ['2015-07-13', 'MSFT', 433.3]], self.meta())
+
+    # column metadata is converted in place, so build it for each list
+    def meta(self):
+        return {'columns': [{'name': 'per_end_date', 'type': 'Date'},
+                            {'name': 'ticker', 'type': 'String'},
+                            {'name': 'tot_oper_exp', 'type': 'BigDecimal(11,4)'}],
+                'next_cursor_id': None}
+
+    def test_rows_are_not_materialized_to_build_data_frame(self):
+        with patch.object(Data, '__init__') as mock:
+            df = self.data_list.to_pandas()
+        self.assertEqual(mock.call_count, 0)
+        self.assertEqual(df['ticker'].tolist(), ['AAPL', 'MSFT'])
+
+    def test_indexing_materializes_data_objects(self):
+        self.assertEqual(len(self.data_list), 2)
+        self.assertIsInstance(self.data_list[-1], Data)
+        self.assertEqual(self.data_list[1].ticker, 'MSFT')
+        self.assertEqual(self.data_list[0].per_end_date, datetime.date(2015, 7, 11))
+        self.assertEqual([x.ticker for x in self.data_list[0:2]], ['AAPL', 'MSFT'])
+        self.assertRaises(IndexError, lambda: self.data_list[2])
+
+    def test_iteration_yields_data_objects(self):
+        self.assertEqual([x.ticker for x in self.data_list], ['AAPL', 'MSFT'])
+
+    def test_to_list_converts_dates(self):
+        self.assertEqual(self.data_list.to_list(),
+                         [[datetime.date(2015, 7, 11), 'AAPL', 456.9],
+                          [datetime.date(2015, 7, 13), 'MSFT', 433.3]])
+
+    def test_extend_appends_columns_of_ragged_pages(self):
+        other = DataList(Data, [['2015-07-14', 'AAPL', 419.1], ['2015-07-15', 476.5]],
+                         self.meta())
+        self.data_list.extend(other)
+        self.assertEqual(len(self.data_list), 4)
+        self.assertEqual(self.data_list.to_pandas()['ticker'].tolist(),
+                         ['AAPL', 'MSFT', 'AAPL', 476.5])
+        self.assertEqual(self.data_list[3].to_list(), [datetime.date(2015, 7, 15), 476.5, None])
+
+    def test_values_become_the_storage_once_read(self):
+        self.data_list.values.pop()
+        self.assertEqual(len(self.data_list), 1)
+        self.assertEqual(len(self.data_list.to_pandas()), 1)
+
+    def test_empty_list_builds_empty_data_frame(self):
+        df = DataList(Data, [], self.meta()).to_pandas()
+        self.assertEqual(df.columns.tolist(), ['per_end_date', 'ticker', 'tot_oper_exp'])
+        self.assertEqual(len(df), 0)
+
+    def test_date_columns_are_parsed_once_per_column(self):
+        with patch('nasdaqdatalink.model.data_mixin.pd.to_datetime',
+                   wraps=pandas.to_datetime) as mock:
+            df = self.data_list.to_pandas()
+        self.assertEqual(mock.call_count, 1)
+        self.assertTrue(pandas.api.types.is_datetime64_any_dtype(df['per_end_date']))
+        self.assertEqual(df['per_end_date'][1], pandas.Timestamp('2015-07-13'))
+
+    def test_datetime_columns_are_parsed_as_utc(self):
+        meta = {'columns': [{'name': 'updated_at', 'type': 'datetime'},
+                            {'name': 'ticker', 'type': 'String'}],
+                'next_cursor_id': None}
+        df = DataList(Data, [['2015-07-24T02:39:40.624Z', '2015-07-24'],
+                             [None, 'AAPL']], meta).to_pandas()
+        self.assertEqual(df['updated_at'][0],
+                         pandas.Timestamp('2015-07-24 02:39:40.624', tz='UTC'))
+        self.assertTrue(pandas.isnull(df['updated_at'][1]))
+        # only columns typed as dates are parsed
+        self.assertEqual(df['ticker'][0], '2015-07-24')
+
+    def test_page_from_response_leaves_data_rows_unconverted(self):
+        data_list = Data.page_from_response(
+            {'datatable': {'data': [['2015-07-11', 'AAPL', 456.9]],
+                           'columns': self.meta()['columns']},
+             'meta': {'next_cursor_id': None}})
+        self.assertEqual(data_list._columns[0], ['2015-07-11'])
+        self.assertEqual(data_list[0].per_end_date, datetime.date(2015, 7, 11))
+
+
+class DataListDtypesTest(unittest.TestCase):
+
+    def setUp(self):
+        meta = {'columns': [{'name': 'date', 'type': 'Date'},
+                            {'name': 'ticker', 'type': 'String'},
+                            {'name': 'shares', 'type': 'Integer'},
+                            {'name': 'employees', 'type': 'Integer'},
+                            {'name': 'price', 'type': 'BigDecimal(34,12)'},
+                            {'name': 'ratio', 'type': 'Double'}],
+                'next_cursor_id': None}
+        self.data_list = DataList(Data, [['2015-07-11', 'AAPL', 5000000000, 1, 125.5, 0.5],
+                                         ['2015-07-13', 'AAPL', 6, None, None, 1]], meta)
+
+    def test_columns_are_built_with_the_declared_dtypes(self):
+        df = self.data_list.to_pandas()
+        self.assertTrue(pandas.api.types.is_datetime64_any_dtype(df['date']))
+        self.assertNotIsInstance(df['ticker'].dtype, pandas.CategoricalDtype)
+        self.assertEqual(df['shares'].dtype, numpy.int64)
+        self.assertEqual(df['employees'].dtype, pandas.Int64Dtype())
+        self.assertTrue(df['employees'].isna()[1])
+        self.assertEqual(df['price'].dtype, numpy.float64)
+        self.assertEqual(df['ratio'].dtype, numpy.float64)
+
+    def test_downcast_uses_32_bit_types_where_values_fit(self):
+        df = self.data_list.to_pandas(downcast=True)
+        self.assertEqual(df['shares'].dtype, numpy.int64)
+        self.assertEqual(df['employees'].dtype, pandas.Int32Dtype())
+        self.assertEqual(df['price'].dtype, numpy.float32)
+        self.assertEqual(df['ratio'].dtype, numpy.float32)
+
+    def test_categorical_string_columns(self):
+        self.assertIsInstance(self.data_list.to_pandas(categorical=True)['ticker'].dtype,
+                              pandas.CategoricalDtype)
+        df = self.data_list.to_pandas(categorical=['date', 'ticker'])
+        self.assertIsInstance(df['ticker'].dtype, pandas.CategoricalDtype)
+        self.assertTrue(pandas.api.types.is_datetime64_any_dtype(df['date']))
+
+    def test_values_not_matching_the_declared_type_are_kept(self):
+        meta = {'columns': [{'name': 'shares', 'type': 'Integer'},
+                            {'name': 'price', 'type': 'Double'}]}
+        df = DataList(Data, [[1.5, 'n/a']], meta).to_pandas()
+        self.assertEqual(df['shares'][0], 1.5)
+        self.assertEqual(df['price'][0], 'n/a')
+
+
+class DataListArrowTest(unittest.TestCase):
+
+    def setUp(self):
+        meta = {'columns': [{'name': 'date', 'type': 'Date'},
+                            {'name': 'updated_at', 'type': 'datetime'},
+                            {'name': 'ticker', 'type': 'String'},
+                            {'name': 'shares', 'type': 'Integer'},
+                            {'name': 'price', 'type': 'BigDecimal(34,12)'}],
+                'next_cursor_id': None}
+        self.data_list = DataList(Data, [['2015-07-11', '2015-07-24T02:39:40Z', 'AAPL', 5, 1],
+                                         ['2015-07-13', None, 'MSFT', None, 125.5]], meta)
+
+    def test_table_is_built_from_columns_with_declared_types(self):
+        with patch.object(Data, '__init__') as mock:
+            table = self.data_list.to_arrow()
+        self.assertEqual(mock.call_count, 0)
+        self.assertEqual(table.schema, pyarrow.schema([
+            ('date', pyarrow.date32()), ('updated_at', pyarrow.timestamp('us', tz='UTC')),
+            ('ticker', pyarrow.string()), ('shares', pyarrow.int64()),
+            ('price', pyarrow.float64())]))
+        self.assertEqual(table.column('date').to_pylist(),
+                         [datetime.date(2015, 7, 11), datetime.date(2015, 7, 13)])
+        self.assertEqual(table.column('shares').to_pylist(), [5, None])
+        self.assertEqual(table.column('price').to_pylist(), [1.0, 125.5])
+
+    def test_materialized_rows_build_the_same_table(self):
+        table = self.data_list.to_arrow()
+        self.data_list.values
+        self.assertTrue(self.data_list.to_arrow().equals(table))
+
+    def test_values_not_matching_the_declared_type_are_kept_as_text(self):
+        meta = {'columns': [{'name': 'ticker', 'type': 'String'},
+                            {'name': 'shares', 'type': 'Integer'}]}
+        table = DataList(Data, [['AAPL', 1.5], [440.0, 2]], meta).to_arrow()
+        self.assertEqual(table.column('ticker').to_pylist(), ['AAPL', '440.0'])
+        self.assertEqual(table.column('shares').to_pylist(), ['1.5', '2'])
+
+    def test_empty_list_builds_empty_typed_table(self):
+        meta = {'columns': [{'name': 'date', 'type': 'Date'}]}
+        table = DataList(Data, [], meta).to_arrow()
+        self.assertEqual(table.num_rows, 0)
+        self.assertEqual(table.schema.field('date').type, pyarrow.date32())
+
+    def test_dataset_first_column_is_the_date(self):
+        data = DatasetDataFactory.build()
+        table = DataList(Data, data.pop('data'), data).to_arrow()
+        self.assertEqual(table.column_names, data['column_names'])
+        self.assertEqual(table.schema.field(0).type, pyarrow.date32())
+        self.assertEqual(table.schema.field(1).type, pyarrow.float64())
+
+    def test_to_format_returns_the_requested_type(self):
+        self.assertIsInstance(self.data_list.to_format('arrow'), pyarrow.Table)
+        self.assertIsInstance(self.data_list.to_format('numpy'), numpy.recarray)
+        self.assertIsInstance(self.data_list.to_format('pandas'), pandas.DataFrame)
+
+    def test_pandas_options_apply_to_arrow_and_numpy(self):
+        table = self.data_list.to_format('arrow', downcast=True, categorical=['ticker'])
+        self.assertEqual(table.schema.field('shares').type, pyarrow.int32())
+        self.assertEqual(table.schema.field('price').type, pyarrow.float32())
+        self.assertEqual(table.schema.field('ticker').type,
+                         pyarrow.dictionary(pyarrow.int32(), pyarrow.string()))
+        self.assertEqual(table.column('ticker').to_pylist(), ['AAPL', 'MSFT'])
+        large = DataList(Data, [[5000000000]], {'columns': [{'name': 'shares',
+                                                             'type': 'Integer'}]})
+        self.assertEqual(large.to_format('arrow', downcast=True).schema.field('shares').type,
+                         pyarrow.int64())
+        records = self.data_list.to_format('numpy', downcast=True)
+        self.assertEqual(records.dtype['price'], numpy.float32)
+        self.assertRaises(InvalidRequestError, self.data_list.to_format, 'numpy',
+                          categorical=True)
+
+    @patch('nasdaqdatalink.model.data_mixin.pa', None)
+    def test_raises_import_error_without_pyarrow(self):
+        self.assertRaises(ImportError, self.data_list.to_arrow)
@@ -1,9 +1,12 @@
 import json
+import os
 import re
+import shutil
+import tempfile
 import unittest
 
 import six
-from mock import call, mock_open, patch
+from mock import call, patch, Mock
 from six.moves.urllib.parse import parse_qs, urlparse
 
 from nasdaqdatalink.api_config import ApiConfig
@@ -125,10 +128,12 @@ class BulkDownloadDatabaseTest(ModifyRetrySettingsTestCase):
         self.database = Database(database['database']['database_code'], database['database'])
         ApiConfig.api_key = 'api_token'
         ApiConfig.api_version = '2015-04-09'
+        self.directory = tempfile.mkdtemp()
 
     def tearDown(self):
         httpretty.disable()
         httpretty.reset()
+        shutil.rmtree(self.directory, ignore_errors=True)
 
     def test_get_bulk_downnload_url_with_download_type(self):
         url = self.database.bulk_download_url(params={'download_type': 'partial'})
@@ -147,12 +152,11 @@ class BulkDownloadDatabaseTest(ModifyRetrySettingsTestCase):
                              'api_key': ['api_token'], 'api_version': ['2015-04-09']})
 
     def test_bulk_download_to_fileaccepts_download_type(self):
-        m = mock_open()
         with patch.object(Connection, 'request') as mock_method:
-            mock_method.return_value.url = 'https://www.blah.com/download/db.zip'
-            with patch('nasdaqdatalink.model.database.open', m, create=True):
-                self.database.bulk_download_to_file(
-                    '.', params={'download_type': 'partial'})
+            mock_method.return_value = Mock(url='https://www.blah.com/download/db.zip',
+                                            headers={}, **{'iter_content.return_value': []})
+            self.database.bulk_download_to_file(
+                self.directory, params={'download_type': 'partial'})
 
         expected = call('get',
                         'databases/NSE/data',
@@ -161,12 +165,13 @@ class BulkDownloadDatabaseTest(ModifyRetrySettingsTestCase):
         self.assertEqual(mock_method.call_args, expected)
 
     def test_bulk_download_to_file_writes_to_file(self):
-        m = mock_open()
-        with patch('nasdaqdatalink.model.database.open', m, create=True):
-            self.database.bulk_download_to_file('.')
+        file_path = self.database.bulk_download_to_file(self.directory)
 
-        m.assert_called_once_with(six.u('./db.zip'), 'wb')
-        m().write.assert_called_once_with(six.b('{}'))
+        self.assertEqual(file_path, self.directory + '/db.zip')
+        with open(file_path, 'rb') as f:
+            self.assertEqual(f.read(), six.b('{}'))
+        # the partial file and its progress are gone once the download completed
+        self.assertEqual(os.listdir(self.directory), ['db.zip'])
 
     def test_bulk_download_raises_exception_when_no_path(self):
         self.assertRaises(
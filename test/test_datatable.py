@@ -4,7 +4,7 @@ import unittest
 
 import httpretty
 import six
-from mock import call, mock_open, patch
+from mock import call, patch
 from six.moves.urllib.parse import urlparse
 
 from nasdaqdatalink.api_config import ApiConfig
@@ -150,8 +150,6 @@ class ExportDataTableTest(unittest.TestCase):
 
     @parameterized.expand(['GET', 'POST'])
     def test_download_generated_file(self, request_method):
-        m = mock_open()
-
         httpretty.register_uri(getattr(httpretty, request_method),
                                re.compile(
                                    'https://data.nasdaq.com/api/v3/datatables/*'),
@@ -165,10 +163,10 @@ class ExportDataTableTest(unittest.TestCase):
                                }),
                                status=200)
 
-        with patch('nasdaqdatalink.model.datatable.urlopen', m, create=True):
+        with patch('nasdaqdatalink.utils.file_downloader.FileDownloader.download_link') as m:
             self.datatable.download_file('.', params={})
 
-        self.assertEqual(m.call_count, 1)
+        m.assert_called_once_with('https://www.blah.com/download/db.zip', './AUSBS_D.zip')
 
     @parameterized.expand(['GET', 'POST'])
     def test_bulk_download_raises_exception_when_no_path(self, request_method):
@@ -0,0 +1,115 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from mock import patch, call
+
+import nasdaqdatalink
+from nasdaqdatalink.api_config import ApiConfig
+from nasdaqdatalink.errors.data_link_error import InternalServerError
+from nasdaqdatalink.model.datatable import Datatable
+from nasdaqdatalink.util import Util
+from nasdaqdatalink.utils.export_poller import ExportPoller
+
+
+class ExportServer(object):
+    # the export of each table is fresh after `polls` requests
+    def __init__(self, polls):
+        self.polls = polls
+        self.requests = {}
+        self.lock = threading.Lock()
+
+    def request_file_link(self, datatable, **options):
+        with self.lock:
+            self.requests[datatable.code] = self.requests.get(datatable.code, 0) + 1
+            if self.requests[datatable.code] < self.polls[datatable.code]:
+                return None, None
+        return 'https://www.blah.com/download/%s.zip' % datatable.code.replace('/', '_'), None
+
+
+class SteppedClock(object):
+    # the time of a poller that moves on to its next poll instead of waiting for it
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self):
+        return self.now
+
+
+class SteppedCondition(threading.Condition):
+    def __init__(self, clock):
+        super(SteppedCondition, self).__init__()
+        self.clock = clock
+
+    def wait(self, timeout=None):
+        if timeout is None:
+            return super(SteppedCondition, self).wait()
+        self.clock.now += timeout
+        return True
+
+
+class InlineExecutor(object):
+    # polls one export at a time on the scheduling thread
+    def submit(self, fn, *args):
+        fn(*args)
+
+
+class ExportPollerTest(unittest.TestCase):
+
+    def setUp(self):
+        for name, value in [('export_poll_interval', 0.01), ('export_poll_max_interval', 0.05)]:
+            patcher = patch.object(ApiConfig, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    @patch('nasdaqdatalink.model.datatable.sleep')
+    @patch.object(Datatable, '_request_file_link')
+    def test_export_link_polls_less_and_less_often(self, request_file_link, sleep):
+        request_file_link.side_effect = [(None, None)] * 4 + [(None, 7), ('link', None)]
+        self.assertEqual(Datatable('AUSBS/D').export_link(), 'link')
+        self.assertEqual(sleep.call_args_list,
+                         [call(0.01), call(0.02), call(0.04), call(0.05), call(7)])
+
+    def test_exports_of_many_tables_are_collected_as_they_become_fresh(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        clock = SteppedClock()
+        poller = ExportPoller()
+        poller._executor = InlineExecutor()
+        poller._condition = SteppedCondition(clock)
+        server = ExportServer({'MER/F1': 6, 'ZACKS/FC': 1, 'AUSBS/D': 3})
+        completed = []
+        with patch.object(ExportPoller, '_shared', poller), \
+                patch('nasdaqdatalink.utils.export_poller.time', clock), \
+                patch.object(Datatable, '_request_file_link', autospec=True,
+                             side_effect=server.request_file_link), \
+                patch('nasdaqdatalink.utils.file_downloader.FileDownloader.download_link'):
+            # nothing is polled before every export is submitted
+            with poller._condition:
+                futures = [nasdaqdatalink.export_table_async(code, filename=directory)
+                           for code in ['MER/F1', 'ZACKS/FC', 'AUSBS/D']]
+                for future in futures:
+                    future.add_done_callback(lambda future: completed.append(future.result()))
+            for future in futures:
+                future.result(5)
+
+        self.assertEqual(completed, [os.path.join(directory, 'ZACKS_FC.zip'),
+                                     os.path.join(directory, 'AUSBS_D.zip'),
+                                     os.path.join(directory, 'MER_F1.zip')])
+        self.assertEqual(server.requests, {'MER/F1': 6, 'ZACKS/FC': 1, 'AUSBS/D': 3})
+        # polled after 0.01, 0.02, 0.04, 0.05 and 0.05 seconds
+        self.assertAlmostEqual(clock.now, 0.17)
+
+    @patch.object(Datatable, '_request_file_link')
+    def test_errors_are_raised_by_the_future(self, request_file_link):
+        request_file_link.side_effect = InternalServerError('something went wrong')
+        future = nasdaqdatalink.export_table_async('AUSBS/D')
+        self.assertRaises(InternalServerError, future.result, 5)
+
+    def test_retry_after_is_read_as_seconds_or_a_date(self):
+        self.assertEqual(Util.retry_after({'Retry-After': '12'}), 12)
+        self.assertEqual(Util.retry_after({'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}), 0)
+        self.assertIsNone(Util.retry_after({'Retry-After': 'soon'}))
+        self.assertIsNone(Util.retry_after({}))
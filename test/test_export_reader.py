@@ -0,0 +1,108 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+
+import pyarrow.parquet as pq
+from mock import patch, MagicMock
+
+import nasdaqdatalink
+from nasdaqdatalink.errors.data_link_error import DataLinkError, InvalidRequestError
+from nasdaqdatalink.utils.export_reader import ExportReader, ZipStream
+
+COLUMNS = [{'name': 'ticker', 'type': 'String'},
+           {'name': 'date', 'type': 'Date'},
+           {'name': 'shares', 'type': 'Integer'},
+           {'name': 'price', 'type': 'BigDecimal(12,4)'}]
+CSV = ('ticker,date,shares,price\n' +
+       ''.join('T%s,2020-01-%02d,%s,%s.5\n' % (i % 3, i % 28 + 1, i, i) for i in range(2000)))
+
+
+def zipped(content, compression=zipfile.ZIP_DEFLATED, data_descriptor=False):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression) as archive:
+        if data_descriptor:
+            # written as a stream, the sizes and CRC follow the data
+            with archive.open('AUSBS_D.csv', 'w') as f:
+                f.write(content.encode('utf-8'))
+        else:
+            archive.writestr('AUSBS_D.csv', content)
+    return buffer.getvalue()
+
+
+def chunked(data, size=1000):
+    return [data[start:start + size] for start in range(0, len(data), size)]
+
+
+class ZipStreamTest(unittest.TestCase):
+
+    def test_the_first_file_is_read_while_the_zip_arrives(self):
+        for options in [{}, {'data_descriptor': True}, {'compression': zipfile.ZIP_STORED}]:
+            stream = ZipStream(chunked(zipped(CSV, **options)))
+            self.assertEqual(io.BufferedReader(stream).read().decode('utf-8'), CSV)
+
+    def test_corrupted_and_truncated_zips_are_rejected(self):
+        data = bytearray(zipped(CSV, compression=zipfile.ZIP_STORED))
+        data[100] ^= 0xFF
+        self.assertRaises(DataLinkError, io.BufferedReader(ZipStream([bytes(data)])).read)
+        self.assertRaises(DataLinkError, io.BufferedReader(ZipStream([zipped(CSV)[:500]])).read)
+        self.assertRaises(DataLinkError, ZipStream, [b'ticker,date\n'])
+
+
+class ExportReaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.reader = ExportReader(COLUMNS, chunk_size=4096)
+
+    def test_exports_are_read_into_typed_data_frames(self):
+        df = self.reader.read(chunked(zipped(CSV)), 'pandas', downcast=True)
+        self.assertEqual(len(df), 2000)
+        self.assertEqual(df['date'].dtype.kind, 'M')
+        self.assertEqual(str(df['shares'].dtype), 'int32')
+        self.assertEqual(str(df['price'].dtype), 'float32')
+        self.assertEqual(df['ticker'].tolist()[:3], ['T0', 'T1', 'T2'])
+
+    def test_exports_are_read_into_arrow_tables(self):
+        table = self.reader.read(chunked(zipped(CSV)), 'arrow')
+        self.assertEqual(str(table.schema.field('date').type), 'date32[day]')
+        self.assertEqual(str(table.schema.field('shares').type), 'int64')
+        self.assertEqual(table.column('price').to_pylist()[1], 1.5)
+
+    def test_exports_are_written_to_parquet(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, True)
+        path = os.path.join(directory, 'AUSBS_D.parquet')
+        self.assertEqual(self.reader.read(chunked(zipped(CSV)), 'parquet:' + path), path)
+        self.assertEqual(pq.read_table(path).num_rows, 2000)
+        self.assertEqual(os.listdir(directory), ['AUSBS_D.parquet'])
+
+    def test_unknown_formats_are_rejected(self):
+        for into in ['csv', 'parquet:']:
+            self.assertRaises(InvalidRequestError, ExportReader.validate, into)
+
+    @patch('nasdaqdatalink.connection.Connection.get_session')
+    @patch('nasdaqdatalink.model.datatable.Datatable.export_link')
+    @patch('nasdaqdatalink.connection.Connection.request_json')
+    def test_export_table_reads_the_export_link(self, request_json, export_link, get_session):
+        request_json.return_value = {'datatable': {'columns': COLUMNS}}
+        export_link.return_value = 'https://www.blah.com/download/db.zip'
+        response = MagicMock(status_code=200)
+        response.iter_content.return_value = chunked(zipped(CSV))
+        get_session.return_value.get.return_value = response
+
+        df = nasdaqdatalink.export_table('AUSBS/D', into='pandas', ticker='T1',
+                                         categorical=['ticker'])
+        export_link.assert_called_once_with(ticker='T1')
+        self.assertEqual(get_session.return_value.get.call_args[0][0],
+                         'https://www.blah.com/download/db.zip')
+        self.assertEqual(str(df['ticker'].dtype), 'category')
+        self.assertTrue(response.close.called)
+
+    @patch('nasdaqdatalink.model.datatable.Datatable.export_link')
+    def test_export_table_rejects_a_filename_with_into(self, export_link):
+        for export in [nasdaqdatalink.export_table, nasdaqdatalink.export_table_async]:
+            self.assertRaises(InvalidRequestError, export, 'AUSBS/D', into='pandas',
+                              filename='/tmp/AUSBS_D.zip')
+        self.assertFalse(export_link.called)
@@ -0,0 +1,186 @@
+import base64
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import unittest
+
+import requests
+from mock import patch, Mock, MagicMock
+
+from nasdaqdatalink.errors.data_link_error import DataLinkError
+from nasdaqdatalink.model.database import Database
+from nasdaqdatalink.utils.file_downloader import FileDownloader
+
+CONTENT = bytes(bytearray(range(256))) * 40
+
+
+def streamed_response(content, headers=None, status_code=200, fail_after=None):
+    # fail_after drops the connection once that many bytes were sent
+    response = MagicMock(status_code=status_code, headers=headers or {},
+                         url='https://www.blah.com/download/db.zip')
+
+    def iter_content(chunk_size):
+        for start in range(0, len(content), chunk_size):
+            if fail_after is not None and start >= fail_after:
+                raise requests.exceptions.ChunkedEncodingError('connection dropped')
+            yield content[start:start + chunk_size]
+    response.iter_content.side_effect = iter_content
+    return response
+
+
+class RangeSession(object):
+    # answers Range requests from CONTENT, remembering the ranges requested
+    def __init__(self, status_code=206, missing_bytes=0):
+        self.status_code = status_code
+        self.missing_bytes = missing_bytes
+        self.ranges = []
+        self.lock = threading.Lock()
+
+    def get(self, url, headers=None, **options):
+        first_byte, last_byte = [int(value) for value in
+                                 re.match(r'bytes=(\d+)-(\d+)', headers['Range']).groups()]
+        with self.lock:
+            self.ranges.append((first_byte, last_byte))
+        return streamed_response(CONTENT[first_byte:last_byte + 1 - self.missing_bytes],
+                                 status_code=self.status_code)
+
+
+class FileDownloaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.directory, 'db.zip')
+        self.downloader = FileDownloader(segments=3, segment_min_size=1024, chunk_size=100)
+        self.headers = {'Accept-Ranges': 'bytes', 'Content-Length': str(len(CONTENT))}
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def read_file(self):
+        with open(self.file_path, 'rb') as f:
+            return f.read()
+
+    def test_files_served_with_ranges_are_downloaded_in_segments(self):
+        response = streamed_response(CONTENT, self.headers)
+        session = RangeSession()
+        with patch('nasdaqdatalink.connection.Connection.get_session', return_value=session):
+            self.downloader.download(response, self.file_path)
+
+        self.assertEqual(self.read_file(), CONTENT)
+        self.assertEqual(sorted(session.ranges), [(0, 3413), (3414, 6827), (6828, 10239)])
+        self.assertTrue(response.close.called)
+        self.assertFalse(response.iter_content.called)
+
+    def test_files_without_ranges_or_too_small_are_streamed(self):
+        for content, headers in [(CONTENT, {'Content-Length': str(len(CONTENT))}),
+                                 (CONTENT[:1000], {'Accept-Ranges': 'bytes',
+                                                   'Content-Length': '1000'}),
+                                 (CONTENT, {'Accept-Ranges': 'bytes'})]:
+            response = streamed_response(content, headers)
+            self.downloader.download(response, self.file_path)
+            response.iter_content.assert_called_once_with(100)
+            self.assertEqual(self.read_file(), content)
+
+    def test_segments_fail_when_the_server_ignores_the_range(self):
+        with patch('nasdaqdatalink.connection.Connection.get_session',
+                   return_value=RangeSession(status_code=200)):
+            self.assertRaises(DataLinkError, self.downloader.download,
+                              streamed_response(CONTENT, self.headers), self.file_path)
+
+    def test_segments_fail_when_they_end_early(self):
+        with patch('nasdaqdatalink.connection.Connection.get_session',
+                   return_value=RangeSession(missing_bytes=10)):
+            self.assertRaises(DataLinkError, self.downloader.download,
+                              streamed_response(CONTENT, self.headers), self.file_path)
+
+    def test_interrupted_downloads_resume_from_the_bytes_written(self):
+        self.headers['ETag'] = '"v1"'
+        session = RangeSession()
+        downloader = FileDownloader(chunk_size=100, retries=1)
+        with patch('nasdaqdatalink.connection.Connection.get_session', return_value=session):
+            downloader.download(streamed_response(CONTENT, self.headers, fail_after=5000),
+                                self.file_path)
+
+        self.assertEqual(session.ranges, [(5000, 10239)])
+        self.assertEqual(self.read_file(), CONTENT)
+        self.assertEqual(os.listdir(self.directory), ['db.zip'])
+
+    def test_downloads_left_unfinished_resume_in_the_next_call(self):
+        self.headers['ETag'] = '"v1"'
+        downloader = FileDownloader(chunk_size=100, retries=0)
+        with patch('nasdaqdatalink.connection.Connection.get_session',
+                   return_value=RangeSession(status_code=500)):
+            self.assertRaises(DataLinkError, downloader.download,
+                              streamed_response(CONTENT, self.headers, fail_after=3000),
+                              self.file_path)
+        with open(self.file_path + '.part.json') as f:
+            self.assertEqual(json.load(f)['segments'], [[0, 10239, 3000]])
+
+        session = RangeSession()
+        response = streamed_response(CONTENT, self.headers)
+        with patch('nasdaqdatalink.connection.Connection.get_session', return_value=session):
+            downloader.download(response, self.file_path)
+        self.assertEqual(session.ranges, [(3000, 10239)])
+        self.assertFalse(response.iter_content.called)
+        self.assertEqual(self.read_file(), CONTENT)
+
+    def test_downloads_of_a_changed_file_start_over(self):
+        self.headers['ETag'] = '"v1"'
+        downloader = FileDownloader(chunk_size=100, retries=0)
+        with patch('nasdaqdatalink.connection.Connection.get_session',
+                   return_value=RangeSession(status_code=500)):
+            self.assertRaises(DataLinkError, downloader.download,
+                              streamed_response(CONTENT, self.headers, fail_after=3000),
+                              self.file_path)
+
+        self.headers['ETag'] = '"v2"'
+        response = streamed_response(CONTENT, self.headers)
+        downloader.download(response, self.file_path)
+        self.assertTrue(response.iter_content.called)
+        self.assertEqual(self.read_file(), CONTENT)
+
+    def test_interruptions_without_ranges_are_raised(self):
+        del self.headers['Accept-Ranges']
+        self.assertRaises(requests.exceptions.ChunkedEncodingError,
+                          FileDownloader(retries=3).download,
+                          streamed_response(CONTENT, self.headers, fail_after=0),
+                          self.file_path)
+        self.assertFalse(os.path.exists(self.file_path))
+
+    def test_downloads_are_verified_against_content_digests(self):
+        digest = base64.b64encode(hashlib.md5(CONTENT).digest()).decode('ascii')
+        for headers in [{'Content-MD5': digest}, {'x-goog-hash': 'crc32c=AAAAAA==,md5=' + digest}]:
+            self.downloader.download(streamed_response(CONTENT, headers), self.file_path)
+            self.assertEqual(self.read_file(), CONTENT)
+            os.remove(self.file_path)
+
+            self.assertRaises(DataLinkError, self.downloader.download,
+                              streamed_response(CONTENT[::-1], headers), self.file_path)
+            # the bytes received are kept, the next download starts over
+            self.assertEqual(os.listdir(self.directory), ['db.zip.part'])
+            with open(self.file_path + '.part', 'rb') as f:
+                self.assertEqual(f.read(), CONTENT[::-1])
+
+    def test_etags_are_only_taken_as_md5_digests_when_enabled(self):
+        headers = {'ETag': '"%s"' % hashlib.md5(b'not the content').hexdigest()}
+        self.downloader.download(streamed_response(CONTENT, headers), self.file_path)
+        self.assertEqual(self.read_file(), CONTENT)
+
+        downloader = FileDownloader(chunk_size=100, verify_etag=True)
+        self.assertRaises(DataLinkError, downloader.download,
+                          streamed_response(CONTENT, headers), self.file_path)
+        headers = {'ETag': '"%s"' % hashlib.md5(CONTENT).hexdigest()}
+        downloader.download(streamed_response(CONTENT, headers), self.file_path)
+        self.assertEqual(self.read_file(), CONTENT)
+
+    @patch('nasdaqdatalink.utils.file_downloader.FileDownloader.download')
+    @patch('nasdaqdatalink.connection.Connection.request')
+    def test_bulk_download_to_file_uses_the_configured_downloader(self, request, download):
+        request.return_value = Mock(url='https://www.blah.com/download/db.zip')
+        file_path = Database('NSE').bulk_download_to_file(self.directory)
+        self.assertEqual(file_path, self.directory + '/db.zip')
+        download.assert_called_once_with(request.return_value, file_path)
@@ -3,6 +3,7 @@ from test.helpers.httpretty_extension import httpretty
 from test.helpers.merged_datasets_helper import setupDatasetsTest
 import pandas
 import numpy
+import pyarrow
 from mock import patch, call, Mock
 from nasdaqdatalink.model.dataset import Dataset
 from nasdaqdatalink.model.merged_dataset import MergedDataset
@@ -35,6 +36,13 @@ class GetSingleDatasetTest(unittest.TestCase):
         result = get('NSE/OIL', returns='numpy')
         self.assertIsInstance(result, numpy.core.records.recarray)
 
+    def test_returns_arrow_table_when_requested(self):
+        result = get('NSE/OIL', returns='arrow')
+        self.assertIsInstance(result, pyarrow.Table)
+        self.assertEqual(result.column_names[0], 'Date')
+        self.assertEqual(result.schema.field('Date').type, pyarrow.date32())
+        self.assertEqual(result.num_rows, len(get('NSE/OIL')))
+
     def test_setting_api_key_config(self):
         mock_connection = Mock(wraps=Connection)
         with patch('nasdaqdatalink.connection.Connection.execute_request',
@@ -120,6 +128,12 @@ class GetMultipleDatasetsTest(unittest.TestCase):
         httpretty.disable()
         httpretty.reset()
 
+    def test_returns_arrow_table_of_merged_datasets_when_requested(self):
+        result = get(['WIKI/AAPL.1', 'WIKI/MSFT.2'], returns='arrow')
+        self.assertIsInstance(result, pyarrow.Table)
+        self.assertEqual(result.column_names,
+                         ['Date'] + get(['WIKI/AAPL.1', 'WIKI/MSFT.2']).columns.tolist())
+
     @patch('nasdaqdatalink.model.merged_dataset.MergedDataset._build_dataset_object')
     def test_multiple_datasets_args_formed(self, mock):
         # requested_column_indexes is a dynamically added attribute
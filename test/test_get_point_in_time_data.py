@@ -3,11 +3,12 @@ import unittest
 import httpretty
 import json
 import pandas
-from mock import patch, call
+from mock import patch, call, Mock
 import nasdaqdatalink
 from nasdaqdatalink.utils.request_type_util import RequestType
 from nasdaqdatalink.errors.data_link_error import InvalidRequestError
 from datetime import date
+from test.factories.datatable_data import DatatableDataFactory
 
 
 class GetPointInTimeTest(unittest.TestCase):
@@ -165,3 +166,24 @@ class GetPointInTimeTest(unittest.TestCase):
               'ZACKS/FC', interval='between', end_date='2020-01-02'
             )
         )
+
+    @patch('nasdaqdatalink.connection.Connection.request')
+    def test_iter_point_in_time_yields_one_data_frame_per_page(self, mock):
+        pages = [{'datatable': DatatableDataFactory.build(), 'meta': {'next_cursor_id': cursor_id}}
+                 for cursor_id in ['abc', None]]
+        mock.side_effect = [Mock(**{'json.return_value': json.loads(json.dumps(page))})
+                            for page in pages]
+        results = list(nasdaqdatalink.iter_point_in_time(
+            'ZACKS/FC', interval='between', start_date='2020-01-01', end_date='2020-01-31'))
+        self.assertEqual(len(results), 2)
+        self.assertIsInstance(results[0], pandas.core.frame.DataFrame)
+        self.assertEqual(mock.call_args,
+                         call('get', 'pit/ZACKS/FC/between/2020-01-01/2020-01-31',
+                              params={'qopts.cursor_id': 'abc'}))
+
+    @patch('nasdaqdatalink.connection.Connection.request')
+    def test_iter_point_in_time_validates_options_immediately(self, mock):
+        self.assertRaises(
+            InvalidRequestError,
+            lambda: nasdaqdatalink.iter_point_in_time('ZACKS/FC', interval='between')
+        )
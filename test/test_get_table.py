@@ -1,10 +1,16 @@
+import copy
 import re
+import threading
 import unittest
 import httpretty
 import json
+from nasdaqdatalink.api_config import ApiConfig
+from nasdaqdatalink.errors.data_link_error import LimitExceededError, InternalServerError
+from nasdaqdatalink.model.data import Data
 from nasdaqdatalink.model.datatable import Datatable
 import pandas
-from mock import patch, call
+import pyarrow
+from mock import patch, call, Mock
 from test.factories.datatable import DatatableFactory
 from test.factories.datatable_data import DatatableDataFactory
 from test.factories.datatable_meta import DatatableMetaFactory
@@ -117,3 +123,133 @@ class GetDataTableTest(unittest.TestCase):
             expected = call('post', 'datatables/ZACKS/FC', json=expected_params)
 
         self.assertEqual(mock.call_args, expected)
+
+
+class PagesTestCase(unittest.TestCase):
+    # three pages of a datatable, as decoded from the API, and the responses to them
+
+    def setUp(self):
+        self.pages = []
+        for cursor_id in ['abc', 'def', None]:
+            page = {'datatable': DatatableDataFactory.build(),
+                    'meta': {'next_cursor_id': cursor_id}}
+            self.pages.append(json.loads(json.dumps(page)))
+
+    def responses(self, pages):
+        return [Mock(**{'json.return_value': page}) for page in pages]
+
+
+class GetDataTablePrefetchTest(PagesTestCase):
+
+    @patch('nasdaqdatalink.connection.Connection.request')
+    def test_prefetch_returns_same_data_as_sequential_pagination(self, mock):
+        mock.side_effect = self.responses(copy.deepcopy(self.pages))
+        expected = nasdaqdatalink.get_table('ZACKS/FC', paginate=True)
+
+        mock.side_effect = self.responses(self.pages)
+        df = nasdaqdatalink.get_table('ZACKS/FC', paginate=True, prefetch=2)
+
+        pandas.testing.assert_frame_equal(df, expected)
+        self.assertEqual(mock.call_args_list[-2:],
+                         [call('get', 'datatables/ZACKS/FC', params={'qopts.cursor_id': 'abc'}),
+                          call('get', 'datatables/ZACKS/FC', params={'qopts.cursor_id': 'def'})])
+
+    @patch('nasdaqdatalink.connection.Connection.request')
+    def test_prefetch_requests_next_page_while_converting_current(self, mock):
+        next_page_requested = threading.Event()
+        responses = self.responses(self.pages)
+
+        def request(*args, **kwargs):
+            if mock.call_count == 2:
+                next_page_requested.set()
+            return responses[mock.call_count - 1]
+        mock.side_effect = request
+
+        page_from_response = Data.page_from_response
+
+        def convert(response_data):
+            if response_data is self.pages[0]:
+                self.assertTrue(next_page_requested.wait(5))
+            return page_from_response(response_data)
+
+        with patch.object(Data, 'page_from_response', side_effect=convert):
+            df = nasdaqdatalink.get_table('ZACKS/FC', paginate=True, prefetch=1)
+        self.assertEqual(len(df), 12)
+
+    @patch('nasdaqdatalink.connection.Connection.request')
+    def test_prefetch_respects_page_limit(self, mock):
+        mock.side_effect = self.responses(self.pages)
+        with patch.object(ApiConfig, 'page_limit', 1):
+            self.assertRaises(LimitExceededError, lambda: nasdaqdatalink.get_table(
+                'ZACKS/FC', paginate=True, prefetch=2))
+        self.assertEqual(mock.call_count, 2)
+
+    @patch('nasdaqdatalink.connection.Connection.request')
+    def test_prefetch_raises_request_errors(self, mock):
+        mock.side_effect = self.responses(self.pages[:1]) + [InternalServerError('boom')]
+        self.assertRaises(InternalServerError, lambda: nasdaqdatalink.get_table(
+            'ZACKS/FC', paginate=True, prefetch=2))
+
+    @patch('nasdaqdatalink.connection.Connection.request')
+    def test_prefetch_stops_after_first_page_without_paginate(self, mock):
+        mock.side_effect = self.responses(self.pages)
+        with self.assertWarns(UserWarning):
+            df = nasdaqdatalink.get_table('ZACKS/FC', prefetch=2)
+        self.assertEqual(len(df), 4)
+        self.assertEqual(mock.call_count, 1)
+
+
+class IterTableTest(PagesTestCase):
+
+    @patch('nasdaqdatalink.connection.Connection.request')
+    def test_iter_table_yields_one_data_frame_per_page(self, mock):
+        mock.side_effect = self.responses(self.pages)
+        pages = list(nasdaqdatalink.iter_table('ZACKS/FC', ticker='AAPL'))
+
+        self.assertEqual(len(pages), 3)
+        for page in pages:
+            self.assertIsInstance(page, pandas.core.frame.DataFrame)
+            self.assertEqual(len(page), 4)
+        self.assertEqual(mock.call_args,
+                         call('get', 'datatables/ZACKS/FC',
+                              params={'ticker': 'AAPL', 'qopts.cursor_id': 'def'}))
+
+    @patch('nasdaqdatalink.connection.Connection.request')
+    def test_iter_table_fetches_pages_lazily(self, mock):
+        mock.side_effect = self.responses(self.pages)
+        pages = nasdaqdatalink.iter_table('ZACKS/FC')
+        self.assertEqual(mock.call_count, 0)
+        next(pages)
+        self.assertEqual(mock.call_count, 1)
+
+    @patch('nasdaqdatalink.connection.Connection.request')
+    def test_iter_table_is_not_bound_by_page_limit(self, mock):
+        mock.side_effect = self.responses(self.pages)
+        with patch.object(ApiConfig, 'page_limit', 1):
+            pages = list(nasdaqdatalink.iter_table('ZACKS/FC', prefetch=1))
+        self.assertEqual(len(pages), 3)
+
+    @patch('nasdaqdatalink.connection.Connection.request')
+    def test_iter_table_passes_dtype_options_to_pandas(self, mock):
+        mock.side_effect = self.responses(self.pages)
+        pages = list(nasdaqdatalink.iter_table('ZACKS/FC', categorical=['ticker'],
+                                               downcast=True))
+        self.assertIsInstance(pages[0]['ticker'].dtype, pandas.CategoricalDtype)
+        self.assertEqual(mock.call_args,
+                         call('get', 'datatables/ZACKS/FC', params={'qopts.cursor_id': 'def'}))
+
+    @patch('nasdaqdatalink.connection.Connection.request')
+    def test_iter_table_returns_arrow_tables_when_requested(self, mock):
+        mock.side_effect = self.responses(self.pages)
+        pages = list(nasdaqdatalink.iter_table('ZACKS/FC', returns='arrow'))
+        self.assertEqual(len(pages), 3)
+        for page in pages:
+            self.assertIsInstance(page, pyarrow.Table)
+        self.assertEqual(pages[0].schema.field('per_end_date').type, pyarrow.date32())
+
+    @patch('nasdaqdatalink.connection.Connection.request')
+    def test_get_table_returns_arrow_table_when_requested(self, mock):
+        mock.side_effect = self.responses(self.pages)
+        table = nasdaqdatalink.get_table('ZACKS/FC', paginate=True, returns='arrow')
+        self.assertIsInstance(table, pyarrow.Table)
+        self.assertEqual(table.num_rows, 12)
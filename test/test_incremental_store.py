@@ -0,0 +1,160 @@
+import asyncio
+import shutil
+import tempfile
+import threading
+import unittest
+
+from mock import patch, Mock, AsyncMock
+
+import nasdaqdatalink
+import nasdaqdatalink.aio
+from nasdaqdatalink.aio.connection import AsyncConnection
+from nasdaqdatalink.api_config import ApiConfig
+from nasdaqdatalink.utils.incremental_store import IncrementalStore
+
+
+def dataset_response(rows, column_names=['Date', 'Value']):
+    return {'dataset_data': {'column_names': list(column_names),
+                             'data': [list(row) for row in rows],
+                             'start_date': None, 'end_date': None, 'order': 'asc',
+                             'transform': None, 'collapse': None, 'column_index': None,
+                             'limit': None, 'frequency': 'daily'}}
+
+
+class IncrementalStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.store_dir = tempfile.mkdtemp()
+        self.store = IncrementalStore(self.store_dir, overlap_days=2)
+        self.options = {'params': {'database_code': 'WIKI', 'dataset_code': 'AAPL',
+                                   'order': 'asc'}}
+
+    def tearDown(self):
+        shutil.rmtree(self.store_dir, ignore_errors=True)
+
+    def store_rows(self, rows, options=None):
+        plan, _ = self.store.prepare(options or self.options)
+        return self.store.splice(plan, dataset_response(rows))
+
+    def test_first_request_fetches_the_full_history(self):
+        plan, options = self.store.prepare(self.options)
+        self.assertEqual(options, self.options)
+        self.assertIsNone(plan['entry'])
+
+    def test_next_request_starts_from_the_last_stored_date_less_the_overlap(self):
+        self.store_rows([['2015-07-10', 1.0], ['2015-07-13', 2.0]])
+        _, options = self.store.prepare(self.options)
+        self.assertEqual(options['params']['start_date'], '2015-07-11')
+        # the caller's options are left as they were
+        self.assertNotIn('start_date', self.options['params'])
+
+    def test_requested_start_date_is_kept_when_later(self):
+        self.options['params']['start_date'] = '2015-07-12'
+        self.store_rows([['2015-07-13', 2.0]])
+        _, options = self.store.prepare(self.options)
+        self.assertEqual(options['params']['start_date'], '2015-07-12')
+
+    def test_new_rows_replace_stored_rows_from_their_first_date(self):
+        self.store_rows([['2015-07-09', 1.0], ['2015-07-10', 2.0], ['2015-07-13', 3.0]])
+        response_data = self.store_rows([['2015-07-10', 2.5], ['2015-07-14', 4.0]])
+        self.assertEqual(response_data['dataset_data']['data'],
+                         [['2015-07-09', 1.0], ['2015-07-10', 2.5], ['2015-07-14', 4.0]])
+        self.assertEqual(response_data['dataset_data']['start_date'], '2015-07-09')
+        self.assertEqual(response_data['dataset_data']['end_date'], '2015-07-14')
+
+    def test_empty_response_returns_the_stored_rows(self):
+        self.store_rows([['2015-07-09', 1.0]])
+        self.assertEqual(self.store_rows([])['dataset_data']['data'], [['2015-07-09', 1.0]])
+
+    def test_descending_order_is_requested_ascending_and_reversed(self):
+        self.options['params']['order'] = 'desc'
+        plan, options = self.store.prepare(self.options)
+        self.assertEqual(options['params']['order'], 'asc')
+        response_data = self.store.splice(
+            plan, dataset_response([['2015-07-09', 1.0], ['2015-07-10', 2.0]]))
+        self.assertEqual(response_data['dataset_data']['data'],
+                         [['2015-07-10', 2.0], ['2015-07-09', 1.0]])
+
+    def test_series_are_stored_per_transform_and_collapse(self):
+        self.store_rows([['2015-07-09', 1.0]])
+        options = {'params': dict(self.options['params'], collapse='monthly')}
+        plan, _ = self.store.prepare(options)
+        self.assertIsNone(plan['entry'])
+
+    def test_requests_that_need_the_full_history_are_not_incremental(self):
+        for params in [{'transform': 'cumul'}, {'transform': 'normalize'}, {'rows': 5},
+                       {'end_date': '2015-01-01'}]:
+            options = {'params': dict(self.options['params'], **params)}
+            self.assertEqual(self.store.prepare(options), (None, options))
+
+    def test_changed_columns_require_a_refresh(self):
+        self.store_rows([['2015-07-09', 1.0]])
+        plan, _ = self.store.prepare(self.options)
+        self.assertIsNone(self.store.splice(
+            plan, dataset_response([['2015-07-10', 1.0, 2.0]], ['Date', 'Open', 'Close'])))
+
+
+class GetIncrementalTest(unittest.TestCase):
+
+    def setUp(self):
+        self.store_dir = tempfile.mkdtemp()
+        ApiConfig.use_cache = False
+
+    def tearDown(self):
+        shutil.rmtree(self.store_dir, ignore_errors=True)
+
+    @patch('nasdaqdatalink.connection.Connection.request')
+    def test_get_only_requests_rows_newer_than_the_stored_ones(self, mock):
+        mock.side_effect = [
+            Mock(**{'json.return_value': dataset_response(
+                [['2015-07-09', 1.0], ['2015-07-10', 2.0]])}),
+            Mock(**{'json.return_value': dataset_response(
+                [['2015-07-10', 2.0], ['2015-07-13', 3.0]])})]
+        with patch.multiple(ApiConfig, incremental_dir=self.store_dir,
+                            incremental_overlap_days=0):
+            nasdaqdatalink.get('WIKI/AAPL', incremental=True)
+            df = nasdaqdatalink.get('WIKI/AAPL', incremental=True)
+
+        self.assertNotIn('start_date', mock.call_args_list[0][1]['params'])
+        self.assertEqual(mock.call_args_list[1][1]['params']['start_date'], '2015-07-10')
+        self.assertEqual(df['Value'].tolist(), [1.0, 2.0, 3.0])
+
+    @patch('nasdaqdatalink.connection.Connection.request')
+    def test_get_refetches_the_full_history_when_columns_changed(self, mock):
+        mock.side_effect = [
+            Mock(**{'json.return_value': dataset_response([['2015-07-09', 1.0]])}),
+            Mock(**{'json.return_value': dataset_response(
+                [['2015-07-10', 1.0, 2.0]], ['Date', 'Open', 'Close'])}),
+            Mock(**{'json.return_value': dataset_response(
+                [['2015-07-09', 1.0, 2.0], ['2015-07-10', 1.0, 2.0]],
+                ['Date', 'Open', 'Close'])})]
+        with patch.object(ApiConfig, 'incremental_dir', self.store_dir):
+            nasdaqdatalink.get('WIKI/AAPL', incremental=True)
+            df = nasdaqdatalink.get('WIKI/AAPL', incremental=True)
+
+        self.assertNotIn('start_date', mock.call_args_list[2][1]['params'])
+        self.assertEqual(len(df), 2)
+
+    @patch.object(AsyncConnection, 'request', new_callable=AsyncMock)
+    def test_aio_get_uses_the_store_off_the_event_loop(self, mock):
+        mock.side_effect = [dataset_response([['2015-07-09', 1.0], ['2015-07-10', 2.0]]),
+                            dataset_response([['2015-07-10', 2.0], ['2015-07-13', 3.0]])]
+        threads = []
+        prepare, splice = IncrementalStore.prepare, IncrementalStore.splice
+
+        def record(method):
+            def call(*args, **kwargs):
+                threads.append(threading.current_thread())
+                return method(*args, **kwargs)
+            return call
+        with patch.multiple(ApiConfig, incremental_dir=self.store_dir,
+                            incremental_overlap_days=0), \
+                patch.object(IncrementalStore, 'prepare', record(prepare)), \
+                patch.object(IncrementalStore, 'splice', record(splice)):
+            asyncio.run(nasdaqdatalink.aio.get('WIKI/AAPL', incremental=True))
+            df = asyncio.run(nasdaqdatalink.aio.get('WIKI/AAPL', incremental=True))
+
+        self.assertEqual(mock.call_args_list[1][1]['params']['start_date'], '2015-07-10')
+        self.assertEqual(df['Value'].tolist(), [1.0, 2.0, 3.0])
+        self.assertEqual(len(threads), 4)
+        self.assertNotIn(threading.main_thread(), threads)
@@ -0,0 +1,63 @@
+import json
+import math
+import unittest
+
+from mock import patch, Mock
+
+from nasdaqdatalink.api_config import ApiConfig
+from nasdaqdatalink.connection import Connection
+from nasdaqdatalink.errors.data_link_error import DataLinkError
+from nasdaqdatalink.utils.json_decoder import JsonDecoder
+from test.factories.datatable_data import DatatableDataFactory
+from test.factories.datatable_meta import DatatableMetaFactory
+from test.helpers.httpretty_extension import httpretty
+
+URL = 'https://data.nasdaq.com/api/v3/datatables/ZACKS/FC'
+PAGE = {'datatable': DatatableDataFactory.build(), 'meta': DatatableMetaFactory.build()}
+
+
+class JsonDecoderTest(unittest.TestCase):
+
+    def test_every_available_decoder_gives_the_standard_library_result(self):
+        content = json.dumps(PAGE).encode('utf-8')
+        for name in ['auto'] + [name for name in JsonDecoder.DECODERS
+                                if JsonDecoder._module(name) is not None]:
+            self.assertEqual(JsonDecoder.decoder(name)(content), PAGE)
+
+    def test_bodies_a_fast_decoder_rejects_are_decoded_by_the_standard_library(self):
+        loads = Mock(side_effect=ValueError('NaN'))
+        self.assertTrue(math.isnan(JsonDecoder._with_fallback(loads, b'{"value": NaN}')['value']))
+        self.assertRaises(ValueError, JsonDecoder._with_fallback, loads, b'not json')
+
+    def test_decoders_can_be_functions_or_must_be_installed(self):
+        decoder = Mock(return_value={})
+        with patch.object(ApiConfig, 'json_decoder', decoder):
+            self.assertEqual(JsonDecoder.decode(b'{}'), {})
+        decoder.assert_called_once_with(b'{}')
+        self.assertRaises(ImportError, JsonDecoder.decoder, 'yaml')
+        with patch('nasdaqdatalink.utils.json_decoder.orjson', None), \
+                patch('nasdaqdatalink.utils.json_decoder.simdjson', None):
+            self.assertIs(JsonDecoder.decoder('auto'), json.loads)
+            self.assertRaises(ImportError, JsonDecoder.decoder, 'orjson')
+
+
+class ConnectionJsonDecoderTest(unittest.TestCase):
+
+    def setUp(self):
+        httpretty.enable()
+
+    def tearDown(self):
+        httpretty.disable()
+        httpretty.reset()
+
+    def test_responses_are_decoded_with_the_configured_decoder(self):
+        httpretty.register_uri(httpretty.GET, URL, body=json.dumps(PAGE))
+        decoder = Mock(side_effect=json.loads)
+        with patch.object(ApiConfig, 'json_decoder', decoder):
+            self.assertEqual(Connection.request_json('get', 'datatables/ZACKS/FC'), PAGE)
+        self.assertIsInstance(decoder.call_args[0][0], bytes)
+
+    def test_error_bodies_that_are_not_json_still_raise_data_link_errors(self):
+        httpretty.register_uri(httpretty.GET, URL, body='not json', status=400)
+        with patch.object(ApiConfig, 'use_retries', False):
+            self.assertRaises(DataLinkError, Connection.request, 'get', 'datatables/ZACKS/FC')
@@ -1,3 +1,4 @@
+import threading
 import unittest
 from test.helpers.httpretty_extension import httpretty
 import six
@@ -5,10 +6,11 @@ import datetime
 import pandas
 from nasdaqdatalink.model.dataset import Dataset
 from nasdaqdatalink.model.data import Data
+from nasdaqdatalink.model.data_list import DataList
 from nasdaqdatalink.model.merged_data_list import MergedDataList
 from nasdaqdatalink.model.merged_dataset import MergedDataset
 from mock import patch, call
-from nasdaqdatalink.errors.data_link_error import ColumnNotFound
+from nasdaqdatalink.errors.data_link_error import ColumnNotFound, NotFoundError
 from test.helpers.merged_datasets_helper import setupDatasetsTest
 
 
@@ -160,6 +162,39 @@ class GetMergedDatasetTest(unittest.TestCase):
         for actual in mock_method.mock_calls:
             self.assertEqual(actual, call(params={'start_date': '2015-07-01'}))
 
+    def test_data_fetches_datasets_concurrently_in_order_with_max_workers(self):
+        # every request waits for the others, which only succeeds when they run at once
+        barrier = threading.Barrier(3, timeout=5)
+
+        def all(params):
+            barrier.wait()
+            if params['dataset_code'] == 'AAPL':
+                raise NotFoundError('not found')
+            return DataList(Data, [['2015-07-11', params.get('column_index', 0), 5]],
+                            {'column_names': ['Date', params['dataset_code'], 'Other']})
+
+        with patch.object(Data, 'all', side_effect=all):
+            df = MergedDataset(
+                [('NSE/OIL', {'column_index': [2]}),
+                 ('WIKI/AAPL', {'column_index': [1]}),
+                 ('WIKI/MSFT')]).data(params={'start_date': '2015-07-01'},
+                                      handle_not_found_error=True,
+                                      max_workers=3).to_pandas()
+        self.assertEqual(df.columns.tolist(),
+                         ['NSE/OIL - OIL', 'NSE/OIL - Other', 'WIKI/AAPL - Not Found',
+                          'WIKI/MSFT - MSFT', 'WIKI/MSFT - Other'])
+        # the single requested column index is sent to the api for NSE/OIL only
+        self.assertEqual(df['NSE/OIL - OIL'].iloc[0], 2)
+        self.assertEqual(df['WIKI/MSFT - MSFT'].iloc[0], 0)
+
+    @patch.object(Dataset, 'data')
+    def test_data_fetches_datasets_sequentially_by_default(self, mock_method):
+        mock_method.return_value = self.data_list_obj
+        with patch('nasdaqdatalink.model.merged_dataset.ThreadPoolExecutor') as mock:
+            MergedDataset(['NSE/OIL', 'WIKI/AAPL']).data()
+        self.assertEqual(mock.call_count, 0)
+        self.assertEqual(mock_method.call_count, 2)
+
     def test_get_merged_dataset_data_returns_correct_types(self):
         data = MergedDataset(
             [('NSE/OIL', {'column_index': [1, 2]}),
@@ -212,3 +247,47 @@ class GetMergedDatasetTest(unittest.TestCase):
         dates = list([x[0] for x in results])
         self.assertTrue(all(dates[i] >= dates[i + 1]
                             for i in range(len(dates) - 1)))
+
+    def test_merge_data_aligns_datasets_on_date_in_one_pass(self):
+        md = MergedDataset(['WIKI/AAPL', 'NSE/OIL', 'WIKI/MSFT'])
+        dataset_data_list = [
+            DataList(Data, [['2015-07-13', 1.0], ['2015-07-11', 2.0]],
+                     {'column_names': ['Date', 'Open']}),
+            Dataset.empty_data(),
+            DataList(Data, [['2015-07-14', 3.0], ['2015-07-13', 4.0]],
+                     {'column_names': ['Date', 'Close']})]
+        with patch('nasdaqdatalink.model.merged_dataset.pd.merge') as mock:
+            df = md.merge_data(dataset_data_list).to_pandas()
+        self.assertEqual(mock.call_count, 0)
+        self.assertEqual(df.index.name, 'Date')
+        self.assertEqual(df.index.tolist(), [pandas.Timestamp('2015-07-11'),
+                                             pandas.Timestamp('2015-07-13'),
+                                             pandas.Timestamp('2015-07-14')])
+        self.assertEqual(df.columns.tolist(), ['WIKI/AAPL - Open', 'NSE/OIL - Not Found',
+                                               'WIKI/MSFT - Close'])
+        self.assertEqual(df['WIKI/AAPL - Open'].tolist()[:2], [2.0, 1.0])
+        self.assertEqual(df['WIKI/MSFT - Close'].tolist()[1:], [4.0, 3.0])
+
+    def test_merge_data_joins_repeated_codes_one_at_a_time(self):
+        md = MergedDataset(['WIKI/AAPL', 'WIKI/AAPL'])
+        dataset_data_list = [DataList(Data, [['2015-07-13', 1.0]],
+                                      {'column_names': ['Date', 'Open']})
+                             for _ in range(2)]
+        df = md.merge_data(dataset_data_list).to_pandas()
+        self.assertEqual(df.columns.tolist(), ['WIKI/AAPL - Open_x', 'WIKI/AAPL - Open_y'])
+
+    def test_merged_data_list_builds_rows_only_when_listed(self):
+        data_frame = pandas.DataFrame({'WIKI/AAPL - Open': [1.0, 2.0]},
+                                      index=pandas.to_datetime(['2015-07-11', '2015-07-13']))
+        data_frame.index.name = 'Date'
+        with patch.object(pandas.DataFrame, 'to_records') as mock:
+            data = MergedDataList(Data, data_frame, {'column_names': ['Date', 'Open']})
+            self.assertIs(data.to_pandas(), data_frame)
+            self.assertEqual(len(data), 2)
+        self.assertEqual(mock.call_count, 0)
+
+        self.assertEqual(data.to_list(), [[datetime.datetime(2015, 7, 11), 1.0],
+                                          [datetime.datetime(2015, 7, 13), 2.0]])
+        self.assertIsInstance(data[1], Data)
+        self.assertEqual(data[1].open, 2.0)
+        self.assertEqual(len(data), 2)
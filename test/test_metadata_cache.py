@@ -0,0 +1,83 @@
+import threading
+import time
+import unittest
+
+from mock import patch
+
+from nasdaqdatalink.api_config import ApiConfig
+from nasdaqdatalink.model.database import Database
+from nasdaqdatalink.model.dataset import Dataset
+from nasdaqdatalink.model.merged_dataset import MergedDataset
+from nasdaqdatalink.utils.metadata_cache import MetadataCache
+
+
+def metadata(http_verb, path, **options):
+    # databases/WIKI or datasets/WIKI/AAPL/metadata
+    codes = path.split('/')
+    if codes[0] == 'databases':
+        return {'database': {'database_code': codes[1]}}
+    return {'dataset': {'dataset_code': codes[2], 'column_names': ['Date', 'Value'],
+                        'oldest_available_date': '2015-07-%s' % len(codes[2])}}
+
+
+@patch('nasdaqdatalink.connection.Connection.request_json', side_effect=metadata)
+class MetadataCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        MetadataCache.clear()
+        ApiConfig.use_metadata_cache = True
+
+    def tearDown(self):
+        ApiConfig.use_metadata_cache = False
+        MetadataCache.clear()
+
+    def test_objects_for_the_same_code_share_one_request(self, mock):
+        self.assertEqual(Dataset('WIKI/AAPL').oldest_available_date, '2015-07-4')
+        self.assertEqual(Dataset('WIKI/AAPL').column_names, ['Date', 'Value'])
+        self.assertEqual(mock.call_count, 1)
+
+    def test_cache_is_not_used_by_default(self, mock):
+        ApiConfig.use_metadata_cache = False
+        Dataset('WIKI/AAPL').column_names
+        Dataset('WIKI/AAPL').column_names
+        self.assertEqual(mock.call_count, 2)
+
+    def test_entries_are_kept_per_model(self, mock):
+        Dataset('WIKI/AAPL').column_names
+        self.assertEqual(Database('WIKI').database_code, 'WIKI')
+        self.assertEqual(mock.call_count, 2)
+
+    def test_entries_expire_after_the_ttl(self, mock):
+        Dataset('WIKI/AAPL').column_names
+        with patch('nasdaqdatalink.utils.metadata_cache.time.time',
+                   return_value=time.time() + ApiConfig.metadata_cache_ttl + 1):
+            Dataset('WIKI/AAPL').column_names
+        self.assertEqual(mock.call_count, 2)
+
+    def test_changing_an_object_does_not_change_the_cache(self, mock):
+        Dataset('WIKI/AAPL').column_names.append('Extra')
+        self.assertEqual(Dataset('WIKI/AAPL').column_names, ['Date', 'Value'])
+
+    def test_prefetch_requests_codes_at_once_in_order(self, mock):
+        # every request waits for the others, which only succeeds when they run at once
+        barrier = threading.Barrier(3, timeout=5)
+
+        def wait_for_others(*args, **options):
+            barrier.wait()
+            return metadata(*args, **options)
+        mock.side_effect = wait_for_others
+
+        datasets = Dataset.prefetch(['WIKI/AAPL', 'WIKI/MSFT', 'NSE/OIL'], max_workers=3)
+        self.assertEqual([dataset.oldest_available_date for dataset in datasets],
+                         ['2015-07-4', '2015-07-4', '2015-07-3'])
+        self.assertEqual(mock.call_count, 3)
+
+        mock.side_effect = metadata
+        Dataset('NSE/OIL').column_names
+        self.assertEqual(mock.call_count, 3)
+
+    def test_merged_dataset_attributes_use_the_cache(self, mock):
+        Dataset.prefetch(['WIKI/AAPL', 'NSE/OIL'])
+        merged_dataset = MergedDataset(['WIKI/AAPL', 'NSE/OIL'])
+        self.assertEqual(merged_dataset.oldest_available_date, '2015-07-3')
+        self.assertEqual(mock.call_count, 2)
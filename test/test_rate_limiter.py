@@ -0,0 +1,168 @@
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import unittest
+
+from mock import patch, Mock
+
+from nasdaqdatalink.api_config import ApiConfig
+from nasdaqdatalink.connection import Connection
+from nasdaqdatalink.errors.data_link_error import LimitExceededError
+from nasdaqdatalink.utils.rate_limiter import FileBackend, MemoryBackend, RateLimiter
+from test.helpers.httpretty_extension import httpretty
+
+
+def reserve_from_file(path, attempts, results):
+    limiter = RateLimiter('api_token', per_day=25, backend=FileBackend(path))
+    allowed = 0
+    for _ in range(attempts):
+        try:
+            limiter.reserve()
+            allowed += 1
+        except LimitExceededError:
+            pass
+    results.put(allowed)
+
+
+class Clock(object):
+    def __init__(self, now=1600000000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class RateLimiterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = Clock()
+
+    def limiter(self, **options):
+        return RateLimiter('api_token', backend=MemoryBackend(), clock=self.clock, **options)
+
+    def test_requests_wait_for_a_token_after_a_burst(self):
+        limiter = self.limiter(rate=2, burst=2)
+        self.assertEqual([limiter.reserve() for _ in range(4)], [0, 0, 0.5, 1.0])
+        self.clock.now += 10
+        self.assertEqual([limiter.reserve() for _ in range(3)], [0, 0, 0.5])
+
+    def test_the_daily_quota_raises_once_used_up(self):
+        limiter = self.limiter(per_day=2)
+        limiter.reserve()
+        limiter.reserve()
+        self.assertRaises(LimitExceededError, limiter.reserve)
+        self.assertEqual(limiter.remaining()['requests_today'], 0)
+        self.clock.now += 24 * 60 * 60
+        self.assertEqual(limiter.remaining()['requests_today'], 2)
+        self.assertEqual(limiter.reserve(), 0)
+
+    def test_rejected_requests_pause_the_key(self):
+        limiter = self.limiter(rate=1, backoff_factor=0.5, max_backoff=8)
+        limiter.update(429, {'Retry-After': '30'})
+        self.assertEqual(limiter.reserve(), 30)
+        # requests resume at the rate, not all at once
+        self.assertEqual(limiter.reserve(), 31)
+
+        # without Retry-After, the backoff of the retries grows with each rejection
+        self.clock.now += 60
+        limiter.update(429, {})
+        limiter.update(429, {})
+        self.assertEqual(limiter.remaining()['blocked_for'], 2.0)
+        limiter.update(200, {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '20'})
+        self.assertEqual(limiter.remaining()['blocked_for'], 20)
+
+    def test_keys_are_limited_separately(self):
+        backend = MemoryBackend()
+        first = RateLimiter('first', rate=1, backend=backend, clock=self.clock)
+        second = RateLimiter('second', rate=1, backend=backend, clock=self.clock)
+        self.assertEqual([first.reserve(), first.reserve(), second.reserve()], [0, 1, 0])
+
+
+class FileBackendTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, True)
+        self.path = os.path.join(self.directory, 'rate_limit.json')
+
+    def test_limiters_using_the_same_file_share_one_bucket(self):
+        clock = Clock()
+        first = RateLimiter('api_token', rate=1, backend=FileBackend(self.path), clock=clock)
+        second = RateLimiter('api_token', rate=1, backend=FileBackend(self.path), clock=clock)
+        self.assertEqual([first.reserve(), second.reserve(), first.reserve()], [0, 1, 2])
+        with open(self.path) as f:
+            self.assertNotIn('api_token', f.read())
+
+    def test_processes_draw_from_one_daily_quota(self):
+        results = multiprocessing.Queue()
+        processes = [multiprocessing.Process(target=reserve_from_file,
+                                             args=(self.path, 10, results))
+                     for _ in range(4)]
+        for process in processes:
+            process.start()
+        allowed = sum(results.get(timeout=30) for _ in processes)
+        for process in processes:
+            process.join()
+        self.assertEqual(allowed, 25)
+        limiter = RateLimiter('api_token', per_day=25, backend=FileBackend(self.path))
+        self.assertEqual(limiter.remaining()['requests_today'], 0)
+
+    def test_connection_reports_the_remaining_requests(self):
+        self.assertIsNone(Connection.rate_limit_remaining())
+        with patch.object(ApiConfig, 'rate_limit_per_day', 10), \
+                patch.object(ApiConfig, 'rate_limit_file', self.path):
+            RateLimiter.from_config().reserve()
+            self.assertEqual(Connection.rate_limit_remaining(),
+                             {'requests_now': None, 'requests_today': 9, 'blocked_for': 0})
+
+
+class ConnectionRateLimitTest(unittest.TestCase):
+
+    def setUp(self):
+        httpretty.enable()
+        RateLimiter._memory_backend.clear()
+        for name, value in [('rate_limit', 5), ('api_key', 'api_token'),
+                            ('use_retries', True), ('number_of_retries', 2)]:
+            patcher = patch.object(ApiConfig, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        httpretty.disable()
+        httpretty.reset()
+        Connection.reset_session()
+
+    @patch('nasdaqdatalink.utils.rate_limiter.time.sleep')
+    def test_rejected_requests_are_retried_after_the_server_delay(self, sleep):
+        httpretty.register_uri(httpretty.GET, 'https://data.nasdaq.com/api/v3/databases',
+                               responses=[httpretty.Response(
+                                   body=json.dumps({'quandl_error': {
+                                       'code': 'QELx01', 'message': 'slow down'}}),
+                                   status=429, adding_headers={'Retry-After': '3'}),
+                                   httpretty.Response(body=json.dumps({'databases': []}))])
+
+        self.assertEqual(Connection.request('get', 'databases').json(), {'databases': []})
+        self.assertEqual(len(httpretty.latest_requests()), 2)
+        self.assertEqual(len(sleep.call_args_list), 1)
+        self.assertAlmostEqual(sleep.call_args_list[0][0][0], 3, places=1)
+
+    def test_rejections_are_raised_once_the_retries_are_used(self):
+        with patch.object(ApiConfig, 'number_of_retries', 0):
+            httpretty.register_uri(httpretty.GET, 'https://data.nasdaq.com/api/v3/databases',
+                                   body=json.dumps({'quandl_error': {
+                                       'code': 'QELx01', 'message': 'slow down'}}),
+                                   status=429)
+            self.assertRaises(LimitExceededError, Connection.request, 'get', 'databases')
+
+    @patch('nasdaqdatalink.utils.rate_limiter.time.sleep')
+    @patch.object(Connection, 'get_session')
+    def test_rejected_responses_are_closed_before_the_retry(self, get_session, sleep):
+        rejected = Mock(status_code=429, headers={'Retry-After': '1'})
+        accepted = Mock(status_code=200, headers={}, content=b'{}')
+        get_session.return_value.request.side_effect = [rejected, accepted]
+
+        self.assertIs(Connection.request('get', 'datasets/EOD.zip', stream=True), accepted)
+        rejected.close.assert_called_once_with()
+        self.assertFalse(accepted.close.called)
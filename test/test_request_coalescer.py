@@ -0,0 +1,95 @@
+import threading
+import time
+import unittest
+
+from mock import patch, Mock
+
+from nasdaqdatalink.api_config import ApiConfig
+from nasdaqdatalink.connection import Connection
+from nasdaqdatalink.errors.data_link_error import InternalServerError
+from nasdaqdatalink.utils.request_coalescer import RequestCoalescer
+
+
+class SlowRequest(object):
+    # answers once every caller but the first is waiting on the request in flight
+    def __init__(self, callers, error=None):
+        self.callers = callers
+        self.error = error
+        self.count = 0
+
+    def __call__(self, http_verb, url, **options):
+        self.count += 1
+        deadline = time.time() + 5
+        while self.waiters() < self.callers - 1 and time.time() < deadline:
+            time.sleep(0.001)
+        if self.error is not None:
+            raise self.error
+        return Mock(status_code=200, **{'json.return_value': {'dataset': {'id': 1}}})
+
+    @staticmethod
+    def waiters():
+        with RequestCoalescer._lock:
+            return sum(call.waiters for call in RequestCoalescer._calls.values())
+
+
+def run_in_threads(count, target):
+    results = [None] * count
+
+    def run(index):
+        try:
+            results[index] = target()
+        except Exception as e:
+            results[index] = e
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class RequestCoalescerTest(unittest.TestCase):
+
+    def setUp(self):
+        patcher = patch.object(ApiConfig, 'coalesce_requests', True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def request_metadata(self):
+        return Connection.request_json('get', 'datasets/WIKI/AAPL/metadata',
+                                       params={'order': 'asc'})
+
+    def test_concurrent_identical_requests_share_one_response(self):
+        request = SlowRequest(callers=8)
+        with patch.object(Connection, 'request', side_effect=request):
+            results = run_in_threads(8, self.request_metadata)
+        self.assertEqual(request.count, 1)
+        self.assertEqual(results, [{'dataset': {'id': 1}}] * 8)
+        # every caller gets its own copy of the response
+        results[0]['dataset']['id'] = 2
+        self.assertEqual(results[1], {'dataset': {'id': 1}})
+
+    def test_errors_are_raised_to_every_caller(self):
+        request = SlowRequest(callers=4, error=InternalServerError('something went wrong'))
+        with patch.object(Connection, 'request', side_effect=request):
+            results = run_in_threads(4, self.request_metadata)
+        self.assertEqual(request.count, 1)
+        self.assertTrue(all(isinstance(result, InternalServerError) for result in results))
+        self.assertEqual(RequestCoalescer._calls, {})
+
+    def test_requests_are_identical_only_with_the_same_parameters_and_key(self):
+        options = {'params': {'order': 'asc'}}
+        key = RequestCoalescer.key('get', 'datasets/WIKI/AAPL/data', options)
+        self.assertEqual(key, RequestCoalescer.key('GET', 'datasets/WIKI/AAPL/data',
+                                                   {'params': {'order': 'asc'}}))
+        self.assertNotEqual(key, RequestCoalescer.key('get', 'datasets/WIKI/AAPL/data',
+                                                      {'params': {'order': 'desc'}}))
+        self.assertNotEqual(key, RequestCoalescer.key(
+            'get', 'datasets/WIKI/AAPL/data', {'params': {'order': 'asc', 'api_key': 'other'}}))
+
+    @patch.object(ApiConfig, 'coalesce_requests', False)
+    @patch.object(Connection, 'request')
+    def test_requests_are_not_shared_when_disabled(self, request):
+        request.return_value = Mock(status_code=200, **{'json.return_value': {}})
+        run_in_threads(3, self.request_metadata)
+        self.assertEqual(request.call_count, 3)
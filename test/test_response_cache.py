@@ -0,0 +1,167 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from mock import patch, Mock
+
+from nasdaqdatalink.api_config import ApiConfig
+from nasdaqdatalink.connection import Connection
+from nasdaqdatalink.utils.response_cache import ResponseCache
+from test.helpers.httpretty_extension import httpretty
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = ResponseCache(self.cache_dir, max_size=None, ttl=60,
+                                   endpoint_ttls={'/metadata$': 3600})
+        ResponseCache.reset_stats()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_key_ignores_api_key_and_parameter_order(self):
+        key = ResponseCache.key('get', 'datasets/WIKI/AAPL/data',
+                                {'params': {'rows': 1, 'order': 'asc', 'api_key': 'a'},
+                                 'headers': {'x-api-token': 'a'}})
+        self.assertEqual(key, ResponseCache.key('GET', 'datasets/WIKI/AAPL/data',
+                                                {'params': {'order': 'asc', 'rows': 1}}))
+        self.assertNotEqual(key, ResponseCache.key('get', 'datasets/WIKI/AAPL/data',
+                                                   {'params': {'order': 'desc', 'rows': 1}}))
+        self.assertNotEqual(key, ResponseCache.key('post', 'datasets/WIKI/AAPL/data',
+                                                   {'json': {'order': 'asc', 'rows': 1}}))
+
+    def test_stores_and_returns_responses(self):
+        self.assertIsNone(self.cache.get('abc', 'datatables/ZACKS/FC'))
+        self.cache.set('abc', 'datatables/ZACKS/FC', {'datatable': {'data': [[1]]}})
+        self.assertEqual(self.cache.get('abc', 'datatables/ZACKS/FC'),
+                         {'datatable': {'data': [[1]]}})
+        self.assertEqual(ResponseCache.stats(), {'hits': 1, 'misses': 1, 'expired': 0,
+                                                 'stores': 1, 'evictions': 0,
+                                                 'revalidations': 0})
+        self.assertEqual([name for name in os.listdir(os.path.join(self.cache_dir, 'ab'))],
+                         ['abc.json'])
+
+    def test_entries_expire_after_the_ttl_of_their_endpoint(self):
+        self.cache.set('abc', 'datatables/ZACKS/FC', {})
+        self.cache.set('def', 'datatables/ZACKS/FC/metadata', {})
+        with patch('nasdaqdatalink.utils.response_cache.time.time',
+                   return_value=time.time() + 120):
+            self.assertIsNone(self.cache.get('abc', 'datatables/ZACKS/FC'))
+            self.assertEqual(self.cache.get('def', 'datatables/ZACKS/FC/metadata'), {})
+        self.assertEqual(ResponseCache.stats()['expired'], 1)
+        self.assertFalse(os.path.exists(os.path.join(self.cache_dir, 'ab', 'abc.json')))
+
+    def test_expired_entries_with_validators_are_kept_for_revalidation(self):
+        self.cache.set('abc', 'datatables/ZACKS/FC', {'datatable': {}},
+                       {'ETag': '"v1"', 'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT',
+                        'Content-Type': 'application/json'})
+        with patch('nasdaqdatalink.utils.response_cache.time.time',
+                   return_value=time.time() + 120):
+            body, entry = self.cache.lookup('abc', 'datatables/ZACKS/FC')
+            self.assertIsNone(body)
+            self.assertEqual(self.cache.conditional_headers(entry),
+                             {'If-None-Match': '"v1"',
+                              'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+            self.assertEqual(self.cache.revalidated('abc', 'datatables/ZACKS/FC', entry),
+                             {'datatable': {}})
+            self.assertEqual(self.cache.get('abc', 'datatables/ZACKS/FC'), {'datatable': {}})
+        self.assertEqual(ResponseCache.stats()['revalidations'], 1)
+
+    def test_least_recently_used_entries_are_evicted_over_the_size_cap(self):
+        self.cache.set('aa1', 'datasets', {'data': 'x' * 100})
+        entry_size = self.cache.size()
+        # room for two entries, whose sizes vary by a few bytes
+        self.cache.max_size = entry_size * 2 + entry_size // 2
+        self.cache.set('aa2', 'datasets', {'data': 'x' * 100})
+        # make aa1 the most recently used entry
+        os.utime(os.path.join(self.cache_dir, 'aa', 'aa2.json'), (1, 1))
+        self.cache.get('aa1', 'datasets')
+        self.cache.set('aa3', 'datasets', {'data': 'x' * 100})
+
+        self.assertIsNotNone(self.cache.get('aa1', 'datasets'))
+        self.assertIsNone(self.cache.get('aa2', 'datasets'))
+        self.assertIsNotNone(self.cache.get('aa3', 'datasets'))
+        self.assertEqual(ResponseCache.stats()['evictions'], 1)
+
+    def test_the_directory_is_only_scanned_when_the_size_cap_may_be_reached(self):
+        self.cache.set('aa0', 'datasets', {'data': 'x' * 100})
+        entry_size = self.cache.size()
+        self.cache.max_size = entry_size * 10 + entry_size // 2
+        with patch.object(ResponseCache, '_entries', wraps=self.cache._entries) as scans:
+            for index in range(1, 10):
+                self.cache.set('aa%d' % index, 'datasets', {'data': 'x' * 100})
+            # the first store scans, the next ones keep a running total
+            self.assertEqual(scans.call_count, 1)
+            self.cache.set('aa10', 'datasets', {'data': 'x' * 100})
+            self.assertEqual(scans.call_count, 2)
+        self.assertEqual(ResponseCache.stats()['evictions'], 1)
+
+    def test_unreadable_entries_are_treated_as_misses(self):
+        os.makedirs(os.path.join(self.cache_dir, 'ab'))
+        with open(os.path.join(self.cache_dir, 'ab', 'abc.json'), 'w') as f:
+            f.write('{"stored_at": 1')
+        self.assertIsNone(self.cache.get('abc', 'datasets'))
+        self.assertEqual(self.cache.size(), 0)
+
+    def test_clear_removes_every_entry(self):
+        self.cache.set('abc', 'datasets', {})
+        self.cache.set('def', 'datasets', {})
+        self.cache.clear()
+        self.assertEqual(self.cache.size(), 0)
+
+
+class ConnectionResponseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        ResponseCache.reset_stats()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    @patch('nasdaqdatalink.connection.Connection.request')
+    def test_request_json_is_served_from_the_cache_when_enabled(self, mock):
+        mock.return_value = Mock(**{'json.return_value': {'dataset': {'id': 1}}})
+        with patch.multiple(ApiConfig, use_cache=True, cache_dir=self.cache_dir):
+            first = Connection.request_json('get', 'datasets/WIKI/AAPL/metadata',
+                                            params={'id': 'WIKI/AAPL'})
+            first['dataset']['id'] = 2
+            second = Connection.request_json('get', 'datasets/WIKI/AAPL/metadata',
+                                             params={'id': 'WIKI/AAPL'})
+        self.assertEqual(mock.call_count, 1)
+        # every caller gets its own copy of the response
+        self.assertEqual(second, {'dataset': {'id': 1}})
+
+    @patch('nasdaqdatalink.connection.Connection.request')
+    def test_request_json_does_not_cache_by_default(self, mock):
+        mock.return_value = Mock(**{'json.return_value': {}})
+        with patch.object(ApiConfig, 'cache_dir', self.cache_dir):
+            Connection.request_json('get', 'datasets/WIKI/AAPL/metadata')
+            Connection.request_json('get', 'datasets/WIKI/AAPL/metadata')
+        self.assertEqual(mock.call_count, 2)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_expired_responses_are_revalidated_with_conditional_requests(self):
+        httpretty.enable()
+        self.addCleanup(httpretty.reset)
+        self.addCleanup(httpretty.disable)
+        httpretty.register_uri(httpretty.GET,
+                               'https://data.nasdaq.com/api/v3/datasets/WIKI/AAPL/metadata',
+                               responses=[httpretty.Response(
+                                   body=json.dumps({'dataset': {'id': 1}}),
+                                   adding_headers={'ETag': '"v1"'}),
+                                   httpretty.Response(body='', status=304)])
+
+        with patch.multiple(ApiConfig, use_cache=True, cache_dir=self.cache_dir, cache_ttl=0,
+                            cache_endpoint_ttls={}):
+            first = Connection.request_json('get', 'datasets/WIKI/AAPL/metadata')
+            second = Connection.request_json('get', 'datasets/WIKI/AAPL/metadata')
+
+        self.assertEqual(first, second)
+        self.assertEqual(httpretty.last_request().headers['If-None-Match'], '"v1"')
+        self.assertEqual(ResponseCache.stats()['revalidations'], 1)
@@ -0,0 +1,173 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+import pandas as pd
+from mock import patch, call, AsyncMock
+
+import nasdaqdatalink
+import nasdaqdatalink.aio
+from nasdaqdatalink.aio.connection import AsyncConnection
+from nasdaqdatalink.api_config import ApiConfig
+from nasdaqdatalink.utils.table_mirror import TableMirror
+
+COLUMNS = [{'name': 'ticker', 'type': 'String'},
+           {'name': 'date', 'type': 'Date'},
+           {'name': 'value', 'type': 'double'},
+           {'name': 'lastupdated', 'type': 'datetime'}]
+
+
+def datatable_response(rows, next_cursor_id=None):
+    return {'datatable': {'data': [list(row) for row in rows], 'columns': list(COLUMNS)},
+            'meta': {'next_cursor_id': next_cursor_id}}
+
+
+def request_json(*responses):
+    # one response per page request, the metadata request answers with the primary key
+    pages = list(responses)
+
+    def respond(http_verb, path, **options):
+        if path.endswith('/metadata'):
+            return {'datatable': {'primary_key': ['ticker', 'date']}}
+        return pages.pop(0)
+    return respond
+
+
+class TableMirrorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.mirror_dir = tempfile.mkdtemp()
+        patcher = patch.object(ApiConfig, 'mirror_dir', self.mirror_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.mirror_dir, ignore_errors=True)
+
+    @patch('nasdaqdatalink.connection.Connection.request_json')
+    def create_mirror(self, mock, **options):
+        mock.side_effect = request_json(
+            datatable_response([['AAPL', '2015-07-09', 1.0, '2015-07-10T01:00:00Z'],
+                                ['MSFT', '2015-07-09', 2.0, '2015-07-10T01:00:00Z']],
+                               next_cursor_id='abc'),
+            datatable_response([['AAPL', '2015-07-10', 3.0, '2015-07-11T01:00:00Z']]))
+        return nasdaqdatalink.mirror_table('ZACKS/FC', update_column='lastupdated',
+                                           partition_by='ticker', **options)
+
+    def test_mirror_table_stores_every_page_partitioned(self):
+        mirror = self.create_mirror()
+        self.assertEqual(sorted(os.listdir(os.path.join(self.mirror_dir, 'ZACKS', 'FC',
+                                                        'data'))),
+                         ['ticker=AAPL', 'ticker=MSFT'])
+        self.assertEqual(mirror.state['key_columns'], ['ticker', 'date'])
+        self.assertEqual(mirror.state['last_update'], '2015-07-11T01:00:00')
+        self.assertEqual(TableMirror.open('ZACKS/FC').query({})['value'].to_pylist(),
+                         [1.0, 3.0, 2.0])
+
+    @patch('nasdaqdatalink.connection.Connection.request_json')
+    def test_sync_only_requests_rows_updated_since_the_last_sync(self, mock):
+        self.create_mirror()
+        msft_files = os.listdir(os.path.join(self.mirror_dir, 'ZACKS', 'FC', 'data',
+                                             'ticker=MSFT'))
+        mock.side_effect = request_json(datatable_response(
+            [['AAPL', '2015-07-10', 3.5, '2015-07-12T01:00:00Z'],
+             ['AAPL', '2015-07-13', 4.0, '2015-07-13T01:00:00Z']]))
+
+        mirror = nasdaqdatalink.sync_table('ZACKS/FC')
+
+        self.assertEqual(mock.call_args[1]['params'], {'lastupdated.gte': '2015-07-11T01:00:00'})
+        self.assertEqual(mirror.state['last_update'], '2015-07-13T01:00:00')
+        table = mirror.query({'ticker': 'AAPL'})
+        self.assertEqual(table['value'].to_pylist(), [1.0, 3.5, 4.0])
+        # partitions without changed rows are left as they were
+        self.assertEqual(os.listdir(os.path.join(self.mirror_dir, 'ZACKS', 'FC', 'data',
+                                                 'ticker=MSFT')), msft_files)
+
+    @patch('nasdaqdatalink.connection.Connection.request_json')
+    def test_sync_without_update_column_rebuilds_the_mirror(self, mock):
+        self.create_mirror(key_columns=[])
+        mock.side_effect = request_json(datatable_response(
+            [['AAPL', '2015-07-10', 5.0, '2015-07-12T01:00:00Z']]))
+        mirror = nasdaqdatalink.sync_table('ZACKS/FC')
+        self.assertNotIn('lastupdated.gte', mock.call_args[1]['params'])
+        self.assertEqual(mirror.query({})['value'].to_pylist(), [5.0])
+
+    def test_query_answers_get_table_filters(self):
+        mirror = self.create_mirror()
+        table = mirror.query({'ticker': ['AAPL', 'MSFT'], 'date': {'gte': '2015-07-10'},
+                              'qopts': {'columns': ['ticker', 'value']}})
+        self.assertEqual(table.column_names, ['ticker', 'value'])
+        self.assertEqual(table['value'].to_pylist(), [3.0])
+        self.assertEqual(mirror.query({'date.lt': '2015-07-10',
+                                       'lastupdated.lte': '2015-07-10T01:00:00'}).num_rows, 2)
+
+    def test_query_returns_none_for_filters_it_cannot_answer(self):
+        mirror = self.create_mirror()
+        self.assertIsNone(mirror.query({'exchange': 'NASDAQ'}))
+        self.assertIsNone(mirror.query({'date': {'ne': '2015-07-10'}}))
+        self.assertIsNone(mirror.query({'qopts': {'per_page': 10}}))
+        self.assertIsNone(mirror.query({'qopts.columns': ['missing']}))
+        self.assertIsNone(mirror.query({'date': 'not a date'}))
+
+    @patch('nasdaqdatalink.connection.Connection.request_json')
+    def test_get_table_reads_a_fresh_mirror(self, mock):
+        self.create_mirror()
+        df = nasdaqdatalink.get_table('ZACKS/FC', ticker='AAPL', downcast=True, paginate=True)
+        self.assertFalse(mock.called)
+        self.assertEqual(df['value'].tolist(), [1.0, 3.0])
+        self.assertEqual(df['value'].dtype, 'float32')
+        self.assertEqual(df['date'].tolist(), [pd.Timestamp('2015-07-09'),
+                                               pd.Timestamp('2015-07-10')])
+        self.assertEqual(nasdaqdatalink.get_table('ZACKS/FC', returns='arrow',
+                                                  paginate=True).num_rows, 3)
+
+    @patch('nasdaqdatalink.connection.Connection.request_json')
+    def test_get_table_requests_the_api_when_the_mirror_is_stale_or_disabled(self, mock):
+        self.create_mirror()
+        mock.side_effect = lambda *args, **options: datatable_response([])
+        with patch('nasdaqdatalink.utils.table_mirror.time.time',
+                   return_value=time.time() + ApiConfig.mirror_max_age + 1):
+            nasdaqdatalink.get_table('ZACKS/FC', ticker='AAPL', paginate=True)
+        nasdaqdatalink.get_table('ZACKS/FC', ticker='AAPL', paginate=True, mirror=False)
+        self.assertEqual(mock.call_count, 2)
+
+    @patch('nasdaqdatalink.connection.Connection.request_json')
+    def test_get_table_requests_the_api_for_a_single_page(self, mock):
+        self.create_mirror()
+        mock.side_effect = lambda *args, **options: datatable_response([])
+        nasdaqdatalink.get_table('ZACKS/FC', ticker='AAPL')
+        self.assertEqual(mock.call_count, 1)
+
+    def test_aio_get_table_reads_a_fresh_mirror_off_the_event_loop(self):
+        self.create_mirror()
+        threads = []
+        answer = TableMirror.answer
+
+        def record(*args):
+            threads.append(threading.current_thread())
+            return answer(*args)
+        with patch.object(TableMirror, 'answer', side_effect=record), \
+                patch.object(AsyncConnection, 'request', new_callable=AsyncMock) as request:
+            df = asyncio.run(nasdaqdatalink.aio.get_table('ZACKS/FC', ticker='AAPL',
+                                                          paginate=True))
+            request.return_value = datatable_response([])
+            asyncio.run(nasdaqdatalink.aio.get_table('ZACKS/FC', ticker='AAPL', paginate=True,
+                                                     mirror=False))
+        self.assertEqual(df['value'].tolist(), [1.0, 3.0])
+        self.assertNotIn(threading.main_thread(), threads)
+        self.assertEqual(request.call_args,
+                         call('get', 'datatables/ZACKS/FC', params={'ticker': 'AAPL'}))
+
+    def test_tables_without_a_mirror_directory_are_not_read(self):
+        with patch.object(TableMirror, '_read_state') as read_state:
+            self.assertIsNone(TableMirror.open('ZACKS/FC'))
+        self.assertFalse(read_state.called)
+
+    def test_remove_mirror_unregisters_the_table(self):
+        self.create_mirror()
+        nasdaqdatalink.remove_mirror('ZACKS/FC')
+        self.assertIsNone(TableMirror.open('ZACKS/FC'))